@@ -17,31 +17,206 @@ Proyecto: Data + Automation Engineer Journey - Semana 3
 Versión: 1.0.0
 """
 
-import pandas as pd
 import numpy as np
 from datetime import datetime, timedelta
 import random
 import json
+import os
 from pathlib import Path
+from typing import TYPE_CHECKING, BinaryIO, Union
 import argparse
+from contextlib import nullcontext
+from concurrent.futures import ProcessPoolExecutor
+
+try:
+    import pyarrow as pa
+    import pyarrow.compute as pc
+    import pyarrow.csv as pacsv
+except ImportError:  # pyarrow is optional; pandas is used as fallback
+    pa = None
+    pc = None
+    pacsv = None
+
+# pandas is imported inside the generators that need it, so writers that only
+# use NumPy (e.g. corrupted data) don't pay its import cost
+if TYPE_CHECKING:
+    import pandas as pd
+
+
+def _needs_pandas_format(table: "pa.Table", sep: str) -> bool:
+    """
+    Check whether Arrow would write a table differently from DataFrame.to_csv
+
+    That happens when a field or column name needs quoting (pandas quotes only
+    those, Arrow either all strings or none) and for floats that Python prints
+    in scientific notation, since Arrow uses different exponent thresholds.
+
+    Args:
+        table: Table to write
+        sep: Field delimiter
+
+    Returns:
+        True if the table has to be written with pandas
+    """
+    special = (sep, '"', "\n", "\r")
+    if any(char in name for name in table.column_names for char in special):
+        return True
+
+    for column in table.columns:
+        if pa.types.is_string(column.type) or pa.types.is_large_string(column.type):
+            if any(pc.any(pc.match_substring(column, c)).as_py() for c in special):
+                return True
+        elif pa.types.is_floating(column.type):
+            magnitude = pc.abs(column)
+            scientific = pc.or_(
+                pc.and_(pc.less(magnitude, 1e-4), pc.not_equal(magnitude, 0)),
+                pc.greater_equal(magnitude, 1e16),
+            )
+            if pc.any(scientific).as_py():
+                return True
+    return False
+
+
+def _float_as_text(column: "pa.ChunkedArray") -> "pa.ChunkedArray":
+    """Format a float column the way pandas does (4.0, not 4; NaN as empty)"""
+    text = pc.cast(column, pa.string())
+    integral = pc.match_substring_regex(text, r"^-?\d+$")
+    text = pc.if_else(integral, pc.binary_join_element_wise(text, ".0", ""), text)
+    return pc.if_else(pc.is_nan(column), pa.scalar(None, pa.string()), text)
+
+
+def _write_arrow_table(
+    table: "pa.Table", destination: Union[Path, BinaryIO], sep: str, header: bool
+) -> None:
+    """
+    Write an Arrow table to CSV in the same text format as DataFrame.to_csv
+
+    Fields are written unquoted, booleans as True/False and floats as pandas
+    prints them, so the files are identical to the ones written without
+    PyArrow. Tables that would still differ are written by pandas.
+
+    Args:
+        table: Table to write
+        destination: Output file path or file object opened in binary mode
+        sep: Field delimiter
+        header: Whether to write the header row
+    """
+    if _needs_pandas_format(table, sep):
+        table.to_pandas().to_csv(destination, index=False, sep=sep, header=header)
+        return
+
+    columns = []
+    for column in table.columns:
+        if pa.types.is_boolean(column.type):
+            column = pc.if_else(column, "True", "False")
+        elif pa.types.is_floating(column.type):
+            column = _float_as_text(column)
+        columns.append(column)
+    table = pa.table(columns, names=table.column_names)
+
+    # Arrow always quotes the header, so it is written here
+    if isinstance(destination, (str, os.PathLike)):
+        handle = open(destination, "wb")
+    else:
+        handle = nullcontext(destination)
+    with handle as f:
+        if header:
+            f.write((sep.join(table.column_names) + "\n").encode("utf-8"))
+        pacsv.write_csv(
+            table,
+            f,
+            write_options=pacsv.WriteOptions(
+                include_header=False, delimiter=sep, quoting_style="none"
+            ),
+        )
+
+
+def _write_csv(
+    df: "pd.DataFrame",
+    destination: Union[Path, BinaryIO],
+    sep: str = ",",
+    header: bool = True,
+) -> None:
+    """
+    Write a DataFrame to CSV, using PyArrow's multithreaded writer when available
+
+    Args:
+        df: DataFrame to write
+        destination: Output file path or file object opened in binary mode
+        sep: Field delimiter
+        header: Whether to write the header row
+    """
+    if pacsv is None:
+        df.to_csv(destination, index=False, sep=sep, header=header, chunksize=50_000)
+        return
+
+    table = pa.Table.from_pandas(df, preserve_index=False)
+    _write_arrow_table(table, destination, sep, header)
+
+
+def _write_columns(
+    data: dict,
+    destination: Union[Path, BinaryIO],
+    sep: str = ",",
+    header: bool = True,
+) -> None:
+    """
+    Write a dict of columns to CSV without building a pandas DataFrame
+
+    With PyArrow available the columns go straight into an Arrow table, which
+    stores strings as contiguous buffers instead of one Python object per cell.
+
+    Args:
+        data: Mapping of column name to column values
+        destination: Output file path or file object opened in binary mode
+        sep: Field delimiter
+        header: Whether to write the header row
+    """
+    if pacsv is None:
+        import pandas as pd
+
+        _write_csv(pd.DataFrame(data), destination, sep=sep, header=header)
+        return
+
+    _write_arrow_table(pa.table(data), destination, sep, header)
+
+
+def _run_generator(output_dir: str, seed: int, method: str, *args) -> Union[Path, list]:
+    """
+    Run a single generator method in a worker process
+
+    Args:
+        output_dir: Directory to save sample files
+        seed: Random seed for the worker's generator
+        method: Name of the SampleDataGenerator method to call
+        *args: Positional arguments forwarded to the method
+
+    Returns:
+        Path (or list of paths) returned by the method
+    """
+    generator = SampleDataGenerator(output_dir, seed=seed)
+    return getattr(generator, method)(*args)
 
 
 class SampleDataGenerator:
     """Genera archivos CSV de muestra para probar el sistema de procesamiento CSV"""
 
-    def __init__(self, output_dir: str = "data/samples"):
+    def __init__(self, output_dir: str = "data/samples", seed: int = 42):
         """
         Inicializa el generador de datos de muestra
 
         Args:
             output_dir: Directory to save sample files
+            seed: Random seed for reproducibility
         """
         self.output_dir = Path(output_dir)
         self.output_dir.mkdir(parents=True, exist_ok=True)
+        self.seed = seed
 
         # Set random seeds for reproducibility
-        np.random.seed(42)
-        random.seed(42)
+        np.random.seed(seed)
+        random.seed(seed)
+        self.rng = np.random.default_rng(seed)
 
         self.departments = [
             "Engineering",
@@ -120,6 +295,27 @@ class SampleDataGenerator:
             "firm.co",
         ]
 
+        # Lowercase name pools used to build email addresses
+        self.first_names_lower = [name.lower() for name in self.first_names]
+        self.last_names_lower = [name.lower() for name in self.last_names]
+
+    def _sample_categorical(self, values: list, size: int) -> "pd.Categorical":
+        """
+        Sample a low-cardinality string column as a Categorical
+
+        Each row stores a small integer code instead of a Python string object.
+
+        Args:
+            values: Allowed values (used as the categories)
+            size: Number of values to sample
+
+        Returns:
+            Categorical with the sampled values
+        """
+        import pandas as pd
+
+        return pd.Categorical(self.rng.choice(values, size), categories=values)
+
     def generate_clean_data(
         self, rows: int = 1000, filename: str = "clean_data.csv"
     ) -> Path:
@@ -133,30 +329,28 @@ class SampleDataGenerator:
         Returns:
             Path to generated file
         """
+        now = datetime.now()
         data = {
             "employee_id": range(1, rows + 1),
             "first_name": [random.choice(self.first_names) for _ in range(rows)],
             "last_name": [random.choice(self.last_names) for _ in range(rows)],
             "email": [
-                f"{random.choice(self.first_names).lower()}.{random.choice(self.last_names).lower()}@{random.choice(self.domains)}"
+                f"{random.choice(self.first_names_lower)}.{random.choice(self.last_names_lower)}@{random.choice(self.domains)}"
                 for _ in range(rows)
             ],
             "age": np.random.randint(22, 65, rows),
             "salary": np.random.normal(65000, 20000, rows).round(2),
-            "department": [random.choice(self.departments) for _ in range(rows)],
+            "department": self._sample_categorical(self.departments, rows),
             "hire_date": [
-                (datetime.now() - timedelta(days=random.randint(30, 3650))).strftime(
-                    "%Y-%m-%d"
-                )
+                (now - timedelta(days=random.randint(30, 3650))).strftime("%Y-%m-%d")
                 for _ in range(rows)
             ],
             "active": np.random.choice([True, False], rows, p=[0.85, 0.15]),
             "performance_score": np.random.uniform(1.0, 5.0, rows).round(1),
         }
 
-        df = pd.DataFrame(data)
         file_path = self.output_dir / filename
-        df.to_csv(file_path, index=False)
+        _write_columns(data, file_path)
 
         print(f"Generated clean data: {file_path} ({rows} rows)")
         return file_path
@@ -174,22 +368,23 @@ class SampleDataGenerator:
         Returns:
             Path to generated file
         """
+        import pandas as pd
+
         # Start with clean data
+        now = datetime.now()
         data = {
-            "ID": list(range(1, rows + 1)),
+            "ID": np.arange(1, rows + 1),
             " First Name ": [random.choice(self.first_names) for _ in range(rows)],
             "Last-Name!": [random.choice(self.last_names) for _ in range(rows)],
             "EMAIL_ADDRESS": [
-                f"{random.choice(self.first_names).lower()}.{random.choice(self.last_names).lower()}@{random.choice(self.domains)}"
+                f"{random.choice(self.first_names_lower)}.{random.choice(self.last_names_lower)}@{random.choice(self.domains)}"
                 for _ in range(rows)
             ],
             "Age (Years)": np.random.randint(22, 65, rows),
             "Annual Salary $": np.random.normal(65000, 20000, rows).round(2),
-            "Dept.": [random.choice(self.departments) for _ in range(rows)],
+            "Dept.": self._sample_categorical(self.departments, rows),
             "Start Date": [
-                (datetime.now() - timedelta(days=random.randint(30, 3650))).strftime(
-                    "%Y-%m-%d"
-                )
+                (now - timedelta(days=random.randint(30, 3650))).strftime("%Y-%m-%d")
                 for _ in range(rows)
             ],
             "Is Active?": np.random.choice(
@@ -217,11 +412,13 @@ class SampleDataGenerator:
             range(rows // 2, rows), size=duplicate_count, replace=False
         )
 
-        for src, tgt in zip(duplicate_source_indices, duplicate_target_indices):
-            data["ID"][tgt] = data["ID"][src]
-            data[" First Name "][tgt] = data[" First Name "][src]
-            data["Last-Name!"][tgt] = data["Last-Name!"][src]
-            data["EMAIL_ADDRESS"][tgt] = data["EMAIL_ADDRESS"][src]
+        # Copy source rows over target rows with one gather/scatter per column
+        for column in (" First Name ", "Last-Name!", "EMAIL_ADDRESS"):
+            data[column] = np.asarray(data[column], dtype=object)
+        for column in ("ID", " First Name ", "Last-Name!", "EMAIL_ADDRESS"):
+            data[column][duplicate_target_indices] = np.take(
+                data[column], duplicate_source_indices
+            )
 
         # Introduce invalid emails (3% of data)
         invalid_email_indices = np.random.choice(
@@ -231,16 +428,18 @@ class SampleDataGenerator:
             if data["EMAIL_ADDRESS"][idx] is not None:
                 data["EMAIL_ADDRESS"][idx] = "invalid.email"
 
-        # Add extra whitespace and special characters
-        for i in range(rows):
-            if random.random() < 0.1:
-                data[" First Name "][i] = f"  {data[' First Name '][i]}  "
-            if random.random() < 0.1:
-                data["Last-Name!"][i] = f"{data['Last-Name!'][i]}\t"
+        # Add extra whitespace and special characters (object arrays concatenate
+        # element-wise, so each mask is applied in a single array operation)
+        padded_names = self.rng.random(rows) < 0.1
+        tabbed_names = self.rng.random(rows) < 0.1
+        first_names = data[" First Name "]
+        last_names = data["Last-Name!"]
+        first_names[padded_names] = "  " + first_names[padded_names] + "  "
+        last_names[tabbed_names] = last_names[tabbed_names] + "\t"
 
         df = pd.DataFrame(data)
         file_path = self.output_dir / filename
-        df.to_csv(file_path, index=False)
+        df.to_csv(file_path, index=False, chunksize=50_000)
 
         print(f"Generated messy data: {file_path} ({rows} rows)")
         return file_path
@@ -258,48 +457,58 @@ class SampleDataGenerator:
         Returns:
             Path to generated file
         """
+        import pandas as pd
+
         print(f"Generating large dataset with {rows} rows...")
 
-        # Generate in chunks to manage memory
-        chunk_size = 10000
-        chunks = []
-
-        for chunk_start in range(0, rows, chunk_size):
-            chunk_end = min(chunk_start + chunk_size, rows)
-            chunk_rows = chunk_end - chunk_start
-
-            chunk_data = {
-                "transaction_id": range(chunk_start + 1, chunk_end + 1),
-                "customer_id": np.random.randint(1, rows // 10, chunk_rows),
-                "product_code": [
-                    f"PROD_{random.randint(1000, 9999)}" for _ in range(chunk_rows)
-                ],
-                "quantity": np.random.randint(1, 20, chunk_rows),
-                "unit_price": np.random.uniform(10.0, 500.0, chunk_rows).round(2),
-                "discount": np.random.uniform(0.0, 0.3, chunk_rows).round(3),
-                "total_amount": np.random.uniform(10.0, 2000.0, chunk_rows).round(2),
-                "transaction_date": [
-                    (datetime.now() - timedelta(days=random.randint(1, 365))).strftime(
-                        "%Y-%m-%d %H:%M:%S"
-                    )
-                    for _ in range(chunk_rows)
-                ],
-                "customer_segment": np.random.choice(
-                    ["Premium", "Standard", "Basic"], chunk_rows
-                ),
-                "region": np.random.choice(
-                    ["North", "South", "East", "West", "Central"], chunk_rows
-                ),
-            }
+        # Generate in chunks and stream each one to disk to bound memory.
+        # Datasets up to chunk_size rows are built in one shot; larger ones are
+        # split into roughly one chunk per CPU core.
+        chunk_size = max(50_000, rows // (os.cpu_count() or 1))
+        now = np.datetime64(datetime.now(), "s")
+        file_path = self.output_dir / filename
 
-            chunks.append(pd.DataFrame(chunk_data))
+        with open(file_path, "wb") as f:
+            for chunk_index, chunk_start in enumerate(range(0, rows, chunk_size)):
+                chunk_end = min(chunk_start + chunk_size, rows)
+                chunk_rows = chunk_end - chunk_start
 
-            if len(chunks) % 5 == 0:  # Progress indicator
-                print(f"  Generated {chunk_end} / {rows} rows...")
+                # Random offsets (in seconds) within the last year, vectorized
+                date_offsets = self.rng.integers(
+                    1, 365 * 86400, size=chunk_rows, dtype=np.int64
+                )
 
-        df = pd.concat(chunks, ignore_index=True)
-        file_path = self.output_dir / filename
-        df.to_csv(file_path, index=False)
+                # Each column is a single typed array built in one shot
+                chunk_data = {
+                    "transaction_id": np.arange(
+                        chunk_start + 1, chunk_end + 1, dtype=np.int64
+                    ),
+                    "customer_id": self.rng.integers(1, max(2, rows // 10), chunk_rows),
+                    "product_code": np.char.add(
+                        "PROD_", self.rng.integers(1000, 10000, chunk_rows).astype(str)
+                    ),
+                    "quantity": self.rng.integers(1, 20, chunk_rows),
+                    "unit_price": self.rng.uniform(10.0, 500.0, chunk_rows).round(2),
+                    "discount": self.rng.uniform(0.0, 0.3, chunk_rows).round(3),
+                    "total_amount": self.rng.uniform(10.0, 2000.0, chunk_rows).round(2),
+                    "transaction_date": np.asarray(
+                        pd.DatetimeIndex(
+                            now - date_offsets.astype("timedelta64[s]")
+                        ).strftime("%Y-%m-%d %H:%M:%S")
+                    ),
+                    "customer_segment": self._sample_categorical(
+                        ["Premium", "Standard", "Basic"], chunk_rows
+                    ),
+                    "region": self._sample_categorical(
+                        ["North", "South", "East", "West", "Central"], chunk_rows
+                    ),
+                }
+
+                _write_columns(chunk_data, f, header=chunk_index == 0)
+                del chunk_data
+
+                if rows > chunk_size:  # Progress indicator
+                    print(f"  Generated {chunk_end} / {rows} rows...")
 
         print(f"Generated large dataset: {file_path} ({rows} rows)")
         return file_path
@@ -317,48 +526,51 @@ class SampleDataGenerator:
         Returns:
             Path to generated file
         """
+        import pandas as pd
+
+        ids = np.arange(1, rows + 1).astype(str)
+        today = np.datetime64(datetime.now().date(), "D")
+        day_offsets = self.rng.integers(1, 1001, rows).astype("timedelta64[D]")
+
+        # Build every candidate format up front and pick one per row
+        mixed_formats = [
+            self.rng.integers(1, 1001, rows).astype(str),
+            np.char.mod("%.2f", self.rng.uniform(1.0, 1000.0, rows)),
+            np.char.add(self.rng.integers(1, 101, rows).astype(str), "%"),
+            np.char.add("$", self.rng.integers(100, 1001, rows).astype(str)),
+        ]
+        mixed_numeric = np.choose(
+            self.rng.integers(0, len(mixed_formats), rows),
+            np.array(mixed_formats, dtype=object),
+        )
+
         data = {
-            "id_as_string": [str(i) for i in range(1, rows + 1)],
-            "numeric_as_string": [
-                str(random.uniform(10.0, 100.0)) for _ in range(rows)
-            ],
-            "boolean_as_string": [
-                random.choice(["true", "false", "TRUE", "FALSE", "1", "0"])
-                for _ in range(rows)
-            ],
-            "date_as_string": [
-                (datetime.now() - timedelta(days=random.randint(1, 1000))).strftime(
-                    "%Y-%m-%d"
-                )
-                for _ in range(rows)
-            ],
-            "percentage_as_string": [f"{random.randint(1, 100)}%" for _ in range(rows)],
-            "currency_as_string": [
-                f"${random.randint(1000, 10000)}" for _ in range(rows)
-            ],
-            "mixed_numeric": [
-                random.choice(
-                    [
-                        str(random.randint(1, 1000)),
-                        f"{random.uniform(1.0, 1000.0):.2f}",
-                        f"{random.randint(1, 100)}%",
-                        f"${random.randint(100, 1000)}",
-                    ]
-                )
-                for _ in range(rows)
-            ],
-            "categorical_data": [
-                random.choice(["A", "B", "C", "D", "E"]) for _ in range(rows)
-            ],
-            "free_text": [
-                f"This is sample text entry {i} with some description"
-                for i in range(1, rows + 1)
-            ],
+            "id_as_string": ids,
+            "numeric_as_string": self.rng.uniform(10.0, 100.0, rows).astype(str),
+            "boolean_as_string": self.rng.choice(
+                np.array(["true", "false", "TRUE", "FALSE", "1", "0"], dtype=object),
+                rows,
+            ),
+            "date_as_string": (today - day_offsets).astype(str),
+            "percentage_as_string": np.char.add(
+                self.rng.integers(1, 101, rows).astype(str), "%"
+            ),
+            "currency_as_string": np.char.add(
+                "$", self.rng.integers(1000, 10001, rows).astype(str)
+            ),
+            "mixed_numeric": mixed_numeric,
+            "categorical_data": self._sample_categorical(
+                ["A", "B", "C", "D", "E"], rows
+            ),
+            "free_text": np.char.add(
+                np.char.add("This is sample text entry ", ids),
+                " with some description",
+            ),
         }
 
         df = pd.DataFrame(data)
         file_path = self.output_dir / filename
-        df.to_csv(file_path, index=False)
+        df.to_csv(file_path, index=False, chunksize=50_000)
 
         print(f"Generated mixed types data: {file_path} ({rows} rows)")
         return file_path
@@ -378,38 +590,50 @@ class SampleDataGenerator:
         """
         file_path = self.output_dir / filename
 
-        with open(file_path, "w", encoding="utf-8") as f:
-            # Write header
-            f.write("id,name,email,age,salary,department\n")
-
-            for i in range(1, rows + 1):
-                if i % 50 == 0:
-                    # Missing comma (wrong number of fields)
-                    f.write(f"{i},User{i} invalid_email@domain,25,50000,Engineering\n")
-                elif i % 37 == 0:
-                    # Extra comma (too many fields)
-                    f.write(
-                        f"{i},User{i},user{i}@test.com,25,50000,Engineering,Extra Field\n"
-                    )
-                elif i % 29 == 0:
-                    # Unescaped quotes
-                    f.write(
-                        f'{i},"User{i} "Special Name",user{i}@test.com,25,50000,Engineering\n'
-                    )
-                elif i % 23 == 0:
-                    # Invalid characters
-                    f.write(f"{i},User{i}™,user{i}@test.com,25,50000,Engineering\n")
-                elif i % 19 == 0:
-                    # Completely malformed line
-                    f.write("This is not a valid CSV line at all!\n")
-                else:
-                    # Normal line
-                    name = random.choice(self.first_names)
-                    email = f"{name.lower()}{i}@test.com"
-                    age = random.randint(22, 65)
-                    salary = random.randint(40000, 100000)
-                    dept = random.choice(self.departments)
-                    f.write(f"{i},{name},{email},{age},{salary},{dept}\n")
+        # Draw the random fields for all rows up front instead of per line
+        names = self.rng.choice(self.first_names, rows)
+        ages = self.rng.integers(22, 66, rows)
+        salaries = self.rng.integers(40000, 100001, rows)
+        depts = self.rng.choice(self.departments, rows)
+
+        # Header
+        lines = ["id,name,email,age,salary,department"]
+
+        for i, name, age, salary, dept in zip(
+            range(1, rows + 1), names, ages, salaries, depts
+        ):
+            if i % 50 == 0:
+                # Missing comma (wrong number of fields)
+                lines.append(f"{i},User{i} invalid_email@domain,25,50000,Engineering")
+            elif i % 37 == 0:
+                # Extra comma (too many fields)
+                lines.append(
+                    f"{i},User{i},user{i}@test.com,25,50000,Engineering,Extra Field"
+                )
+            elif i % 29 == 0:
+                # Unescaped quotes
+                lines.append(
+                    f'{i},"User{i} "Special Name",user{i}@test.com,25,50000,Engineering'
+                )
+            elif i % 23 == 0:
+                # Invalid characters
+                lines.append(f"{i},User{i}™,user{i}@test.com,25,50000,Engineering")
+            elif i % 19 == 0:
+                # Completely malformed line
+                lines.append("This is not a valid CSV line at all!")
+            else:
+                # Normal line
+                email = f"{name.lower()}{i}@test.com"
+                lines.append(f"{i},{name},{email},{age},{salary},{dept}")
+
+        # Encode once and hand the whole buffer to the OS in a single write
+        buffer = memoryview(("\n".join(lines) + "\n").encode("utf-8"))
+        fd = os.open(str(file_path), os.O_WRONLY | os.O_CREAT | os.O_TRUNC, 0o644)
+        try:
+            while buffer:
+                buffer = buffer[os.write(fd, buffer) :]
+        finally:
+            os.close(fd)
 
         print(f"Generated corrupted data: {file_path} ({rows} rows)")
         return file_path
@@ -424,6 +648,8 @@ class SampleDataGenerator:
         Returns:
             List of generated file paths
         """
+        import pandas as pd
+
         files = []
         delimiters = {
             "semicolon_data.csv": ";",
@@ -431,20 +657,24 @@ class SampleDataGenerator:
             "pipe_data.csv": "|",
         }
 
-        base_data = {
-            "id": range(1, rows + 1),
-            "name": [
-                f"{random.choice(self.first_names)} {random.choice(self.last_names)}"
-                for _ in range(rows)
-            ],
-            "email": [f"user{i}@test.com" for i in range(1, rows + 1)],
-            "value": np.random.uniform(10.0, 1000.0, rows).round(2),
-        }
+        full_names = np.char.add(
+            np.char.add(self.rng.choice(self.first_names, rows), " "),
+            self.rng.choice(self.last_names, rows),
+        )
+
+        # The same frame is written once per delimiter
+        df = pd.DataFrame(
+            {
+                "id": range(1, rows + 1),
+                "name": full_names.astype(object),
+                "email": [f"user{i}@test.com" for i in range(1, rows + 1)],
+                "value": np.random.uniform(10.0, 1000.0, rows).round(2),
+            }
+        )
 
         for filename, delimiter in delimiters.items():
-            df = pd.DataFrame(base_data)
             file_path = self.output_dir / filename
-            df.to_csv(file_path, index=False, sep=delimiter)
+            _write_csv(df, file_path, sep=delimiter)
             files.append(file_path)
             print(f"Generated {delimiter}-delimited data: {file_path}")
 
@@ -460,6 +690,8 @@ class SampleDataGenerator:
         Returns:
             List of generated file paths
         """
+        import pandas as pd
+
         files = []
 
         # Data with international characters
@@ -499,7 +731,7 @@ class SampleDataGenerator:
         for filename, encoding in encodings.items():
             file_path = self.output_dir / filename
             try:
-                df.to_csv(file_path, index=False, encoding=encoding)
+                df.to_csv(file_path, index=False, encoding=encoding, chunksize=50_000)
                 files.append(file_path)
                 print(f"Generated {encoding} encoded data: {file_path}")
             except UnicodeEncodeError:
@@ -507,40 +739,44 @@ class SampleDataGenerator:
 
         return files
 
-    def generate_all_samples(self):
-        """Generate all sample datasets"""
-        print("=== Generating Sample CSV Files ===")
-
-        generated_files = []
-
-        # Clean data
-        generated_files.append(self.generate_clean_data(1000, "01_clean_employees.csv"))
-
-        # Messy data
-        generated_files.append(self.generate_messy_data(800, "02_messy_employees.csv"))
+    def generate_all_samples(self, large_size: int = 10000):
+        """
+        Generate all sample datasets
 
-        # Mixed types
-        generated_files.append(
-            self.generate_mixed_types_data(500, "03_mixed_types.csv")
-        )
+        The generators are independent and write to distinct files, so they
+        run in parallel worker processes, each with its own derived seed.
 
-        # Large dataset
-        generated_files.append(
-            self.generate_large_dataset(10000, "04_large_transactions.csv")
-        )
-
-        # Corrupted data
-        generated_files.append(
-            self.generate_corrupted_data(200, "05_corrupted_data.csv")
-        )
+        Args:
+            large_size: Number of rows for the large dataset
+        """
+        print("=== Generating Sample CSV Files ===")
 
-        # Different delimiters
-        delimiter_files = self.generate_different_delimiters(300)
-        generated_files.extend(delimiter_files)
+        tasks = [
+            ("generate_clean_data", 1000, "01_clean_employees.csv"),
+            ("generate_messy_data", 800, "02_messy_employees.csv"),
+            ("generate_mixed_types_data", 500, "03_mixed_types.csv"),
+            ("generate_large_dataset", large_size, "04_large_transactions.csv"),
+            ("generate_corrupted_data", 200, "05_corrupted_data.csv"),
+            ("generate_different_delimiters", 300),
+            ("generate_encoding_variants", 200),
+        ]
 
-        # Different encodings
-        encoding_files = self.generate_encoding_variants(200)
-        generated_files.extend(encoding_files)
+        max_workers = min(len(tasks), os.cpu_count() or 1)
+        with ProcessPoolExecutor(max_workers=max_workers) as executor:
+            futures = [
+                executor.submit(
+                    _run_generator, str(self.output_dir), self.seed + i, *task
+                )
+                for i, task in enumerate(tasks)
+            ]
+
+            generated_files = []
+            for future in futures:
+                result = future.result()
+                if isinstance(result, list):
+                    generated_files.extend(result)
+                else:
+                    generated_files.append(result)
 
         # Create summary
         summary = {
@@ -579,6 +815,11 @@ def main():
     parser.add_argument(
         "--clean-only", action="store_true", help="Generate only clean data"
     )
+    parser.add_argument(
+        "--corrupted-only",
+        action="store_true",
+        help="Generate only corrupted data (does not import pandas)",
+    )
     parser.add_argument(
         "--large-size",
         type=int,
@@ -592,14 +833,10 @@ def main():
 
     if args.clean_only:
         generator.generate_clean_data(1000, "clean_employees.csv")
+    elif args.corrupted_only:
+        generator.generate_corrupted_data(200, "corrupted_data.csv")
     else:
-        # Override large dataset size
-        original_method = generator.generate_large_dataset
-        generator.generate_large_dataset = lambda rows=args.large_size, filename="04_large_transactions.csv": original_method(
-            rows, filename
-        )
-
-        generator.generate_all_samples()
+        generator.generate_all_samples(large_size=args.large_size)
 
 
 if __name__ == "__main__":
@@ -16,48 +16,207 @@ Proyecto: Data + Automation Engineer Journey - Semana 3
 Versión: 1.0.0
 """
 
+import os
 import sys
 import argparse
+import fnmatch
+from concurrent.futures import ProcessPoolExecutor, as_completed
+from dataclasses import is_dataclass, asdict
+from functools import partial
 from pathlib import Path
-from typing import Optional, Dict, Any
+from typing import Optional, Dict, Any, Callable, Iterable, Iterator, List
 import json
 
+import numpy as np
+
+try:
+    import orjson
+except ImportError:  # orjson es opcional; se usa json de la librería estándar
+    orjson = None
+
+try:
+    from tqdm import tqdm
+except ImportError:  # tqdm es opcional; sin él no se muestra barra de progreso
+    tqdm = None
+
 # Add src directory to path for imports
 sys.path.insert(0, str(Path(__file__).parent))
 
 from src.config_manager import ConfigManager
-from src.csv_processor import CSVProcessor
-from src.data_validator import DataValidator
-from src.utils import setup_logging, validate_file_path, timing_context
+from src.csv_processor import NA_VALUES, CSVProcessor, ProcessingStats
+from src.data_validator import ChunkValidationState, DataValidator, ValidationReport
+from src.utils import (
+    setup_logging,
+    validate_file_path,
+    timing_context,
+    iter_csv_chunks,
+    json_default,
+)
+
+
+def _json_default(obj: Any) -> Any:
+    """
+    Convierte a JSON los objetos que json no sabe serializar
+
+    Se invoca solo para los valores no nativos, así que el resto del árbol no
+    se recorre en Python. Los tipos numpy, fechas y rutas se delegan en
+    json_default (el mismo hook que usan los metadatos del procesador); lo
+    que este no soporta se representa como texto.
+
+    Args:
+        obj: Objeto no serializable por json
+
+    Returns:
+        Representación serializable del objeto
+    """
+    if isinstance(obj, (ProcessingStats, ValidationReport)):
+        return asdict(obj)
+    if is_dataclass(obj) and not isinstance(obj, type):
+        return asdict(obj)
+    try:
+        return json_default(obj)
+    except TypeError:
+        return str(obj)
+
+
+def print_json(obj: Any) -> None:
+    """
+    Imprime un objeto como JSON indentado
+
+    La salida se escribe por partes a medida que se produce, sin construir el
+    documento completo en memoria. Con orjson disponible, cada clave de primer
+    nivel se serializa en C (tipos numpy, dataclasses y fechas incluidos); si
+    no, se usa json con _json_default para los valores no nativos.
+
+    Args:
+        obj: Objeto a imprimir
+    """
+    if orjson is None:
+        encoder = json.JSONEncoder(indent=2, ensure_ascii=False, default=_json_default)
+        for chunk in encoder.iterencode(obj):
+            sys.stdout.write(chunk)
+        sys.stdout.write("\n")
+        sys.stdout.flush()
+        return
+
+    options = orjson.OPT_INDENT_2 | orjson.OPT_SERIALIZE_NUMPY | orjson.OPT_NON_STR_KEYS
+    out = sys.stdout.buffer
+    sys.stdout.flush()
+
+    if not isinstance(obj, dict) or not obj:
+        out.write(orjson.dumps(obj, default=_json_default, option=options) + b"\n")
+        out.flush()
+        return
+
+    # Escribir cada clave de primer nivel en cuanto se serializa, re-indentada
+    # un nivel para que el resultado sea idéntico al documento completo
+    separator = b"{\n  "
+    for key, value in obj.items():
+        piece = orjson.dumps(value, default=_json_default, option=options)
+        out.write(separator)
+        out.write(orjson.dumps(str(key)) + b": " + piece.replace(b"\n", b"\n  "))
+        separator = b",\n  "
+    out.write(b"\n}\n")
+    out.flush()
+
+
+def _iter_matching_files(directory: Path, pattern: str) -> Iterator[Path]:
+    """
+    Itera los archivos de un directorio que coinciden con un patrón
+
+    Usa os.scandir para entregar cada archivo en cuanto se lee la entrada del
+    directorio, sin construir antes la lista completa. Los patrones con
+    subdirectorios o "**" se delegan a Path.glob.
+
+    Args:
+        directory: Directorio a recorrer
+        pattern: Patrón de nombres de archivo (p. ej. "*.csv")
+
+    Yields:
+        Rutas de los archivos que coinciden
+    """
+    if "/" in pattern or os.sep in pattern or "**" in pattern:
+        yield from (path for path in directory.glob(pattern) if path.is_file())
+        return
+
+    with os.scandir(directory) as entries:
+        for entry in entries:
+            if entry.is_file() and fnmatch.fnmatch(entry.name, pattern):
+                yield Path(entry.path)
 
 
-def convert_numpy_types(obj):
+def _progress(iterable: Iterable, total: Optional[int] = None) -> Iterable:
     """
-    Convierte tipos numpy a tipos Python nativos para serialización JSON
+    Envuelve un iterable con una barra de progreso de tqdm si está disponible
+
+    La barra se escribe en stderr para no mezclarse con el JSON de --verbose en
+    stdout, y se desactiva sola cuando stderr no es una terminal.
 
     Args:
-        obj: Objeto que puede contener tipos numpy
+        iterable: Elementos a recorrer
+        total: Número total de elementos, si se conoce
 
     Returns:
-        Objeto con tipos Python nativos
+        El iterable, envuelto en tqdm cuando es posible
+    """
+    if tqdm is None:
+        return iterable
+
+    return tqdm(
+        iterable,
+        total=total,
+        desc="Procesando archivos",
+        unit="archivo",
+        file=sys.stderr,
+        smoothing=0,
+        miniters=max(1, (total or 0) // 100),
+        disable=None,
+    )
+
+
+# Aplicación del proceso trabajador, creada una vez por _init_worker
+_APP: Optional["CSVProcessorApp"] = None
+
+
+def _init_worker(config_path: Optional[str], pool_size: int = 1) -> None:
+    """
+    Inicializa la aplicación de un proceso trabajador del lote
+
+    Se ejecuta una vez por proceso, de modo que la configuración y los
+    componentes se reutilizan para todos los archivos que procese. Los hilos
+    de pyarrow se reparten entre los procesos del pool para no saturar la CPU.
+
+    Args:
+        config_path: Ruta al archivo de configuración
+        pool_size: Número de procesos trabajadores del pool
     """
-    import numpy as np
-    from dataclasses import is_dataclass, asdict
-
-    if isinstance(obj, np.integer):
-        return int(obj)
-    elif isinstance(obj, np.floating):
-        return float(obj)
-    elif isinstance(obj, np.ndarray):
-        return obj.tolist()
-    elif is_dataclass(obj) and not isinstance(obj, type):
-        return convert_numpy_types(asdict(obj))
-    elif isinstance(obj, dict):
-        return {key: convert_numpy_types(value) for key, value in obj.items()}
-    elif isinstance(obj, list):
-        return [convert_numpy_types(item) for item in obj]
+    global _APP
+
+    try:
+        import pyarrow as pa
+    except ImportError:
+        pass
     else:
-        return obj
+        pa.set_cpu_count(max(1, (os.cpu_count() or 1) // max(1, pool_size)))
+
+    _APP = CSVProcessorApp(config_path)
+
+
+def _process_one_file(
+    input_path: str, output_path: Optional[str], validate: bool
+) -> Dict[str, Any]:
+    """
+    Procesa un archivo del lote dentro de un proceso trabajador
+
+    Args:
+        input_path: Ruta al archivo CSV de entrada
+        output_path: Ruta del archivo de salida (opcional)
+        validate: Si ejecutar validación
+
+    Returns:
+        Resultado del archivo para el reporte del lote
+    """
+    return _APP._process_batch_file(input_path, output_path, validate)
 
 
 class CSVProcessorApp:
@@ -74,13 +233,15 @@ class CSVProcessorApp:
         Args:
             config_path: Ruta al archivo de configuración
         """
+        self.config_path = config_path
+
         # Setup logging first
         self.logger = setup_logging(log_level="INFO", log_dir="logs")
         self.logger.info("=== Aplicación de Procesamiento CSV Iniciando ===")
 
         try:
             # Inicializar administrador de configuración
-            self.config_manager = ConfigManager(config_path)
+            self.config_manager = ConfigManager.get_cached(config_path)
             self.logger.info("Administrador de configuración inicializado")
 
             # Inicializar componentes
@@ -121,60 +282,33 @@ class CSVProcessorApp:
             results = {}
 
             with timing_context("Procesamiento de archivo"):
-                # Usar el método principal del CSV processor que maneja todo
-                if output_path:
-                    processed_df, processing_stats, metadata = (
-                        self.csv_processor.process_file(
-                            input_path=input_path,
-                            output_path=Path(output_path),
-                            profile=processing_profile,
-                        )
+                # El DataFrame procesado se conserva en memoria; solo se escribe
+                # a disco si se especifica una ruta de salida
+                processed_df, processing_stats, metadata = (
+                    self.csv_processor.process_file(
+                        input_path=input_path,
+                        output_path=Path(output_path) if output_path else None,
+                        profile=processing_profile,
                     )
-                    results["output_path"] = str(output_path)
-                    results["metadata"] = metadata
-                    results["processing_stats"] = processing_stats
-                else:
-                    # Si solo queremos procesar sin guardar, necesitamos usar los métodos internos
-                    # Por ahora, usaremos un archivo temporal
-                    import tempfile
-
-                    with tempfile.NamedTemporaryFile(
-                        suffix=".csv", delete=False
-                    ) as tmp:
-                        temp_path = Path(tmp.name)
+                )
+                # La ruta escrita puede cambiar de extensión (p. ej. a .parquet)
+                results["output_path"] = metadata.output_path or None
+                results["metadata"] = metadata
+                results["processing_stats"] = processing_stats
+
+                # Validar directamente el DataFrame en memoria si se solicita
+                if validate:
+                    validation_report = self.data_validator.validate_dataframe(
+                        processed_df
+                    )
+                    results["validation"] = validation_report
 
-                    try:
-                        processed_df, processing_stats, metadata = (
-                            self.csv_processor.process_file(
-                                input_path=input_path,
-                                output_path=temp_path,
-                                profile=processing_profile,
-                            )
+                    if not validation_report.is_valid:
+                        self.logger.warning(
+                            f"Problemas de validación encontrados: {validation_report.errors} errores, {validation_report.warnings} advertencias"
                         )
-                        results["output_path"] = str(temp_path)
-                        results["metadata"] = metadata
-                        results["processing_stats"] = processing_stats
-
-                        # Leer el archivo procesado para validación si se solicita
-                        if validate:
-                            import pandas as pd
-
-                            df = pd.read_csv(temp_path)
-                            validation_report = self.data_validator.validate_dataframe(
-                                df
-                            )
-                            results["validation"] = validation_report
-
-                            if not validation_report.is_valid:
-                                self.logger.warning(
-                                    f"Problemas de validación encontrados: {validation_report.errors} errores, {validation_report.warnings} advertencias"
-                                )
-                            else:
-                                self.logger.info("Validación de datos exitosa")
-                    finally:
-                        # Limpiar archivo temporal
-                        if temp_path.exists():
-                            temp_path.unlink()
+                    else:
+                        self.logger.info("Validación de datos exitosa")
 
                 # Crear resumen
                 summary = {
@@ -183,9 +317,12 @@ class CSVProcessorApp:
                     "perfil_procesamiento": processing_profile,
                     "filas_originales": processing_stats.original_rows,
                     "filas_procesadas": processing_stats.final_rows,
-                    "validacion_exitosa": results.get(
-                        "validation", type("", (), {"is_valid": True})
-                    ).is_valid,
+                    # None (null en JSON) cuando no se validó
+                    "validacion_exitosa": (
+                        results["validation"].is_valid
+                        if "validation" in results
+                        else None
+                    ),
                     "puntuacion_calidad": processing_stats.quality_score,
                     "tiempo_procesamiento": processing_stats.processing_time_seconds,
                 }
@@ -206,15 +343,26 @@ class CSVProcessorApp:
         output_directory: Optional[str] = None,
         pattern: str = "*.csv",
         validate: bool = True,
+        max_workers: Optional[int] = None,
+        output_format: Optional[str] = None,
+        fail_fast: bool = False,
     ) -> Dict[str, Any]:
         """
         Procesar múltiples archivos CSV en lote
 
+        El progreso avanza a medida que terminan los archivos, en el orden en
+        que terminan; los resultados se reportan en el orden de descubrimiento.
+        Con fail_fast, o ante Ctrl+C, los archivos pendientes se cancelan.
+
         Args:
             input_directory: Directorio que contiene archivos CSV
             output_directory: Directorio de salida (opcional)
             pattern: Patrón de archivos a coincidir
             validate: Si ejecutar validación
+            max_workers: Número de procesos trabajadores (default: número de CPUs)
+            output_format: Formato de salida (csv, parquet, feather); por defecto
+                se conserva la extensión de cada archivo de entrada
+            fail_fast: Si detener el lote en el primer archivo con error
 
         Returns:
             Diccionario conteniendo resultados del procesamiento en lote
@@ -226,84 +374,132 @@ class CSVProcessorApp:
                     f"Directorio de entrada no encontrado: {input_directory}"
                 )
 
-            # Encontrar archivos CSV
-            csv_files = list(input_dir.glob(pattern))
-            if not csv_files:
+            # Preparar directorio de salida si se especifica
+            output_prefix = None
+            if output_directory:
+                Path(output_directory).mkdir(parents=True, exist_ok=True)
+                output_prefix = f"{os.fspath(output_directory)}{os.sep}processed_"
+
+            # Descubrir archivos de forma perezosa: el procesamiento empieza
+            # mientras el directorio todavía se está recorriendo
+            jobs = (
+                (
+                    str(csv_file),
+                    (
+                        (
+                            f"{output_prefix}{csv_file.stem}.{output_format}"
+                            if output_format
+                            else f"{output_prefix}{csv_file.name}"
+                        )
+                        if output_prefix
+                        else None
+                    ),
+                )
+                for csv_file in _iter_matching_files(input_dir, pattern)
+            )
+
+            # Cada archivo es independiente: repartirlos entre procesos trabajadores
+            workers = max_workers or os.cpu_count() or 1
+            if workers > 1:
+                self.logger.info(f"Usando hasta {workers} procesos trabajadores")
+                with ProcessPoolExecutor(
+                    max_workers=workers,
+                    initializer=_init_worker,
+                    initargs=(self.config_path, workers),
+                ) as executor:
+                    # Futuro -> (posición, archivo) para recorrerlos según terminan
+                    futures = {
+                        executor.submit(
+                            _process_one_file, input_file, output_file, validate
+                        ): (i, input_file)
+                        for i, (input_file, output_file) in enumerate(jobs)
+                    }
+                    outcomes: List[Optional[Dict[str, Any]]] = [None] * len(futures)
+                    try:
+                        for future in _progress(as_completed(futures), len(futures)):
+                            i, input_file = futures[future]
+                            outcomes[i] = self._run_batch_job(input_file, future.result)
+                            if fail_fast and not outcomes[i]["success"]:
+                                break
+                    except KeyboardInterrupt:
+                        executor.shutdown(wait=False, cancel_futures=True)
+                        raise
+                    # Cancelar los pendientes; los que ya corren terminan
+                    for future in futures:
+                        future.cancel()
+                    cancelled_files = [
+                        input_file
+                        for i, input_file in futures.values()
+                        if outcomes[i] is None
+                    ]
+                    outcomes = [outcome for outcome in outcomes if outcome is not None]
+            else:
+                outcomes = []
+                for input_file, output_file in _progress(jobs):
+                    outcome = self._run_batch_job(
+                        input_file,
+                        partial(
+                            self._process_batch_file, input_file, output_file, validate
+                        ),
+                    )
+                    outcomes.append(outcome)
+                    if fail_fast and not outcome["success"]:
+                        break
+                # Archivos que quedaron sin procesar al detenerse
+                cancelled_files = [input_file for input_file, _ in jobs]
+
+            if cancelled_files:
+                self.logger.warning(
+                    f"Lote detenido tras un error: {len(cancelled_files)} archivos cancelados"
+                )
+
+            total_files = len(outcomes) + len(cancelled_files)
+            if not total_files:
                 raise ValueError(
                     f"No se encontraron archivos con patrón {pattern} en {input_directory}"
                 )
 
-            self.logger.info(f"Procesando {len(csv_files)} archivos CSV en lote")
-
-            # Preparar directorio de salida si se especifica
-            if output_directory:
-                output_dir = Path(output_directory)
-                output_dir.mkdir(parents=True, exist_ok=True)
+            self.logger.info(f"Procesados {total_files} archivos CSV en lote")
 
             results = {
-                "total_files": len(csv_files),
+                "total_files": total_files,
                 "processed_files": [],
                 "errors": [],
+                "cancelled_files": cancelled_files,
                 "summary": {},
             }
 
-            successful_processing = 0
-            total_rows_processed = 0
-            total_processing_time = 0
-
-            for csv_file in csv_files:
-                try:
-                    # Generar ruta de salida
-                    if output_directory:
-                        output_path = (
-                            Path(output_directory) / f"processed_{csv_file.name}"
-                        )
-                    else:
-                        output_path = None
-
-                    # Procesar archivo individual
-                    file_result = self.process_single_file(
-                        input_path=str(csv_file),
-                        output_path=str(output_path) if output_path else None,
-                        validate=validate,
-                    )
-
-                    results["processed_files"].append(
-                        {
-                            "input_file": str(csv_file),
-                            "output_file": file_result.get("output_path"),
-                            "success": True,
-                            "summary": file_result["summary"],
-                        }
-                    )
-
-                    successful_processing += 1
-                    total_rows_processed += file_result["summary"]["filas_procesadas"]
-                    total_processing_time += file_result["summary"][
-                        "tiempo_procesamiento"
-                    ]
+            # Estadísticas por archivo en arreglos contiguos para agregarlas de una vez
+            succeeded = np.zeros(len(outcomes), dtype=bool)
+            rows_processed = np.zeros(len(outcomes), dtype=np.int64)
+            processing_times = np.zeros(len(outcomes), dtype=np.float64)
+
+            for i, outcome in enumerate(outcomes):
+                if outcome["success"]:
+                    succeeded[i] = True
+                    rows_processed[i] = outcome["summary"]["filas_procesadas"]
+                    processing_times[i] = outcome["summary"]["tiempo_procesamiento"]
+                    results["processed_files"].append(outcome)
+                else:
+                    results["errors"].append(outcome)
 
-                except Exception as e:
-                    error_info = {
-                        "input_file": str(csv_file),
-                        "error": str(e),
-                        "success": False,
-                    }
-                    results["errors"].append(error_info)
-                    self.logger.error(f"Error procesando {csv_file}: {e}")
+            successful_processing = int(succeeded.sum())
+            total_rows_processed = int(rows_processed.sum())
+            total_processing_time = float(processing_times.sum())
 
             # Crear resumen del lote
             results["summary"] = {
-                "total_archivos": len(csv_files),
+                "total_archivos": total_files,
                 "archivos_exitosos": successful_processing,
                 "archivos_con_error": len(results["errors"]),
+                "archivos_cancelados": len(cancelled_files),
                 "total_filas_procesadas": total_rows_processed,
                 "tiempo_total_procesamiento": total_processing_time,
-                "tasa_exito": successful_processing / len(csv_files) * 100,
+                "tasa_exito": successful_processing / total_files * 100,
             }
 
             self.logger.info(
-                f"Procesamiento en lote completado: {successful_processing}/{len(csv_files)} archivos exitosos"
+                f"Procesamiento en lote completado: {successful_processing}/{total_files} archivos exitosos"
             )
             return results
 
@@ -312,6 +508,87 @@ class CSVProcessorApp:
             self.logger.error(error_msg, exc_info=True)
             raise RuntimeError(error_msg) from e
 
+    def _process_batch_file(
+        self, input_path: str, output_path: Optional[str], validate: bool
+    ) -> Dict[str, Any]:
+        """
+        Procesar un archivo del lote y resumir su resultado
+
+        Args:
+            input_path: Ruta al archivo CSV de entrada
+            output_path: Ruta del archivo de salida (opcional)
+            validate: Si ejecutar validación
+
+        Returns:
+            Diccionario con el resultado del archivo
+        """
+        file_result = self.process_single_file(
+            input_path=input_path,
+            output_path=output_path,
+            validate=validate,
+        )
+        return {
+            "input_file": input_path,
+            "output_file": file_result.get("output_path"),
+            "success": True,
+            "summary": file_result["summary"],
+        }
+
+    def _run_batch_job(
+        self, input_file: str, job: Callable[[], Dict[str, Any]]
+    ) -> Dict[str, Any]:
+        """
+        Ejecutar un trabajo del lote convirtiendo los errores en resultados
+
+        Args:
+            input_file: Archivo de entrada del trabajo
+            job: Función que devuelve el resultado del archivo
+
+        Returns:
+            Resultado del archivo o información del error
+        """
+        try:
+            return job()
+        except Exception as e:
+            self.logger.error(f"Error procesando {input_file}: {e}")
+            return {"input_file": input_file, "error": str(e), "success": False}
+
+    def validate_file(
+        self, input_path: str, chunksize: int = 100_000
+    ) -> ValidationReport:
+        """
+        Validar un archivo CSV leyéndolo por bloques
+
+        La memoria usada queda acotada por el tamaño del bloque, por lo que se
+        pueden validar archivos más grandes que la RAM disponible. El archivo se
+        mapea en memoria ya que solo se lee y nunca se reescribe.
+
+        Args:
+            input_path: Ruta al archivo CSV a validar
+            chunksize: Número de filas por bloque
+
+        Returns:
+            Reporte de validación del archivo completo
+        """
+        state = ChunkValidationState()
+        engine = self.config_manager.processing.csv_engine
+        # Encoding, delimitador y encabezado detectados como al procesar
+        metadata = self.csv_processor.analyze_file(input_path)
+        chunks = iter_csv_chunks(
+            input_path,
+            chunksize=chunksize,
+            engine=engine,
+            memory_map=True,
+            encoding=metadata.encoding,
+            delimiter=metadata.delimiter,
+            has_header=metadata.has_header,
+            na_values=list(NA_VALUES),
+        )
+        for chunk in chunks:
+            self.data_validator.validate_chunk(chunk, state)
+
+        return self.data_validator.finalize(state)
+
     def interactive_menu(self) -> None:
         """
         Mostrar menú interactivo para procesamiento guiado
@@ -493,21 +770,16 @@ class CSVProcessorApp:
             return
 
         try:
-            import pandas as pd
-
             print(f"\n🔍 Validando archivo: {input_path}")
 
-            # Leer archivo
-            df = pd.read_csv(input_path)
-
-            # Ejecutar validación
-            validation_report = self.data_validator.validate_dataframe(df)
+            # Leer y validar el archivo por bloques
+            validation_report = self.validate_file(input_path)
 
             # Mostrar resultados
             print("\n📋 REPORTE DE VALIDACIÓN")
             print("-" * 25)
-            print(f"📊 Total filas: {len(df)}")
-            print(f"📊 Total columnas: {len(df.columns)}")
+            print(f"📊 Total filas: {validation_report.summary['total_rows']}")
+            print(f"📊 Total columnas: {validation_report.summary['total_columns']}")
 
             if validation_report.is_valid:
                 print("✅ Estado: VÁLIDO")
@@ -516,6 +788,10 @@ class CSVProcessorApp:
                 print(f"🚨 Errores: {validation_report.errors}")
                 print(f"⚠️ Advertencias: {validation_report.warnings}")
 
+            per_chunk_rules = validation_report.summary.get("per_chunk_rules")
+            if per_chunk_rules:
+                print(f"ℹ️ Reglas evaluadas por bloque: {', '.join(per_chunk_rules)}")
+
             # Mostrar detalles si hay problemas
             if hasattr(validation_report, "results") and validation_report.results:
                 print("\n📝 Detalles:")
@@ -552,6 +828,91 @@ class CSVProcessorApp:
             print(f"❌ Error mostrando configuración: {e}")
 
 
+def _cmd_single(app: CSVProcessorApp, args: argparse.Namespace) -> None:
+    """Comando single: procesar un archivo individual"""
+    print(f"🔄 Procesando archivo: {args.input}")
+
+    output_path = args.output
+    if output_path and args.format:
+        output_path = str(Path(output_path).with_suffix(f".{args.format}"))
+
+    results = app.process_single_file(
+        input_path=args.input,
+        output_path=output_path,
+        processing_profile=args.profile,
+        validate=not args.no_validate,
+    )
+
+    print("✅ Procesamiento completado")
+
+    if args.verbose:
+        print("\n📊 Resultados detallados:")
+        print_json(results)
+    else:
+        summary = results["summary"]
+        print(
+            f"📊 Filas procesadas: {summary['filas_originales']} → {summary['filas_procesadas']}"
+        )
+        print(f"⭐ Puntuación calidad: {summary['puntuacion_calidad']:.2f}/10")
+        if summary["archivo_salida"]:
+            print(f"📁 Archivo guardado: {summary['archivo_salida']}")
+
+
+def _cmd_batch(app: CSVProcessorApp, args: argparse.Namespace) -> None:
+    """Comando batch: procesar un directorio de archivos en lote"""
+    print(f"🔄 Procesando directorio: {args.input_dir}")
+
+    results = app.batch_process(
+        input_directory=args.input_dir,
+        output_directory=args.output_dir,
+        pattern=args.pattern,
+        validate=not args.no_validate,
+        max_workers=args.workers,
+        output_format=args.format,
+        fail_fast=args.fail_fast,
+    )
+
+    print("✅ Procesamiento en lote completado")
+
+    if args.verbose:
+        print("\n📊 Resultados detallados:")
+        print_json(results)
+    else:
+        summary = results["summary"]
+        print(
+            f"📊 Procesamiento: {summary['archivos_exitosos']}/{summary['total_archivos']} archivos"
+        )
+        print(f"📈 Tasa de éxito: {summary['tasa_exito']:.1f}%")
+        print(f"📊 Total filas procesadas: {summary['total_filas_procesadas']}")
+        if summary["archivos_cancelados"]:
+            print(f"⏹️ Archivos cancelados: {summary['archivos_cancelados']}")
+
+
+def _cmd_validate(app: CSVProcessorApp, args: argparse.Namespace) -> None:
+    """Comando validate: validar un archivo CSV"""
+    print(f"🔍 Validando archivo: {args.input}")
+
+    validation_report = app.validate_file(args.input, chunksize=args.chunksize)
+
+    if validation_report.is_valid:
+        print("✅ Archivo válido")
+    else:
+        print(
+            f"❌ Archivo inválido: {validation_report.errors} errores, {validation_report.warnings} advertencias"
+        )
+
+    per_chunk_rules = validation_report.summary.get("per_chunk_rules")
+    if per_chunk_rules:
+        print(
+            f"ℹ️ Reglas evaluadas por bloque (dependen de --chunksize): {', '.join(per_chunk_rules)}"
+        )
+
+    if args.verbose and hasattr(validation_report, "results"):
+        print("\n📝 Detalles de validación:")
+        for result in validation_report.results:
+            print(f"  • {result.message}")
+
+
 def setup_cli_parser() -> argparse.ArgumentParser:
     """
     Configurar parser de argumentos de línea de comandos
@@ -590,11 +951,20 @@ Ejemplos de uso:
         help="Perfil de procesamiento (default: standard)",
     )
     single_parser.add_argument(
-        "--no-validate", action="store_true", help="Omitir validación de datos"
+        "-f",
+        "--format",
+        choices=["csv", "parquet", "feather"],
+        help="Formato del archivo de salida (default: según la extensión de --output)",
+    )
+    single_parser.add_argument(
+        "--no-validate",
+        action="store_true",
+        help="Omitir validación de datos (validacion_exitosa queda como null)",
     )
     single_parser.add_argument(
         "-v", "--verbose", action="store_true", help="Salida detallada"
     )
+    single_parser.set_defaults(func=_cmd_single)
 
     # Comando para procesamiento en lote
     batch_parser = subparsers.add_parser("batch", help="Procesamiento en lote")
@@ -608,20 +978,47 @@ Ejemplos de uso:
         "--pattern", default="*.csv", help="Patrón de archivos (default: *.csv)"
     )
     batch_parser.add_argument(
-        "--no-validate", action="store_true", help="Omitir validación de datos"
+        "-f",
+        "--format",
+        choices=["csv", "parquet", "feather"],
+        help="Formato de los archivos de salida (default: la extensión de cada entrada)",
+    )
+    batch_parser.add_argument(
+        "--no-validate",
+        action="store_true",
+        help="Omitir validación de datos (validacion_exitosa queda como null)",
+    )
+    batch_parser.add_argument(
+        "-w",
+        "--workers",
+        type=int,
+        help="Número de procesos trabajadores (default: número de CPUs)",
+    )
+    batch_parser.add_argument(
+        "--fail-fast",
+        action="store_true",
+        help="Detener el lote en el primer archivo con error, cancelando los pendientes",
     )
     batch_parser.add_argument(
         "-v", "--verbose", action="store_true", help="Salida detallada"
     )
+    batch_parser.set_defaults(func=_cmd_batch)
 
     # Comando para validación
     validate_parser = subparsers.add_parser("validate", help="Validar archivo CSV")
     validate_parser.add_argument(
         "-i", "--input", required=True, help="Archivo CSV a validar"
     )
+    validate_parser.add_argument(
+        "--chunksize",
+        type=int,
+        default=100_000,
+        help="Filas leídas por bloque durante la validación (default: 100000)",
+    )
     validate_parser.add_argument(
         "-v", "--verbose", action="store_true", help="Salida detallada"
     )
+    validate_parser.set_defaults(func=_cmd_validate)
 
     # Opciones globales
     parser.add_argument(
@@ -655,78 +1052,13 @@ def main():
             app.interactive_menu()
             return
 
-        # Procesar comandos
-        if args.command == "single":
-            print(f"🔄 Procesando archivo: {args.input}")
-
-            results = app.process_single_file(
-                input_path=args.input,
-                output_path=args.output,
-                processing_profile=args.profile,
-                validate=not args.no_validate,
-            )
-
-            print("✅ Procesamiento completado")
-
-            if args.verbose:
-                # Convertir tipos numpy para serialización JSON
-                results_serializable = convert_numpy_types(results)
-                print("\n📊 Resultados detallados:")
-                print(json.dumps(results_serializable, indent=2, ensure_ascii=False))
-            else:
-                summary = results["summary"]
-                print(
-                    f"📊 Filas procesadas: {summary['filas_originales']} → {summary['filas_procesadas']}"
-                )
-                print(f"⭐ Puntuación calidad: {summary['puntuacion_calidad']:.2f}/10")
-                if summary["archivo_salida"]:
-                    print(f"📁 Archivo guardado: {summary['archivo_salida']}")
-
-        elif args.command == "batch":
-            print(f"🔄 Procesando directorio: {args.input_dir}")
-
-            results = app.batch_process(
-                input_directory=args.input_dir,
-                output_directory=args.output_dir,
-                pattern=args.pattern,
-                validate=not args.no_validate,
-            )
-
-            print("✅ Procesamiento en lote completado")
-
-            if args.verbose:
-                print("\n📊 Resultados detallados:")
-                print(json.dumps(results, indent=2, ensure_ascii=False))
-            else:
-                summary = results["summary"]
-                print(
-                    f"📊 Procesamiento: {summary['archivos_exitosos']}/{summary['total_archivos']} archivos"
-                )
-                print(f"📈 Tasa de éxito: {summary['tasa_exito']:.1f}%")
-                print(f"📊 Total filas procesadas: {summary['total_filas_procesadas']}")
-
-        elif args.command == "validate":
-            print(f"🔍 Validando archivo: {args.input}")
-
-            import pandas as pd
-
-            df = pd.read_csv(args.input)
-            validation_report = app.data_validator.validate_dataframe(df)
-
-            if validation_report.is_valid:
-                print("✅ Archivo válido")
-            else:
-                print(
-                    f"❌ Archivo inválido: {validation_report.errors} errores, {validation_report.warnings} advertencias"
-                )
-
-            if args.verbose and hasattr(validation_report, "results"):
-                print("\n📝 Detalles de validación:")
-                for result in validation_report.results:
-                    print(f"  • {result.message}")
-
-        else:
+        # Procesar comando (cada subcomando registra su función con set_defaults)
+        command = getattr(args, "func", None)
+        if command is None:
             parser.print_help()
+            return
+
+        command(app, args)
 
     except KeyboardInterrupt:
         print("\n👋 ¡Proceso interrumpido por el usuario!")
@@ -13,15 +13,216 @@ Proyecto: Data + Automation Engineer Journey - Semana 3
 """
 
 import os
+import copy
 import json
 import logging
+import threading
 from pathlib import Path
-from typing import Dict, Any, Optional, Union
-from dataclasses import dataclass, field
-from dotenv import load_dotenv
+from collections import OrderedDict
+from typing import Dict, Any, Callable, Iterator, Optional, Set, Tuple, Union
+from dataclasses import dataclass, field, replace
+from datetime import date, datetime
+from functools import cached_property, lru_cache
+from logging.handlers import RotatingFileHandler
+from dotenv import dotenv_values
 
+try:
+    import orjson
+except ImportError:  # orjson es opcional; se usa json de la librería estándar
+    orjson = None
 
-@dataclass
+# Archivos .env ya parseados en este proceso: ruta -> (mtime en ns, valores)
+_DOTENV_CACHE: Dict[str, Tuple[int, Dict[str, Optional[str]]]] = {}
+
+
+def _read_dotenv(env_path: str) -> Dict[str, Optional[str]]:
+    """
+    Parsea un archivo .env una sola vez mientras no cambie su mtime
+
+    Args:
+        env_path: Ruta al archivo .env
+
+    Returns:
+        Variables definidas en el archivo
+    """
+    mtime = os.stat(env_path).st_mtime_ns
+    key = os.path.abspath(env_path)
+
+    cached = _DOTENV_CACHE.get(key)
+    if cached is not None and cached[0] == mtime:
+        return cached[1]
+
+    values = dotenv_values(env_path)
+    _DOTENV_CACHE[key] = (mtime, values)
+    return values
+
+
+def _resolve_env_path(env_file: Optional[str], config_dir: str) -> str:
+    """
+    Determina qué archivo .env corresponde a una configuración
+
+    Args:
+        env_file: Ruta explícita al archivo .env (opcional)
+        config_dir: Directorio de configuración
+
+    Returns:
+        Ruta del .env indicado, o el del directorio actual o de config/
+    """
+    if env_file:
+        return os.fspath(env_file)
+    # Buscar .env en el directorio actual o en config/
+    if os.path.exists(".env"):
+        return ".env"
+    return os.path.join(config_dir, ".env")
+
+
+def _apply_dotenv(env_path: str) -> bool:
+    """
+    Vuelca un archivo .env en os.environ sin sobrescribir variables definidas
+
+    Args:
+        env_path: Ruta al archivo .env
+
+    Returns:
+        True si el archivo existía y se aplicó
+    """
+    if not os.path.exists(env_path):
+        return False
+    # Igual que load_dotenv: no sobrescribe variables ya definidas
+    for key, value in _read_dotenv(env_path).items():
+        if value is not None:
+            os.environ.setdefault(key, value)
+    return True
+
+
+# Directorios (rutas absolutas) ya verificados o creados en este proceso
+_VERIFIED_DIRS: Set[str] = set()
+
+
+@lru_cache(maxsize=32)
+def _path(value: str) -> Path:
+    """Crea (una sola vez por valor) el Path de una ruta de configuración"""
+    return Path(value)
+
+
+# Valores de texto que se interpretan como verdadero en variables booleanas,
+# con sus grafías habituales para evitar normalizar el caso en cada lectura
+_TRUTHY = frozenset(
+    {"true", "1", "yes", "on", "True", "TRUE", "Yes", "YES", "ON", "On"}
+)
+
+
+def _parse_bool(value: str) -> bool:
+    """Convierte un valor de variable de entorno a booleano"""
+    if value in _TRUTHY:
+        return True
+    # Grafías poco comunes ("tRUE", " yes "): normalizar solo en este caso
+    return value.strip().casefold() in _TRUTHY
+
+
+def _parse_list(value: str) -> list:
+    """Convierte una lista separada por comas en lista de strings no vacíos"""
+    return [item for item in map(str.strip, value.split(",")) if item]
+
+
+# Variables de entorno por sección: (variable, conversión, valor por defecto, campo)
+_ENV_SCHEMA = {
+    "paths": [
+        ("INPUT_DIRECTORY", _path, "data/input", "input_directory"),
+        ("OUTPUT_DIRECTORY", _path, "data/output", "output_directory"),
+        ("TEMP_DIRECTORY", _path, "data/temp", "temp_directory"),
+        ("LOG_DIRECTORY", _path, "logs", "log_directory"),
+    ],
+    "processing": [
+        ("MAX_FILE_SIZE_MB", int, "100", "max_file_size_mb"),
+        ("BATCH_SIZE", int, "1000", "batch_size"),
+        ("DEFAULT_ENCODING", str, "utf-8", "default_encoding"),
+        ("DEFAULT_DELIMITER", str, ",", "default_delimiter"),
+        ("CPU_CORES", int, "0", "cpu_cores"),
+        ("MEMORY_LIMIT_GB", float, "2.0", "memory_limit_gb"),
+        ("CSV_ENGINE", str.lower, "pandas", "csv_engine"),
+        ("ENCODING_BACKEND", str.lower, "auto", "encoding_backend"),
+        ("DTYPE_BACKEND", str.lower, "numpy", "dtype_backend"),
+    ],
+    "validation": [
+        ("MAX_VALIDATION_ERRORS", int, "50", "max_validation_errors"),
+        ("STRICT_VALIDATION", _parse_bool, "false", "strict_validation"),
+        ("MIN_QUALITY_SCORE", float, "0.8", "min_quality_score"),
+        ("MAX_MISSING_PERCENTAGE", float, "10.0", "max_missing_percentage"),
+        ("MAX_DUPLICATE_PERCENTAGE", float, "5.0", "max_duplicate_percentage"),
+    ],
+    "logging": [
+        ("LOG_LEVEL", str, "INFO", "log_level"),
+        ("LOG_FILE_PATTERN", str, "csv_processor_%Y%m%d.log", "log_file_pattern"),
+        ("LOG_MAX_SIZE_MB", int, "10", "log_max_size_mb"),
+        ("LOG_BACKUP_COUNT", int, "5", "log_backup_count"),
+        ("CONSOLE_LOGGING", _parse_bool, "true", "console_logging"),
+    ],
+    "notifications": [
+        (
+            "ENABLE_EMAIL_NOTIFICATIONS",
+            _parse_bool,
+            "false",
+            "enable_email_notifications",
+        ),
+        ("EMAIL_HOST", str, "", "email_host"),
+        ("EMAIL_PORT", int, "587", "email_port"),
+        ("EMAIL_USER", str, "", "email_user"),
+        ("EMAIL_PASSWORD", str, "", "email_password"),
+        ("EMAIL_RECIPIENTS", _parse_list, "", "email_recipients"),
+        (
+            "ENABLE_SLACK_NOTIFICATIONS",
+            _parse_bool,
+            "false",
+            "enable_slack_notifications",
+        ),
+        ("SLACK_WEBHOOK_URL", str, "", "slack_webhook_url"),
+    ],
+}
+
+# Variables de entorno que determinan la configuración construida
+_RELEVANT_ENV_KEYS = frozenset(
+    name for entries in _ENV_SCHEMA.values() for name, _, _, _ in entries
+)
+
+
+def _flatten(data: Dict[str, Any], prefix: str = "") -> Iterator[Tuple[str, Any]]:
+    """
+    Recorre un diccionario anidado entregando sus hojas con clave punteada
+
+    Args:
+        data: Diccionario a aplanar
+        prefix: Prefijo de las claves (uso interno en la recursión)
+
+    Yields:
+        Pares (ruta.punteada, valor) de cada valor que no es diccionario
+    """
+    for key, value in data.items():
+        path = f"{prefix}.{key}" if prefix else key
+        if isinstance(value, dict):
+            yield from _flatten(value, path)
+        else:
+            yield path, value
+
+
+def _read_env_section(section: str) -> Dict[str, Any]:
+    """
+    Lee y convierte las variables de entorno de una sección en un solo paso
+
+    Args:
+        section: Nombre de la sección en _ENV_SCHEMA
+
+    Returns:
+        Argumentos para construir el dataclass de la sección
+    """
+    env = os.environ
+    return {
+        field_name: convert(env.get(name, default))
+        for name, convert, default, field_name in _ENV_SCHEMA[section]
+    }
+
+
+@dataclass(slots=True, frozen=True)
 class ProcessingConfig:
     """Configuración de procesamiento de datos"""
 
@@ -31,25 +232,22 @@ class ProcessingConfig:
     default_delimiter: str = ","
     cpu_cores: int = 0
     memory_limit_gb: float = 2.0
+    csv_engine: str = "pandas"
+    encoding_backend: str = "auto"
+    dtype_backend: str = "numpy"
 
 
-@dataclass
+@dataclass(slots=True, frozen=True)
 class PathConfig:
     """Configuración de rutas de archivos"""
 
-    input_directory: Path = field(default_factory=lambda: Path("data/input"))
-    output_directory: Path = field(default_factory=lambda: Path("data/output"))
-    temp_directory: Path = field(default_factory=lambda: Path("data/temp"))
-    log_directory: Path = field(default_factory=lambda: Path("logs"))
+    input_directory: Path = field(default_factory=lambda: _path("data/input"))
+    output_directory: Path = field(default_factory=lambda: _path("data/output"))
+    temp_directory: Path = field(default_factory=lambda: _path("data/temp"))
+    log_directory: Path = field(default_factory=lambda: _path("logs"))
 
-    def __post_init__(self):
-        """Convierte strings a Path objects si es necesario"""
-        for field_name, field_value in self.__dict__.items():
-            if isinstance(field_value, str):
-                setattr(self, field_name, Path(field_value))
 
-
-@dataclass
+@dataclass(slots=True, frozen=True)
 class ValidationConfig:
     """Configuración de validación de datos"""
 
@@ -60,7 +258,7 @@ class ValidationConfig:
     max_duplicate_percentage: float = 5.0
 
 
-@dataclass
+@dataclass(slots=True, frozen=True)
 class LoggingConfig:
     """Configuración del sistema de logging"""
 
@@ -71,7 +269,7 @@ class LoggingConfig:
     console_logging: bool = True
 
 
-@dataclass
+@dataclass(slots=True, frozen=True)
 class NotificationConfig:
     """Configuración de notificaciones"""
 
@@ -85,14 +283,66 @@ class NotificationConfig:
     slack_webhook_url: str = ""
 
 
+# Validaciones por sección: (condición que debe cumplirse, mensaje de error).
+# Cada sección ejecuta solo las suyas al cargarse.
+_SECTION_VALIDATORS: Dict[str, Tuple[Tuple[Callable[[Any], bool], str], ...]] = {
+    "processing": (
+        (lambda c: c.max_file_size_mb > 0, "MAX_FILE_SIZE_MB debe ser mayor a 0"),
+        (lambda c: c.batch_size > 0, "BATCH_SIZE debe ser mayor a 0"),
+        (
+            lambda c: c.csv_engine in ("pandas", "arrow", "polars"),
+            "CSV_ENGINE debe ser 'pandas', 'arrow' o 'polars'",
+        ),
+        (
+            lambda c: c.encoding_backend
+            in ("auto", "chardet", "cchardet", "charset_normalizer"),
+            "ENCODING_BACKEND debe ser 'auto', 'chardet', 'cchardet' o "
+            "'charset_normalizer'",
+        ),
+        (
+            lambda c: c.dtype_backend in ("numpy", "pyarrow"),
+            "DTYPE_BACKEND debe ser 'numpy' o 'pyarrow'",
+        ),
+    ),
+    "validation": (
+        (
+            lambda c: 0 <= c.min_quality_score <= 1,
+            "MIN_QUALITY_SCORE debe estar entre 0 y 1",
+        ),
+    ),
+    "notifications": (
+        (
+            lambda c: not c.enable_email_notifications or bool(c.email_host),
+            "EMAIL_HOST requerido cuando email notifications está habilitado",
+        ),
+        (
+            lambda c: not c.enable_email_notifications or bool(c.email_user),
+            "EMAIL_USER requerido cuando email notifications está habilitado",
+        ),
+    ),
+}
+
+
 class ConfigManager:
     """
     Gestor central de configuración del sistema
 
     Maneja la carga de variables de entorno, archivos de configuración JSON
     y proporciona acceso centralizado a toda la configuración del sistema.
+
+    Cada sección se carga y valida la primera vez que se accede a ella, de
+    modo que solo se paga por las secciones que se usan.
     """
 
+    # Reglas ya leídas en este proceso: ruta -> ((tamaño, mtime en ns), reglas)
+    _RULES_MEMO: Dict[str, Tuple[Tuple[int, int], Dict[str, Any]]] = {}
+
+    # Instancias compartidas por get_cached(), indexadas por su entorno; se
+    # conservan solo las más recientes para no crecer sin límite
+    _INSTANCE_CACHE: "OrderedDict[Tuple, ConfigManager]" = OrderedDict()
+    _INSTANCE_CACHE_SIZE = 4
+    _INSTANCE_LOCK = threading.Lock()
+
     def __init__(
         self,
         env_file: Optional[str] = None,
@@ -106,40 +356,122 @@ class ConfigManager:
             config_dir: Directorio de configuración (por defecto: config/)
         """
         self.logger = logging.getLogger(__name__)
-        self.config_dir = Path(config_dir) if config_dir else Path("config")
+        # Se guarda como str: las rutas internas se arman con os.path
+        self._config_dir = os.fspath(config_dir) if config_dir else "config"
+        self._env_file = env_file
+        self._config_summary: Optional[Dict[str, Any]] = None
+
+    @property
+    def config_dir(self) -> Path:
+        """Directorio de configuración"""
+        return Path(self._config_dir)
+
+    @cached_property
+    def _env_loaded(self) -> bool:
+        """Carga las variables de entorno una sola vez, antes de la primera sección"""
+        self._load_environment_variables(self._env_file)
+        return True
+
+    @cached_property
+    def paths(self) -> PathConfig:
+        """Configuración de rutas (crea los directorios al cargarse)"""
+        self._env_loaded
+        paths = self._load_path_config()
+        self._ensure_directories_exist(paths)
+        return paths
+
+    @cached_property
+    def processing(self) -> ProcessingConfig:
+        """Configuración de procesamiento"""
+        self._env_loaded
+        return self._check_section("processing", self._load_processing_config())
+
+    @cached_property
+    def validation(self) -> ValidationConfig:
+        """Configuración de validación"""
+        self._env_loaded
+        return self._check_section("validation", self._load_validation_config())
+
+    @cached_property
+    def logging_config(self) -> LoggingConfig:
+        """Configuración del sistema de logging"""
+        self._env_loaded
+        return self._load_logging_config()
+
+    @cached_property
+    def notifications(self) -> NotificationConfig:
+        """Configuración de notificaciones"""
+        self._env_loaded
+        return self._check_section("notifications", self._load_notification_config())
+
+    @cached_property
+    def processing_rules(self) -> Dict[str, Any]:
+        """Reglas de procesamiento cargadas desde JSON"""
+        return self._load_processing_rules()
+
+    @classmethod
+    def get_cached(
+        cls,
+        env_file: Optional[str] = None,
+        config_dir: Optional[Union[str, Path]] = None,
+    ) -> "ConfigManager":
+        """
+        Retorna una instancia compartida para el mismo entorno
 
-        # Cargar variables de entorno
-        self._load_environment_variables(env_file)
+        La instancia se reutiliza mientras no cambien los argumentos, el
+        directorio de trabajo, el archivo .env, las variables de entorno
+        relevantes ni processing_rules.json. El .env se aplica antes de
+        calcular la clave para que esta no cambie tras la primera carga; solo
+        se conservan las _INSTANCE_CACHE_SIZE instancias más recientes. Al
+        ser compartida, update_config() sobre ella afecta a todos los que la
+        obtuvieron; usar ConfigManager() si se necesita una copia independiente.
 
-        # Inicializar configuraciones
-        self.paths = self._load_path_config()
-        self.processing = self._load_processing_config()
-        self.validation = self._load_validation_config()
-        self.logging_config = self._load_logging_config()
-        self.notifications = self._load_notification_config()
+        Args:
+            env_file: Ruta al archivo .env (opcional)
+            config_dir: Directorio de configuración (por defecto: config/)
 
-        # Cargar reglas de procesamiento desde JSON
-        self.processing_rules = self._load_processing_rules()
+        Returns:
+            Instancia de ConfigManager
+        """
+        config_path = os.fspath(config_dir) if config_dir else "config"
 
-        # Validar configuración
-        self._validate_configuration()
+        def mtime_of(path: str) -> Optional[int]:
+            try:
+                return os.stat(path).st_mtime_ns
+            except OSError:
+                return None
+
+        env_path = _resolve_env_path(env_file, config_path)
+        _apply_dotenv(env_path)
+
+        key = (
+            env_file,
+            str(config_dir) if config_dir else None,
+            os.getcwd(),
+            os.path.abspath(env_path),
+            mtime_of(env_path),
+            tuple(sorted((k, os.environ.get(k)) for k in _RELEVANT_ENV_KEYS)),
+            mtime_of(os.path.join(config_path, "processing_rules.json")),
+        )
 
-        self.logger.info("Configuración cargada exitosamente")
+        with cls._INSTANCE_LOCK:
+            instance = cls._INSTANCE_CACHE.get(key)
+            if instance is None:
+                instance = cls(env_file, config_dir)
+                cls._INSTANCE_CACHE[key] = instance
+                while len(cls._INSTANCE_CACHE) > cls._INSTANCE_CACHE_SIZE:
+                    cls._INSTANCE_CACHE.popitem(last=False)
+            else:
+                cls._INSTANCE_CACHE.move_to_end(key)
+            return instance
 
     def _load_environment_variables(self, env_file: Optional[str] = None) -> None:
         """Carga las variables de entorno"""
         try:
-            if env_file:
-                env_path = Path(env_file)
-            else:
-                # Buscar .env en el directorio actual o en config/
-                env_path = Path(".env")
-                if not env_path.exists():
-                    env_path = self.config_dir / ".env"
-
-            if env_path.exists():
-                load_dotenv(env_path)
-                self.logger.info(f"Variables de entorno cargadas desde: {env_path}")
+            env_path = _resolve_env_path(env_file, self._config_dir)
+
+            if _apply_dotenv(env_path):
+                self.logger.info("Variables de entorno cargadas desde: %s", env_path)
             else:
                 self.logger.warning(
                     "No se encontró archivo .env, usando valores por defecto"
@@ -151,87 +483,40 @@ class ConfigManager:
 
     def _load_path_config(self) -> PathConfig:
         """Carga la configuración de rutas"""
-        return PathConfig(
-            input_directory=Path(os.getenv("INPUT_DIRECTORY", "data/input")),
-            output_directory=Path(os.getenv("OUTPUT_DIRECTORY", "data/output")),
-            temp_directory=Path(os.getenv("TEMP_DIRECTORY", "data/temp")),
-            log_directory=Path(os.getenv("LOG_DIRECTORY", "logs")),
-        )
+        return PathConfig(**_read_env_section("paths"))
 
     def _load_processing_config(self) -> ProcessingConfig:
         """Carga la configuración de procesamiento"""
-        return ProcessingConfig(
-            max_file_size_mb=int(os.getenv("MAX_FILE_SIZE_MB", "100")),
-            batch_size=int(os.getenv("BATCH_SIZE", "1000")),
-            default_encoding=os.getenv("DEFAULT_ENCODING", "utf-8"),
-            default_delimiter=os.getenv("DEFAULT_DELIMITER", ","),
-            cpu_cores=int(os.getenv("CPU_CORES", "0")),
-            memory_limit_gb=float(os.getenv("MEMORY_LIMIT_GB", "2.0")),
-        )
+        return ProcessingConfig(**_read_env_section("processing"))
 
     def _load_validation_config(self) -> ValidationConfig:
         """Carga la configuración de validación"""
-        return ValidationConfig(
-            max_validation_errors=int(os.getenv("MAX_VALIDATION_ERRORS", "50")),
-            strict_validation=os.getenv("STRICT_VALIDATION", "false").lower() == "true",
-            min_quality_score=float(os.getenv("MIN_QUALITY_SCORE", "0.8")),
-            max_missing_percentage=float(os.getenv("MAX_MISSING_PERCENTAGE", "10.0")),
-            max_duplicate_percentage=float(
-                os.getenv("MAX_DUPLICATE_PERCENTAGE", "5.0")
-            ),
-        )
+        return ValidationConfig(**_read_env_section("validation"))
 
     def _load_logging_config(self) -> LoggingConfig:
         """Carga la configuración de logging"""
-        return LoggingConfig(
-            log_level=os.getenv("LOG_LEVEL", "INFO"),
-            log_file_pattern=os.getenv("LOG_FILE_PATTERN", "csv_processor_%Y%m%d.log"),
-            log_max_size_mb=int(os.getenv("LOG_MAX_SIZE_MB", "10")),
-            log_backup_count=int(os.getenv("LOG_BACKUP_COUNT", "5")),
-            console_logging=os.getenv("CONSOLE_LOGGING", "true").lower() == "true",
-        )
+        return LoggingConfig(**_read_env_section("logging"))
 
     def _load_notification_config(self) -> NotificationConfig:
         """Carga la configuración de notificaciones"""
-        email_recipients = os.getenv("EMAIL_RECIPIENTS", "")
-        recipients_list = [
-            email.strip() for email in email_recipients.split(",") if email.strip()
-        ]
-
-        return NotificationConfig(
-            enable_email_notifications=os.getenv(
-                "ENABLE_EMAIL_NOTIFICATIONS", "false"
-            ).lower()
-            == "true",
-            email_host=os.getenv("EMAIL_HOST", ""),
-            email_port=int(os.getenv("EMAIL_PORT", "587")),
-            email_user=os.getenv("EMAIL_USER", ""),
-            email_password=os.getenv("EMAIL_PASSWORD", ""),
-            email_recipients=recipients_list,
-            enable_slack_notifications=os.getenv(
-                "ENABLE_SLACK_NOTIFICATIONS", "false"
-            ).lower()
-            == "true",
-            slack_webhook_url=os.getenv("SLACK_WEBHOOK_URL", ""),
-        )
+        return NotificationConfig(**_read_env_section("notifications"))
 
     def _load_processing_rules(self) -> Dict[str, Any]:
         """Carga las reglas de procesamiento desde archivo JSON"""
         try:
-            rules_file = self.config_dir / "processing_rules.json"
-            if rules_file.exists():
-                with open(rules_file, "r", encoding="utf-8") as f:
-                    rules = json.load(f)
-                self.logger.info(
-                    f"Reglas de procesamiento cargadas desde: {rules_file}"
-                )
-                return rules
-            else:
+            rules_file = os.path.join(self._config_dir, "processing_rules.json")
+            try:
+                rules_stat = os.stat(rules_file)
+            except FileNotFoundError:
                 self.logger.warning(
                     "No se encontró processing_rules.json, usando reglas por defecto"
                 )
                 return self._get_default_processing_rules()
 
+            rules = self._read_processing_rules(rules_file, rules_stat)
+            self.logger.info("Reglas de procesamiento cargadas desde: %s", rules_file)
+            return rules
+
         except json.JSONDecodeError as e:
             self.logger.error(f"Error al parsear processing_rules.json: {e}")
             return self._get_default_processing_rules()
@@ -239,6 +524,39 @@ class ConfigManager:
             self.logger.error(f"Error al cargar reglas de procesamiento: {e}")
             return self._get_default_processing_rules()
 
+    def _read_processing_rules(
+        self, rules_file: str, rules_stat: os.stat_result
+    ) -> Dict[str, Any]:
+        """
+        Lee las reglas de procesamiento evitando releer el archivo
+
+        Dentro del mismo proceso se reutilizan las reglas ya parseadas mientras
+        el tamaño y mtime del JSON no cambien. No se guarda ningún caché en
+        disco: las reglas solo se cargan desde el propio JSON. Cada llamada
+        recibe una copia de las reglas, por lo que modificarlas no afecta a
+        otras instancias.
+
+        Args:
+            rules_file: Ruta a processing_rules.json
+            rules_stat: Resultado de stat() del archivo
+
+        Returns:
+            Diccionario con las reglas de procesamiento
+        """
+        signature = (rules_stat.st_size, rules_stat.st_mtime_ns)
+        memo_key = os.path.abspath(rules_file)
+
+        memo = self._RULES_MEMO.get(memo_key)
+        if memo is not None and memo[0] == signature:
+            return copy.deepcopy(memo[1])
+
+        with open(rules_file, "rb") as f:
+            raw = f.read()
+
+        rules = orjson.loads(raw) if orjson else json.loads(raw.decode("utf-8"))
+        self._RULES_MEMO[memo_key] = (signature, rules)
+        return copy.deepcopy(rules)
+
     def _get_default_processing_rules(self) -> Dict[str, Any]:
         """Retorna reglas de procesamiento por defecto"""
         return {
@@ -255,59 +573,108 @@ class ConfigManager:
             },
         }
 
-    def _validate_configuration(self) -> None:
-        """Valida que la configuración sea correcta"""
-        try:
-            # Validar directorios
-            self._ensure_directories_exist()
+    @cached_property
+    def _flat_rules(self) -> Dict[str, Any]:
+        """Reglas de procesamiento aplanadas en claves punteadas"""
+        return dict(_flatten(self.processing_rules))
 
-            # Validar valores numéricos
-            if self.processing.max_file_size_mb <= 0:
-                raise ConfigurationError("MAX_FILE_SIZE_MB debe ser mayor a 0")
+    def rule(self, path: str, default: Any = None) -> Any:
+        """
+        Obtiene un valor de las reglas de procesamiento por su ruta punteada
 
-            if self.processing.batch_size <= 0:
-                raise ConfigurationError("BATCH_SIZE debe ser mayor a 0")
+        Equivale a encadenar .get() sobre processing_rules, pero con una sola
+        búsqueda. Solo las hojas (valores que no son diccionarios) tienen ruta.
 
-            if not 0 <= self.validation.min_quality_score <= 1:
-                raise ConfigurationError("MIN_QUALITY_SCORE debe estar entre 0 y 1")
+        Args:
+            path: Ruta del valor, p. ej. "processing_rules.cleaning_rules.remove_duplicates"
+            default: Valor a retornar si la ruta no existe
 
-            # Validar configuración de email si está habilitada
-            if self.notifications.enable_email_notifications:
-                if not self.notifications.email_host:
-                    raise ConfigurationError(
-                        "EMAIL_HOST requerido cuando email notifications está habilitado"
-                    )
-                if not self.notifications.email_user:
-                    raise ConfigurationError(
-                        "EMAIL_USER requerido cuando email notifications está habilitado"
-                    )
+        Returns:
+            Valor de la regla o default
+        """
+        return self._flat_rules.get(path, default)
 
-            self.logger.info("Configuración validada exitosamente")
+    def validate(self) -> None:
+        """
+        Carga y valida todas las secciones de configuración
 
-        except Exception as e:
-            self.logger.error(f"Error en validación de configuración: {e}")
-            raise
+        Las secciones se validan por separado al accederse por primera vez;
+        este método fuerza la carga de todas para detectar errores de una vez.
+
+        Raises:
+            ConfigurationError: Si algún valor de configuración es inválido
+        """
+        self.paths
+        self.processing
+        self.validation
+        self.logging_config
+        self.notifications
+        self.processing_rules
+
+        self.logger.info("Configuración validada exitosamente")
+
+    def _check_section(self, section: str, config: Any) -> Any:
+        """
+        Ejecuta las validaciones de una sección recién cargada
+
+        Args:
+            section: Nombre de la sección en _SECTION_VALIDATORS
+            config: Configuración cargada de la sección
+
+        Returns:
+            La misma configuración, si es válida
+
+        Raises:
+            ConfigurationError: Con el mensaje de la primera validación fallida
+        """
+        for is_valid, message in _SECTION_VALIDATORS.get(section, ()):
+            if not is_valid(config):
+                self.logger.error(f"Error en validación de configuración: {message}")
+                raise ConfigurationError(message)
+        return config
 
-    def _ensure_directories_exist(self) -> None:
-        """Asegura que los directorios necesarios existan"""
+    def _ensure_directories_exist(self, paths: PathConfig) -> None:
+        """
+        Asegura que los directorios necesarios existan
+
+        Cada directorio se comprueba una sola vez por proceso; solo se llama a
+        mkdir si todavía no existe.
+        """
         directories = [
-            self.paths.input_directory,
-            self.paths.output_directory,
-            self.paths.temp_directory,
-            self.paths.log_directory,
+            paths.input_directory,
+            paths.output_directory,
+            paths.temp_directory,
+            paths.log_directory,
         ]
 
         for directory in directories:
+            key = os.path.abspath(directory)
+            if key in _VERIFIED_DIRS:
+                continue
+
             try:
-                directory.mkdir(parents=True, exist_ok=True)
-                self.logger.debug(f"Directorio asegurado: {directory}")
+                if not os.path.isdir(key):
+                    os.makedirs(key, exist_ok=True)
+                _VERIFIED_DIRS.add(key)
+                self.logger.debug("Directorio asegurado: %s", directory)
             except Exception as e:
                 raise ConfigurationError(
                     f"No se pudo crear directorio {directory}: {e}"
                 )
 
     def get_config_summary(self) -> Dict[str, Any]:
-        """Retorna un resumen de la configuración actual"""
+        """
+        Retorna un resumen de la configuración actual
+
+        El resumen se construye una sola vez y se reutiliza hasta que
+        update_config() modifique la configuración.
+        """
+        if self._config_summary is None:
+            self._config_summary = self._build_config_summary()
+        return self._config_summary
+
+    def _build_config_summary(self) -> Dict[str, Any]:
+        """Construye el resumen de la configuración actual"""
         return {
             "paths": {
                 "input_directory": str(self.paths.input_directory),
@@ -320,6 +687,9 @@ class ConfigManager:
                 "batch_size": self.processing.batch_size,
                 "default_encoding": self.processing.default_encoding,
                 "cpu_cores": self.processing.cpu_cores,
+                "csv_engine": self.processing.csv_engine,
+                "encoding_backend": self.processing.encoding_backend,
+                "dtype_backend": self.processing.dtype_backend,
             },
             "validation": {
                 "strict_validation": self.validation.strict_validation,
@@ -340,6 +710,9 @@ class ConfigManager:
         """
         Actualiza un valor de configuración dinámicamente
 
+        Las secciones son inmutables, así que se reemplaza la sección completa
+        por una copia con el nuevo valor.
+
         Args:
             section: Sección de configuración (paths, processing, validation, etc.)
             key: Clave a actualizar
@@ -352,9 +725,14 @@ class ConfigManager:
 
             if hasattr(config_section, key):
                 old_value = getattr(config_section, key)
-                setattr(config_section, key, value)
+                setattr(self, section, replace(config_section, **{key: value}))
+                self._config_summary = None
                 self.logger.info(
-                    f"Configuración actualizada: {section}.{key} = {value} (anterior: {old_value})"
+                    "Configuración actualizada: %s.%s = %s (anterior: %s)",
+                    section,
+                    key,
+                    value,
+                    old_value,
                 )
             else:
                 raise ValueError(f"Clave '{key}' no encontrada en sección '{section}'")
@@ -373,6 +751,23 @@ class ConfigurationError(Exception):
 # === FUNCIONES DE UTILIDAD ===
 
 
+# Directivas de strftime que dependen de la hora, no solo de la fecha
+_TIME_DIRECTIVES = ("%H", "%I", "%M", "%S", "%f", "%p", "%X", "%c", "%s")
+
+
+@lru_cache(maxsize=8)
+def _daily_log_filename(pattern: str, day: date) -> str:
+    """Formatea un nombre de log diario una sola vez por patrón y día"""
+    return day.strftime(pattern)
+
+
+def _log_filename(pattern: str) -> str:
+    """Retorna el nombre del archivo de log actual según el patrón"""
+    if any(directive in pattern for directive in _TIME_DIRECTIVES):
+        return datetime.now().strftime(pattern)
+    return _daily_log_filename(pattern, date.today())
+
+
 def setup_logging(config_manager: ConfigManager) -> logging.Logger:
     """
     Configura el sistema de logging basado en la configuración
@@ -389,9 +784,14 @@ def setup_logging(config_manager: ConfigManager) -> logging.Logger:
     # Crear directorio de logs si no existe
     log_dir.mkdir(parents=True, exist_ok=True)
 
+    # getLevelName retorna "Level X" (str) para nombres desconocidos
+    level = logging.getLevelName(log_config.log_level.upper())
+    if not isinstance(level, int):
+        level = logging.INFO
+
     # Configurar el logger principal
     logger = logging.getLogger()
-    logger.setLevel(getattr(logging, log_config.log_level.upper()))
+    logger.setLevel(level)
 
     # Limpiar handlers existentes
     for handler in logger.handlers[:]:
@@ -406,21 +806,18 @@ def setup_logging(config_manager: ConfigManager) -> logging.Logger:
     # Handler para consola
     if log_config.console_logging:
         console_handler = logging.StreamHandler()
-        console_handler.setLevel(getattr(logging, log_config.log_level.upper()))
+        console_handler.setLevel(level)
         console_handler.setFormatter(formatter)
         logger.addHandler(console_handler)
 
     # Handler para archivo con rotación
-    from logging.handlers import RotatingFileHandler
-    from datetime import datetime
-
-    log_file = log_dir / datetime.now().strftime(log_config.log_file_pattern)
+    log_file = log_dir / _log_filename(log_config.log_file_pattern)
     file_handler = RotatingFileHandler(
         log_file,
         maxBytes=log_config.log_max_size_mb * 1024 * 1024,
         backupCount=log_config.log_backup_count,
     )
-    file_handler.setLevel(getattr(logging, log_config.log_level.upper()))
+    file_handler.setLevel(level)
     file_handler.setFormatter(formatter)
     logger.addHandler(file_handler)
 
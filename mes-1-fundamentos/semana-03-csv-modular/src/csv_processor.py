@@ -23,26 +23,115 @@ from datetime import datetime
 import chardet
 import csv
 import io
+import mmap
 import json
+import re
+from contextlib import contextmanager
 from dataclasses import dataclass, field
 
+try:
+    import cchardet
+except ImportError:  # cchardet es opcional; se usa chardet
+    cchardet = None
+
+try:
+    import charset_normalizer
+except ImportError:  # charset_normalizer es opcional; se usa chardet
+    charset_normalizer = None
+
+try:
+    import orjson
+except ImportError:  # orjson es opcional; se usa json de la librería estándar
+    orjson = None
+
 from .config_manager import ConfigManager
+from .utils import json_default, read_csv_arrow, read_csv_polars
+
+# Caracteres no permitidos en nombres de columna normalizados (\w incluye
+# letras acentuadas, igual que str.isalnum)
+_COLUMN_NAME_INVALID_RE = re.compile(r"[^\w]+")
+
+
+# Marcas de orden de bytes (BOM) y su encoding; UTF-32 antes que UTF-16
+# porque el BOM de UTF-32 LE empieza igual que el de UTF-16 LE
+_BOM_ENCODINGS = (
+    (b"\xff\xfe\x00\x00", "utf-32"),
+    (b"\x00\x00\xfe\xff", "utf-32"),
+    (b"\xef\xbb\xbf", "utf-8-sig"),
+    (b"\xff\xfe", "utf-16"),
+    (b"\xfe\xff", "utf-16"),
+)
+
+# Lectores alternativos a pandas según CSV_ENGINE: (librería, función)
+_CSV_READERS = {
+    "arrow": ("pyarrow", read_csv_arrow),
+    "polars": ("polars", read_csv_polars),
+}
+
+# Extensiones de salida soportadas por _save_processed_data
+_OUTPUT_SUFFIXES = (".csv", ".xlsx", ".xls", ".json", ".parquet", ".feather")
+
+# Máximo de bytes a analizar para detectar el encoding
+_ENCODING_SAMPLE_BYTES = 64 * 1024
+
+# Caracteres de muestra para detectar el delimitador
+_SNIFF_SAMPLE_CHARS = 5000
+
+# Tamaño a partir del cual CSV_ENGINE=arrow lee el archivo por lotes
+_LARGE_FILE_MB = 50
+
+# Valores de texto que se interpretan como nulos al leer un CSV
+NA_VALUES = ("", "NULL", "null", "None", "N/A", "n/a", "#N/A")
+
+# Textos reconocidos como booleanos en la detección de tipos
+_BOOLEAN_VALUES = {
+    "true": True,
+    "false": False,
+    "1": True,
+    "0": False,
+    "yes": True,
+    "no": False,
+}
+_BOOLEAN_TEXTS = frozenset(_BOOLEAN_VALUES)
+
+# Grupos de dtypes para select_dtypes (incluyen las variantes nullable y Arrow)
+_NUMERIC_DTYPES = ["number"]
+_TEXT_DTYPES = ["object", "string"]
+_DATETIME_DTYPES = ["datetime", "datetimetz"]
+
+# Prefiltro de la detección de fechas: separadores de fecha/hora o un año
+_DATE_HINT_RE = re.compile(r"[-/:]|\d{4}")
+_DATE_PROBE_SAMPLE_SIZE = 64
+
+
+@contextmanager
+def _map_file(file_path: Path):
+    """
+    Mapea un archivo en memoria en modo lectura
+
+    Si no se puede mapear (archivo vacío o sin soporte de mmap) se entrega un
+    prefijo del archivo leído de forma normal.
+
+    Args:
+        file_path: Ruta del archivo
+
+    Yields:
+        mmap.mmap o bytes con el contenido del archivo
+    """
+    with open(file_path, "rb") as f:
+        try:
+            mapped = mmap.mmap(f.fileno(), 0, access=mmap.ACCESS_READ)
+        except (ValueError, OSError):
+            yield f.read(_ENCODING_SAMPLE_BYTES)
+            return
 
+        with mapped:
+            yield mapped
 
-def convert_numpy_types(obj):
-    """Convierte tipos numpy a tipos nativos de Python para serialización JSON"""
-    if isinstance(obj, np.integer):
-        return int(obj)
-    elif isinstance(obj, np.floating):
-        return float(obj)
-    elif isinstance(obj, np.ndarray):
-        return obj.tolist()
-    elif isinstance(obj, dict):
-        return {key: convert_numpy_types(value) for key, value in obj.items()}
-    elif isinstance(obj, (list, tuple)):
-        return [convert_numpy_types(item) for item in obj]
-    else:
-        return obj
+
+def _is_text_dtype(dtype) -> bool:
+    """Indica si el dtype es de texto (object, string o string de Arrow)"""
+    return dtype == "object" or pd.api.types.is_string_dtype(dtype)
 
 
 @dataclass
@@ -85,6 +174,46 @@ class ProcessingStats:
         }
 
 
+@dataclass(slots=True, frozen=True)
+class ResolvedRules:
+    """Reglas de procesamiento resueltas a partir de processing_rules.json"""
+
+    normalize_names: bool = True
+    remove_duplicates: bool = True
+    auto_detect_types: bool = True
+    missing_strategy: str = "smart"
+    strip_whitespace: bool = True
+    normalize_case: bool = False
+    min_rows: int = 1
+
+    @classmethod
+    def from_processing_rules(cls, rules: Dict[str, Any]) -> "ResolvedRules":
+        """
+        Recorre una sola vez los diccionarios anidados de reglas
+
+        Args:
+            rules: Sección "processing_rules" de las reglas de procesamiento
+
+        Returns:
+            Reglas resueltas con los valores por defecto aplicados
+        """
+        cleaning_rules = rules.get("cleaning_rules", {})
+        text_rules = cleaning_rules.get("text_cleaning", {})
+        return cls(
+            normalize_names=rules.get("transformation_rules", {})
+            .get("normalize_names", {})
+            .get("enabled", True),
+            remove_duplicates=cleaning_rules.get("remove_duplicates", True),
+            auto_detect_types=rules.get("data_types", {}).get("auto_detect", True),
+            missing_strategy=cleaning_rules.get("handle_missing_values", {}).get(
+                "strategy", "smart"
+            ),
+            strip_whitespace=text_rules.get("strip_whitespace", True),
+            normalize_case=text_rules.get("normalize_case", False),
+            min_rows=rules.get("validation_rules", {}).get("min_rows", 1),
+        )
+
+
 @dataclass
 class CSVMetadata:
     """Metadatos del archivo CSV procesado"""
@@ -99,6 +228,9 @@ class CSVMetadata:
     column_names: List[str] = field(default_factory=list)
     data_types: Dict[str, str] = field(default_factory=dict)
     processing_timestamp: str = ""
+    # Ruta realmente escrita (puede diferir de la solicitada si se cambió
+    # el formato); ya se guarda como "output_file" en el JSON de metadatos
+    output_path: str = ""
 
     def to_dict(self) -> Dict[str, Any]:
         """Convierte los metadatos a diccionario"""
@@ -137,6 +269,9 @@ class CSVProcessor:
             "processing_rules", {}
         )
         self.output_rules = config_manager.processing_rules.get("output_rules", {})
+        self.rules = ResolvedRules.from_processing_rules(self.processing_rules)
+        # Sniffer reutilizado entre archivos (no guarda estado entre llamadas)
+        self._sniffer = csv.Sniffer()
 
         self.logger.info("CSVProcessor inicializado correctamente")
 
@@ -194,7 +329,10 @@ class CSVProcessor:
         # Guardar resultado si se especifica ruta de salida
         if output_path:
             output_path = Path(output_path)
-            self._save_processed_data(df_processed, output_path, metadata, stats)
+            written_path = self._save_processed_data(
+                df_processed, output_path, metadata, stats
+            )
+            metadata.output_path = str(written_path)
 
         self.logger.info(
             f"Procesamiento completado en {stats.processing_time_seconds:.2f}s"
@@ -220,39 +358,114 @@ class CSVProcessor:
         if file_path.suffix.lower() not in [".csv", ".txt"]:
             self.logger.warning(f"Extensión de archivo inusual: {file_path.suffix}")
 
+    def analyze_file(self, file_path: Union[str, Path]) -> CSVMetadata:
+        """
+        Detecta encoding, delimitador y encabezado de un archivo sin cargarlo
+
+        Args:
+            file_path: Ruta del archivo CSV
+
+        Returns:
+            CSVMetadata con las características detectadas
+        """
+        return self._analyze_file(Path(file_path))
+
     def _analyze_file(self, file_path: Path) -> CSVMetadata:
         """Analiza el archivo CSV para detectar sus características"""
         metadata = CSVMetadata()
         metadata.filename = file_path.name
         metadata.file_size_mb = file_path.stat().st_size / 1024 / 1024
 
-        # Detectar encoding
-        with open(file_path, "rb") as f:
-            raw_data = f.read(10000)  # Leer primeros 10KB
-            encoding_result = chardet.detect(raw_data)
-            metadata.detected_encoding = encoding_result["encoding"] or "utf-8"
+        # Una sola apertura del archivo: encoding y delimitador se detectan
+        # sobre el mismo mapeo en memoria
+        with _map_file(file_path) as data:
+            # Detectar encoding
+            metadata.detected_encoding = self._detect_encoding_from_bytes(data)
             metadata.encoding = metadata.detected_encoding
 
+            # Muestra de texto para detectar el delimitador (hasta 4 bytes por
+            # carácter); los saltos de línea se normalizan como en modo texto
+            sample = (
+                data[: _SNIFF_SAMPLE_CHARS * 4]
+                .decode(metadata.encoding, errors="ignore")[:_SNIFF_SAMPLE_CHARS]
+                .replace("\r\n", "\n")
+                .replace("\r", "\n")
+            )
+
         # Detectar delimitador
-        with open(file_path, "r", encoding=metadata.encoding, errors="ignore") as f:
-            sample = f.read(5000)  # Leer muestra para detección
-            sniffer = csv.Sniffer()
-            try:
-                dialect = sniffer.sniff(sample, delimiters=",;\t|")
-                metadata.detected_delimiter = dialect.delimiter
-                metadata.delimiter = metadata.detected_delimiter
-                metadata.has_header = sniffer.has_header(sample)
-            except csv.Error:
-                # Usar valores por defecto si la detección falla
-                metadata.delimiter = self.config.processing.default_delimiter
-                metadata.detected_delimiter = metadata.delimiter
-                metadata.has_header = True
+        try:
+            dialect = self._sniffer.sniff(sample, delimiters=",;\t|")
+            metadata.detected_delimiter = dialect.delimiter
+            metadata.delimiter = metadata.detected_delimiter
+            metadata.has_header = self._sniffer.has_header(sample)
+        except csv.Error:
+            # Usar valores por defecto si la detección falla
+            metadata.delimiter = self.config.processing.default_delimiter
+            metadata.detected_delimiter = metadata.delimiter
+            metadata.has_header = True
 
         self.logger.info(
             f"Archivo analizado - Encoding: {metadata.encoding}, Delimitador: '{metadata.delimiter}'"
         )
         return metadata
 
+    def _detect_encoding(self, file_path: Path) -> str:
+        """
+        Detecta el encoding del archivo
+
+        Args:
+            file_path: Ruta del archivo
+
+        Returns:
+            Nombre del encoding detectado
+        """
+        with _map_file(file_path) as data:
+            return self._detect_encoding_from_bytes(data)
+
+    def _detect_encoding_from_bytes(self, data: Union[bytes, mmap.mmap]) -> str:
+        """
+        Detecta el encoding del contenido de un archivo
+
+        Si el contenido empieza con un BOM se usa directamente. Si no, se usa el
+        detector configurado en ENCODING_BACKEND: cchardet o charset_normalizer
+        analizan una muestra de _ENCODING_SAMPLE_BYTES; chardet se alimenta por
+        bloques hasta que esté seguro del resultado o se alcance ese límite.
+
+        Args:
+            data: Contenido del archivo (bytes o mapeo en memoria)
+
+        Returns:
+            Nombre del encoding detectado
+        """
+        head = data[:4]
+        for bom, encoding in _BOM_ENCODINGS:
+            if head.startswith(bom):
+                return encoding
+
+        backend = self.config.processing.encoding_backend
+        if backend == "auto":
+            backend = "cchardet" if cchardet is not None else "chardet"
+
+        if backend == "cchardet" and cchardet is not None:
+            return cchardet.detect(data[:_ENCODING_SAMPLE_BYTES])["encoding"] or "utf-8"
+
+        if backend == "charset_normalizer" and charset_normalizer is not None:
+            best = charset_normalizer.from_bytes(data[:_ENCODING_SAMPLE_BYTES]).best()
+            return best.encoding if best is not None else "utf-8"
+
+        if backend != "chardet":
+            self.logger.warning(f"{backend} no disponible, usando chardet")
+
+        detector = chardet.UniversalDetector()
+        limit = min(len(data), _ENCODING_SAMPLE_BYTES)
+        for offset in range(0, limit, 8192):
+            detector.feed(data[offset : min(offset + 8192, limit)])
+            if detector.done:
+                break
+        detector.close()
+
+        return detector.result["encoding"] or "utf-8"
+
     def _load_csv(self, file_path: Path, metadata: CSVMetadata) -> pd.DataFrame:
         """Carga el archivo CSV usando los parámetros detectados"""
         try:
@@ -263,26 +476,53 @@ class CSVProcessor:
                 "delimiter": metadata.delimiter,
                 "header": 0 if metadata.has_header else None,
                 "low_memory": False,  # Para mejor detección de tipos
-                "na_values": ["", "NULL", "null", "None", "N/A", "n/a", "#N/A"],
+                "na_values": list(NA_VALUES),
                 "keep_default_na": True,
             }
-
-            # Cargar en chunks si el archivo es muy grande
-            if metadata.file_size_mb > 50:  # Para archivos > 50MB
-                self.logger.info("Archivo grande detectado, cargando en chunks")
-                chunks = []
-                chunk_size = self.config.processing.batch_size
-
-                for chunk in pd.read_csv(chunksize=chunk_size, **load_params):
-                    chunks.append(chunk)
-                    if len(chunks) % 10 == 0:  # Log cada 10 chunks
-                        self.logger.info(
-                            f"Cargados {len(chunks) * chunk_size} registros..."
-                        )
-
-                df = pd.concat(chunks, ignore_index=True)
-            else:
-                df = pd.read_csv(**load_params)
+            dtype_backend = self.config.processing.dtype_backend
+            if dtype_backend == "pyarrow":
+                # Columnas respaldadas por Arrow (DTYPE_BACKEND=pyarrow)
+                load_params["dtype_backend"] = "pyarrow"
+
+            # Lector multihilo de PyArrow o Polars si está configurado
+            # (CSV_ENGINE=arrow o CSV_ENGINE=polars)
+            csv_engine = self.config.processing.csv_engine
+            if csv_engine in _CSV_READERS:
+                library, reader = _CSV_READERS[csv_engine]
+                reader_params = {}
+                if csv_engine == "arrow" and metadata.file_size_mb > _LARGE_FILE_MB:
+                    # Lector en streaming de pyarrow: los lotes se unen sin copiar
+                    self.logger.info("Archivo grande detectado, cargando por lotes")
+                    reader_params["streaming"] = True
+                try:
+                    df = reader(
+                        file_path,
+                        encoding=metadata.encoding,
+                        delimiter=metadata.delimiter,
+                        has_header=metadata.has_header,
+                        na_values=load_params["na_values"],
+                        dtype_backend=dtype_backend,
+                        **reader_params,
+                    )
+                    self.logger.info(
+                        f"CSV cargado con {library}: {len(df)} filas, {len(df.columns)} columnas"
+                    )
+                    return df
+                except ImportError:
+                    self.logger.warning(
+                        f"{library} no disponible, usando pandas para cargar el CSV"
+                    )
+                except ValueError as e:
+                    # pyarrow.ArrowInvalid o error de polars: p. ej. filas con
+                    # menos campos que el encabezado, que pandas sí acepta
+                    self.logger.warning(
+                        f"{library} no pudo parsear el CSV ({e}), usando pandas"
+                    )
+
+            # Una sola lectura con pandas, sea cual sea el tamaño: los tipos y
+            # nombres de columnas no dependen del tamaño del archivo, y no se
+            # acumulan chunks que luego haya que concatenar
+            df = pd.read_csv(**load_params)
 
             self.logger.info(
                 f"CSV cargado: {len(df)} filas, {len(df.columns)} columnas"
@@ -306,15 +546,15 @@ class CSVProcessor:
         self, df: pd.DataFrame, stats: ProcessingStats, profile: str
     ) -> pd.DataFrame:
         """Aplica el pipeline completo de procesamiento"""
-        df_processed = df.copy()
+        # Copia superficial: los pasos siguientes reemplazan columnas completas o
+        # devuelven DataFrames nuevos, así que no hace falta duplicar los datos
+        df_processed = df.copy(deep=False)
 
         # 1. Limpieza inicial
         df_processed = self._clean_column_names(df_processed)
 
         # 2. Manejo de duplicados
-        if self.processing_rules.get("cleaning_rules", {}).get(
-            "remove_duplicates", True
-        ):
+        if self.rules.remove_duplicates:
             original_count = len(df_processed)
             df_processed = df_processed.drop_duplicates()
             stats.duplicates_removed = original_count - len(df_processed)
@@ -342,78 +582,66 @@ class CSVProcessor:
 
     def _clean_column_names(self, df: pd.DataFrame) -> pd.DataFrame:
         """Limpia y normaliza los nombres de columnas"""
-        if (
-            self.processing_rules.get("transformation_rules", {})
-            .get("normalize_names", {})
-            .get("enabled", True)
-        ):
-            # Convertir a snake_case
-            new_columns = []
-            for col in df.columns:
-                # Limpiar espacios y caracteres especiales
-                clean_col = str(col).strip()
-                clean_col = clean_col.replace(" ", "_").replace("-", "_")
-                clean_col = "".join(c for c in clean_col if c.isalnum() or c == "_")
-                clean_col = clean_col.lower()
-                new_columns.append(clean_col)
-
-            df.columns = new_columns
+        if self.rules.normalize_names:
+            # Convertir a snake_case con operaciones de texto vectorizadas
+            df.columns = (
+                pd.Index(df.columns)
+                .astype(str)
+                .str.strip()
+                .str.replace(" ", "_", regex=False)
+                .str.replace("-", "_", regex=False)
+                .str.replace(_COLUMN_NAME_INVALID_RE, "", regex=True)
+                .str.lower()
+            )
             self.logger.debug("Nombres de columnas normalizados")
 
         return df
 
     def _detect_and_convert_types(self, df: pd.DataFrame) -> pd.DataFrame:
         """Detecta y convierte tipos de datos automáticamente"""
-        if not self.processing_rules.get("data_types", {}).get("auto_detect", True):
+        if not self.rules.auto_detect_types:
             return df
 
         for column in df.columns:
             try:
                 # Intentar conversión a numérico
-                if df[column].dtype == "object":
+                if _is_text_dtype(df[column].dtype):
                     # Verificar si puede ser numérico
-                    numeric_series = pd.to_numeric(df[column], errors="coerce")
+                    text_series = df[column]
+                    if isinstance(text_series.dtype, pd.ArrowDtype):
+                        # pd.to_numeric no convierte los errores a nulos con
+                        # ArrowDtype; StringDtype("pyarrow") comparte el buffer
+                        text_series = text_series.astype("string[pyarrow]")
+                    numeric_series = pd.to_numeric(text_series, errors="coerce")
                     non_null_ratio = numeric_series.notna().sum() / len(df[column])
 
                     if non_null_ratio > 0.8:  # Si >80% son números válidos
-                        if numeric_series.apply(
-                            lambda x: x == int(x) if pd.notna(x) else True
-                        ).all():
-                            df[column] = numeric_series.astype(
-                                "Int64"
-                            )  # Nullable integer
-                        else:
-                            df[column] = numeric_series.astype("float64")
+                        # Comprobación vectorizada de que todos son enteros
+                        values = numeric_series.dropna().to_numpy(dtype="float64")
+                        is_int = bool(
+                            np.isfinite(values).all() and (np.mod(values, 1) == 0).all()
+                        )
+                        df[column] = numeric_series.astype(
+                            "Int64" if is_int else "float64"
+                        )  # Int64: entero nullable
                         continue
 
-                    # Intentar conversión a datetime
-                    try:
+                    # Intentar conversión a datetime, salvo que una muestra de
+                    # valores no tenga ningún separador de fecha/hora ni año
+                    sample = df[column].dropna().head(_DATE_PROBE_SAMPLE_SIZE)
+                    if sample.astype(str).str.contains(_DATE_HINT_RE).any():
+                        # errors="coerce" convierte los valores no válidos en NaT;
+                        # cualquier otro error lo registra el except exterior
                         date_series = pd.to_datetime(df[column], errors="coerce")
                         date_ratio = date_series.notna().sum() / len(df[column])
 
                         if date_ratio > 0.8:  # Si >80% son fechas válidas
                             df[column] = date_series
                             continue
-                    except:
-                        pass
 
                     # Intentar conversión a boolean
-                    if (
-                        df[column]
-                        .dropna()
-                        .str.lower()
-                        .isin(["true", "false", "1", "0", "yes", "no"])
-                        .all()
-                    ):
-                        bool_map = {
-                            "true": True,
-                            "false": False,
-                            "1": True,
-                            "0": False,
-                            "yes": True,
-                            "no": False,
-                        }
-                        df[column] = df[column].str.lower().map(bool_map)
+                    if df[column].dropna().str.lower().isin(_BOOLEAN_TEXTS).all():
+                        df[column] = df[column].str.lower().map(_BOOLEAN_VALUES)
                         continue
 
             except Exception as e:
@@ -425,36 +653,40 @@ class CSVProcessor:
 
     def _handle_missing_values(self, df: pd.DataFrame) -> Tuple[pd.DataFrame, int]:
         """Maneja valores faltantes según la estrategia configurada"""
-        missing_strategy = self.processing_rules.get("cleaning_rules", {}).get(
-            "handle_missing_values", {}
-        )
-        strategy = missing_strategy.get("strategy", "smart")
-
         filled_count = 0
 
-        if strategy == "smart":
-            for column in df.columns:
-                missing_count = df[column].isna().sum()
-                if missing_count == 0:
-                    continue
-
-                if df[column].dtype in ["int64", "Int64", "float64"]:
-                    # Para columnas numéricas, usar mediana
-                    fill_value = df[column].median()
-                    df[column] = df[column].fillna(fill_value)
-                    filled_count += missing_count
-
-                elif df[column].dtype == "object":
-                    # Para columnas de texto, usar moda o valor más frecuente
-                    mode_values = df[column].mode()
-                    if len(mode_values) > 0:
-                        df[column] = df[column].fillna(mode_values.iloc[0])
-                        filled_count += missing_count
-
-                elif "datetime" in str(df[column].dtype):
-                    # Para fechas, usar forward fill
-                    df[column] = df[column].ffill()
-                    filled_count += missing_count
+        if self.rules.missing_strategy == "smart":
+            missing_counts = df.isna().sum()
+
+            # Agrupar una sola vez las columnas con faltantes por tipo de dato
+            def with_missing(include) -> List[str]:
+                columns = df.select_dtypes(include=include).columns
+                return [column for column in columns if missing_counts[column] > 0]
+
+            numeric_columns = with_missing(_NUMERIC_DTYPES)
+            text_columns = with_missing(_TEXT_DTYPES)
+            datetime_columns = with_missing(_DATETIME_DTYPES)
+
+            # Para columnas numéricas, usar mediana (todas en una sola llamada)
+            fill_values = (
+                df[numeric_columns].median().to_dict() if numeric_columns else {}
+            )
+
+            # Para columnas de texto, usar moda o valor más frecuente
+            for column in text_columns:
+                mode_values = df[column].mode()
+                if len(mode_values) > 0:
+                    fill_values[column] = mode_values.iloc[0]
+
+            if fill_values:
+                df = df.fillna(fill_values)
+
+            # Para fechas, usar forward fill
+            if datetime_columns:
+                df[datetime_columns] = df[datetime_columns].ffill()
+
+            handled_columns = list(fill_values) + datetime_columns
+            filled_count = int(missing_counts[handled_columns].sum())
 
         if filled_count > 0:
             self.logger.info(f"Valores faltantes manejados: {filled_count}")
@@ -463,15 +695,34 @@ class CSVProcessor:
 
     def _clean_text_data(self, df: pd.DataFrame) -> pd.DataFrame:
         """Limpia datos de texto"""
-        text_rules = self.processing_rules.get("cleaning_rules", {}).get(
-            "text_cleaning", {}
-        )
+        strip_whitespace = self.rules.strip_whitespace
+        normalize_case = self.rules.normalize_case
+
+        for column in df.select_dtypes(include=_TEXT_DTYPES).columns:
+            # select_dtypes también incluye tipos Arrow sin texto (p. ej. null)
+            if not _is_text_dtype(df[column].dtype):
+                continue
+
+            if isinstance(df[column].dtype, pd.ArrowDtype):
+                # Aplicar ambos kernels de pyarrow.compute sobre el buffer Arrow
+                # sin materializar una Serie intermedia
+                import pyarrow as pa
+                import pyarrow.compute as pc
+
+                values = pa.array(df[column])
+                if strip_whitespace:
+                    values = pc.utf8_trim_whitespace(values)
+                if normalize_case:
+                    values = pc.utf8_lower(values)
+                df[column] = pd.arrays.ArrowExtensionArray(values)
+                continue
 
-        for column in df.select_dtypes(include=["object"]).columns:
-            if text_rules.get("strip_whitespace", True):
-                df[column] = df[column].astype(str).str.strip()
+            if strip_whitespace:
+                if df[column].dtype == "object":
+                    df[column] = df[column].astype(str)
+                df[column] = df[column].str.strip()
 
-            if text_rules.get("normalize_case", False):
+            if normalize_case:
                 df[column] = df[column].str.lower()
 
         return df
@@ -480,14 +731,14 @@ class CSVProcessor:
         """Valida datos y filtra filas inválidas"""
         original_count = len(df)
 
-        # Filtrar filas completamente vacías
-        df = df.dropna(how="all")
-
-        # Aplicar validaciones específicas según reglas
-        validation_rules = self.processing_rules.get("validation_rules", {})
+        # Filtrar filas completamente vacías; en el caso habitual no hay
+        # ninguna y se evita crear un DataFrame nuevo
+        all_null_rows = df.isna().all(axis=1)
+        if all_null_rows.any():
+            df = df.loc[~all_null_rows]
 
         # Validar número mínimo de filas
-        min_rows = validation_rules.get("min_rows", 1)
+        min_rows = self.rules.min_rows
         if len(df) < min_rows:
             raise ValueError(
                 f"El archivo tiene menos filas que el mínimo requerido: {len(df)} < {min_rows}"
@@ -505,21 +756,21 @@ class CSVProcessor:
         if len(df) == 0:
             return 0.0
 
+        # Máscara de nulos calculada una sola vez para todas las métricas
+        null_mask = df.isna().to_numpy()
+
         # Métricas de calidad
-        completeness = df.count().sum() / (len(df) * len(df.columns))
+        completeness = (null_mask.size - null_mask.sum()) / (len(df) * len(df.columns))
 
         # Unicidad (promedio de unicidad por columna)
-        uniqueness_scores = []
-        for column in df.columns:
-            unique_ratio = df[column].nunique() / len(df)
-            uniqueness_scores.append(min(unique_ratio, 1.0))
-        uniqueness = np.mean(uniqueness_scores) if uniqueness_scores else 1.0
+        unique_ratios = (df.nunique() / len(df)).clip(upper=1.0).to_numpy()
+        uniqueness = np.mean(unique_ratios) if len(unique_ratios) else 1.0
 
         # Consistencia (basada en tipos de datos exitosos)
         consistency = 1.0  # Simplificado por ahora
 
         # Validez (filas sin valores nulos críticos)
-        validity = 1.0 - (df.isnull().any(axis=1).sum() / len(df))
+        validity = 1.0 - (null_mask.any(axis=1).sum() / len(df))
 
         # Puntuación ponderada
         quality_weights = self.config.processing_rules.get(
@@ -552,32 +803,80 @@ class CSVProcessor:
         output_path: Path,
         metadata: CSVMetadata,
         stats: ProcessingStats,
-    ) -> None:
-        """Guarda los datos procesados con metadatos"""
+    ) -> Path:
+        """
+        Guarda los datos procesados con metadatos
+
+        Returns:
+            Ruta realmente escrita; puede diferir de output_path si la
+            extensión no se reconoce o si se recurre a CSV sin pyarrow
+        """
         output_path = Path(output_path)
         output_path.parent.mkdir(parents=True, exist_ok=True)
 
-        # Determinar formato de salida
-        if output_path.suffix.lower() == ".csv":
+        # Determinar formato de salida; si la extensión no se reconoce se usa
+        # el formato por defecto de output_rules (Parquet)
+        suffix = output_path.suffix.lower()
+        if suffix not in _OUTPUT_SUFFIXES:
+            default_format = self.output_rules.get("default_format", "parquet")
+            suffix = f".{default_format}"
+            if suffix not in _OUTPUT_SUFFIXES:
+                suffix = ".csv"
+            requested_path = output_path
+            output_path = output_path.with_suffix(suffix)
+            self.logger.warning(
+                f"Extensión de salida no reconocida en {requested_path}, "
+                f"guardando como {output_path}"
+            )
+
+        if suffix == ".csv":
             self._save_as_csv(df, output_path)
-        elif output_path.suffix.lower() in [".xlsx", ".xls"]:
+        elif suffix in [".xlsx", ".xls"]:
             self._save_as_excel(df, output_path, metadata, stats)
-        elif output_path.suffix.lower() == ".json":
+        elif suffix == ".json":
             self._save_as_json(df, output_path)
         else:
-            # Por defecto, guardar como CSV
-            output_path = output_path.with_suffix(".csv")
-            self._save_as_csv(df, output_path)
+            try:
+                if suffix == ".parquet":
+                    self._save_as_parquet(df, output_path)
+                else:
+                    self._save_as_feather(df, output_path)
+            except ImportError:
+                self.logger.warning(
+                    f"pyarrow no disponible para {suffix}, guardando como "
+                    f"{output_path.with_suffix('.csv')}"
+                )
+                output_path = output_path.with_suffix(".csv")
+                self._save_as_csv(df, output_path)
 
         # Guardar metadatos y estadísticas
         self._save_metadata(output_path, metadata, stats)
 
         self.logger.info(f"Datos procesados guardados en: {output_path}")
+        return output_path
 
     def _save_as_csv(self, df: pd.DataFrame, output_path: Path) -> None:
         """Guarda DataFrame como CSV"""
         csv_rules = self.output_rules.get("formats", {}).get("csv", {})
 
+        # Escritor multihilo de PyArrow si está configurado (solo escribe UTF-8)
+        if csv_rules.get("engine", "pandas") == "arrow" and csv_rules.get(
+            "encoding", "utf-8"
+        ).lower().replace("-", "") in ("utf8", "utf_8"):
+            try:
+                self._save_as_csv_arrow(df, output_path, csv_rules)
+                return
+            except ImportError:
+                self.logger.warning(
+                    "pyarrow no disponible, guardando el CSV con pandas"
+                )
+            except (NotImplementedError, TypeError, ValueError) as e:
+                # pyarrow.ArrowNotImplementedError / ArrowTypeError /
+                # ArrowInvalid: columnas con tipos que Arrow no puede convertir
+                self.logger.warning(
+                    f"pyarrow no pudo convertir los datos ({e}), usando pandas"
+                )
+
         df.to_csv(
             output_path,
             sep=csv_rules.get("separator", ","),
@@ -585,6 +884,27 @@ class CSVProcessor:
             index=csv_rules.get("include_index", False),
         )
 
+    def _save_as_csv_arrow(
+        self, df: pd.DataFrame, output_path: Path, csv_rules: Dict[str, Any]
+    ) -> None:
+        """Guarda DataFrame como CSV con el escritor multihilo de PyArrow"""
+        import pyarrow as pa
+        import pyarrow.csv as pacsv
+
+        table = pa.Table.from_pandas(
+            df, preserve_index=csv_rules.get("include_index", False)
+        )
+        pacsv.write_csv(
+            table,
+            str(output_path),
+            write_options=pacsv.WriteOptions(
+                include_header=True,
+                batch_size=1 << 16,
+                delimiter=csv_rules.get("separator", ","),
+                quoting_style="needed",
+            ),
+        )
+
     def _save_as_excel(
         self,
         df: pd.DataFrame,
@@ -617,12 +937,48 @@ class CSVProcessor:
     def _save_as_json(self, df: pd.DataFrame, output_path: Path) -> None:
         """Guarda DataFrame como JSON"""
         json_rules = self.output_rules.get("formats", {}).get("json", {})
+        orient = json_rules.get("orient", "records")
+        indent = json_rules.get("indent", 2)
+
+        if orient != "records" or len(df) == 0:
+            df.to_json(output_path, orient=orient, indent=indent, date_format="iso")
+            return
+
+        # Escribir el array de registros por bloques de BATCH_SIZE filas para no
+        # materializar todo el JSON en memoria; cada bloque se serializa con
+        # to_json y se le quitan los corchetes exteriores
+        chunk_size = self.config.processing.batch_size
+        with open(output_path, "w", encoding="utf-8") as f:
+            f.write("[")
+            for start in range(0, len(df), chunk_size):
+                chunk_json = df.iloc[start : start + chunk_size].to_json(
+                    orient="records", indent=indent, date_format="iso"
+                )
+                if start:
+                    f.write(",")
+                f.write(chunk_json[1:-1].rstrip("\n"))
+            f.write("\n]" if indent else "]")
+
+    def _save_as_parquet(self, df: pd.DataFrame, output_path: Path) -> None:
+        """Guarda DataFrame como Parquet (columnar y comprimido, requiere pyarrow)"""
+        parquet_rules = self.output_rules.get("formats", {}).get("parquet", {})
 
-        df.to_json(
+        df.to_parquet(
             output_path,
-            orient=json_rules.get("orient", "records"),
-            indent=json_rules.get("indent", 2),
-            date_format="iso",
+            engine="pyarrow",
+            compression=parquet_rules.get("compression", "zstd"),
+            index=parquet_rules.get("include_index", False),
+            # Opciones de pyarrow.parquet.write_table
+            use_dictionary=parquet_rules.get("use_dictionary", True),
+            data_page_size=parquet_rules.get("data_page_size", 1 << 20),
+        )
+
+    def _save_as_feather(self, df: pd.DataFrame, output_path: Path) -> None:
+        """Guarda DataFrame como Feather (formato Arrow en disco, requiere pyarrow)"""
+        feather_rules = self.output_rules.get("formats", {}).get("feather", {})
+
+        df.reset_index(drop=True).to_feather(
+            output_path, compression=feather_rules.get("compression", "zstd")
         )
 
     def _save_metadata(
@@ -641,11 +997,25 @@ class CSVProcessor:
             },
         }
 
-        # Convertir tipos numpy a tipos JSON serializables
-        combined_data = convert_numpy_types(combined_data)
+        if orjson is not None:
+            # orjson serializa escalares y arrays numpy de forma nativa, sin
+            # recorrer la estructura en Python
+            metadata_path.write_bytes(
+                orjson.dumps(
+                    combined_data,
+                    default=json_default,
+                    option=orjson.OPT_SERIALIZE_NUMPY
+                    | orjson.OPT_INDENT_2
+                    | orjson.OPT_NON_STR_KEYS,
+                )
+            )
+            return
 
+        # json solo invoca el hook para los valores que no sabe serializar
         with open(metadata_path, "w", encoding="utf-8") as f:
-            json.dump(combined_data, f, indent=2, ensure_ascii=False)
+            json.dump(
+                combined_data, f, indent=2, ensure_ascii=False, default=json_default
+            )
 
     def get_processing_summary(
         self, stats: ProcessingStats, metadata: CSVMetadata
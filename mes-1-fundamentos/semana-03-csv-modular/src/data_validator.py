@@ -19,6 +19,7 @@ Versión: 1.0.0
 from dataclasses import dataclass, field
 from typing import Dict, List, Any, Optional, Callable, Union, Tuple
 from enum import Enum
+from functools import lru_cache
 import pandas as pd
 import numpy as np
 import re
@@ -39,6 +40,11 @@ def _safe_float_conversion(value: Any, default: float = 0.0) -> float:
     Returns:
         Valor convertido a float o valor por defecto
     """
+    # Camino rápido para los flotantes que devuelven las reducciones
+    value_type = value.__class__
+    if value_type is float or value_type is np.float64:
+        return float(value) if value == value else default
+
     if value is None or pd.isna(value):
         return default
 
@@ -59,6 +65,138 @@ def _safe_float_conversion(value: Any, default: float = 0.0) -> float:
         return default
 
 
+# Tipos de pandas compatibles con cada tipo esperado en esquemas y reglas
+_INTEGER_TYPES = frozenset({"int64", "int32", "int16", "int8"})
+_FLOAT_TYPES = frozenset({"float64", "float32"})
+_TEXT_TYPES = frozenset({"object", "string"})
+_BOOL_TYPES = frozenset({"bool"})
+_COMPATIBLE_TYPES: Dict[str, frozenset] = {
+    "int": _INTEGER_TYPES,
+    "integer": _INTEGER_TYPES,
+    "float": _FLOAT_TYPES,
+    "number": _INTEGER_TYPES | _FLOAT_TYPES,
+    "string": _TEXT_TYPES,
+    "text": _TEXT_TYPES,
+    "datetime": frozenset({"datetime64[ns]", "datetime64"}),
+    "bool": _BOOL_TYPES,
+    "boolean": _BOOL_TYPES,
+}
+
+
+@lru_cache(maxsize=256)
+def _types_compatible(actual_type: str, expected_type: str) -> bool:
+    """
+    Verificar la compatibilidad de tipos, cacheada por par de nombres de tipo
+
+    Args:
+        actual_type: Tipo de pandas de la columna (p. ej. 'int64')
+        expected_type: Tipo esperado según el esquema o la regla
+
+    Returns:
+        True si el tipo actual es compatible con el esperado
+    """
+    expected_lower = expected_type.lower()
+    compatible_types = _COMPATIBLE_TYPES.get(expected_lower)
+    if compatible_types is not None:
+        return actual_type in compatible_types
+
+    # Coincidencia directa
+    return actual_type.lower() == expected_lower
+
+
+def _null_count(series: pd.Series) -> int:
+    """
+    Contar valores nulos evitando recorrer la Serie cuando no es necesario
+
+    Los enteros y booleanos de numpy no pueden contener nulos y las columnas
+    Arrow (incluido string[pyarrow]) guardan el conteo de nulos en sus
+    metadatos; el resto se cuenta directamente sobre el arreglo subyacente.
+
+    Args:
+        series: Serie a analizar
+
+    Returns:
+        Número de valores nulos
+    """
+    dtype = series.dtype
+    if isinstance(dtype, np.dtype):
+        if dtype.kind in "iub":
+            return 0
+        if dtype.kind in "fc":
+            return int(np.count_nonzero(np.isnan(series.to_numpy())))
+        if dtype.kind in "mM":
+            return int(np.count_nonzero(np.isnat(series.to_numpy())))
+        return int(series.isna().sum())
+
+    array = series.array
+    if isinstance(array, pd.arrays.ArrowExtensionArray):
+        import pyarrow as pa
+
+        return pa.array(array).null_count
+
+    # Arreglos con máscara (Int64, Float64, boolean, ...)
+    return int(np.count_nonzero(array.isna()))
+
+
+def _distribution_stats(values: np.ndarray) -> Tuple[float, float, float, float]:
+    """
+    Calcular media, mediana, desviación estándar y asimetría en una sola pasada
+
+    Reproduce los resultados de pandas (desviación muestral y asimetría
+    ajustada de Fisher-Pearson) compartiendo las desviaciones respecto a la
+    media entre ambos cálculos.
+
+    Args:
+        values: Arreglo float64, con NaN en los valores faltantes
+
+    Returns:
+        Tupla (media, mediana, desviación estándar, asimetría); NaN cuando
+        no hay suficientes valores para calcularla
+    """
+    valid = values[~np.isnan(values)]
+    count = valid.size
+    if count == 0:
+        return np.nan, np.nan, np.nan, np.nan
+
+    mean = valid.sum() / count
+    median = float(np.median(valid))
+    deviations = valid - mean
+    squared = deviations * deviations
+    m2 = squared.sum()
+    m3 = (squared * deviations).sum()
+
+    std = np.sqrt(m2 / (count - 1)) if count > 1 else np.nan
+
+    # Igual que pandas: errores de coma flotante por debajo de 1e-14 son cero
+    m2 = 0.0 if abs(m2) < 1e-14 else m2
+    m3 = 0.0 if abs(m3) < 1e-14 else m3
+    if count < 3:
+        skewness = np.nan
+    elif m2 == 0:
+        skewness = 0.0
+    else:
+        skewness = (count * (count - 1) ** 0.5 / (count - 2)) * (m3 / m2**1.5)
+
+    return mean, median, std, skewness
+
+
+def _numeric_columns(df: pd.DataFrame) -> frozenset:
+    """
+    Obtener las columnas numéricas de un DataFrame consultando cada tipo una vez
+
+    Args:
+        df: DataFrame a analizar
+
+    Returns:
+        Conjunto con los nombres de las columnas numéricas
+    """
+    return frozenset(
+        column
+        for column, dtype in df.dtypes.items()
+        if pd.api.types.is_numeric_dtype(dtype)
+    )
+
+
 class ValidationLevel(Enum):
     """Niveles de severidad de validación"""
 
@@ -79,7 +217,36 @@ class ValidationType(Enum):
     STATISTICAL = "statistical"
 
 
-@dataclass
+# Tipos de regla que requieren que su columna exista en el DataFrame
+_COLUMN_RULE_TYPES = frozenset(
+    {
+        ValidationType.TYPE_CHECK,
+        ValidationType.RANGE_CHECK,
+        ValidationType.PATTERN_CHECK,
+        ValidationType.NULL_CHECK,
+        ValidationType.UNIQUE_CHECK,
+        ValidationType.STATISTICAL,
+    }
+)
+
+
+# Mensajes de las reglas que cuentan filas infractoras; se comparten con
+# finalize() para reconstruirlos a partir de los totales de todos los bloques
+_COUNT_MESSAGES = {
+    ValidationType.RANGE_CHECK: "Validación de rango para '{column}': {count} violaciones encontradas",
+    ValidationType.PATTERN_CHECK: "Validación de patrón para '{column}': {count} violaciones encontradas",
+    ValidationType.CUSTOM_RULE: "Validación personalizada: {count} filas no cumplen",
+}
+
+# Reglas que dependen de la distribución o del tipo de cada bloque y no se
+# pueden combinar entre bloques: en la validación por bloques se evalúan por
+# separado en cada uno
+_PER_CHUNK_RULE_TYPES = frozenset(
+    {ValidationType.TYPE_CHECK, ValidationType.STATISTICAL, ValidationType.CUSTOM_RULE}
+)
+
+
+@dataclass(slots=True)
 class ValidationRule:
     """Representa una regla de validación individual"""
 
@@ -92,7 +259,7 @@ class ValidationRule:
     custom_function: Optional[Callable] = None
 
 
-@dataclass
+@dataclass(slots=True)
 class ValidationResult:
     """Resultado de una verificación de validación"""
 
@@ -134,6 +301,22 @@ class ValidationReport:
         return self.errors == 0
 
 
+@dataclass
+class ChunkValidationState:
+    """Estado acumulado al validar un archivo por bloques"""
+
+    total_rows: int = 0
+    total_columns: int = 0
+    results: Dict[str, ValidationResult] = field(default_factory=dict)
+    null_counts: Dict[str, int] = field(default_factory=dict)
+    # Valores no nulos vistos y filas no nulas y nulas por columna con regla
+    # de unicidad
+    seen_values: Dict[str, set] = field(default_factory=dict)
+    non_null_rows: Dict[str, int] = field(default_factory=dict)
+    unique_null_rows: Dict[str, int] = field(default_factory=dict)
+    start_time: datetime = field(default_factory=datetime.now)
+
+
 class DataValidator:
     """
     Sistema completo de validación de datos para archivos CSV
@@ -160,6 +343,9 @@ class DataValidator:
         self.validation_rules: List[ValidationRule] = []
         self.schema: Dict[str, str] = {}
         self._custom_validators: Dict[str, Callable] = {}
+        self._pattern_cache: Dict[str, re.Pattern] = {}
+        # Máximo de filas afectadas que se guardan por regla
+        self.max_affected_rows: int = 1000
 
         # Cargar reglas de validación por defecto si hay configuración disponible
         if config_manager:
@@ -198,21 +384,36 @@ class DataValidator:
 
     def _load_rules_from_config(self, rules_config: List[Dict]):
         """Carga reglas de validación desde la configuración"""
-        for rule_config in rules_config:
-            try:
-                rule = ValidationRule(
-                    name=rule_config["name"],
-                    description=rule_config["description"],
-                    validation_type=ValidationType(rule_config["type"]),
-                    level=ValidationLevel(rule_config["level"]),
-                    column=rule_config.get("column"),
-                    parameters=rule_config.get("parameters", {}),
-                )
-                self.validation_rules.append(rule)
-            except Exception as e:
-                self.logger.error(
-                    f"Error cargando regla de validación {rule_config.get('name', 'unknown')}: {e}"
-                )
+        self.validation_rules.extend(
+            rule
+            for rule_config in rules_config
+            if (rule := self._build_rule(rule_config)) is not None
+        )
+
+    def _build_rule(self, rule_config: Dict) -> Optional[ValidationRule]:
+        """
+        Construye una regla a partir de su configuración
+
+        Args:
+            rule_config: Diccionario con la definición de la regla
+
+        Returns:
+            ValidationRule, o None si la configuración no es válida
+        """
+        try:
+            return ValidationRule(
+                name=rule_config["name"],
+                description=rule_config["description"],
+                validation_type=ValidationType(rule_config["type"]),
+                level=ValidationLevel(rule_config["level"]),
+                column=rule_config.get("column"),
+                parameters=rule_config.get("parameters", {}),
+            )
+        except Exception as e:
+            self.logger.error(
+                f"Error cargando regla de validación {rule_config.get('name', 'unknown')}: {e}"
+            )
+            return None
 
     def set_schema(self, schema: Dict[str, str]):
         """
@@ -240,7 +441,10 @@ class DataValidator:
 
         Args:
             name: Nombre del validador personalizado
-            validator_func: Función que toma (value, **kwargs) y devuelve bool
+            validator_func: Función que toma (value, **kwargs), donde value es la
+                columna completa (o el DataFrame si la regla no tiene columna), y
+                devuelve un bool, un dict con passed/message/details o una
+                máscara booleana por fila
         """
         self._custom_validators[name] = validator_func
         self.logger.info(f"Validador personalizado agregado: {name}")
@@ -256,16 +460,189 @@ class DataValidator:
             ValidationReport con los resultados de validación
         """
         start_time = datetime.now()
-        results: List[ValidationResult] = []
 
         self.logger.info(
             f"Iniciando validación de DataFrame con {len(df)} filas y {len(df.columns)} columnas"
         )
 
+        results = self._run_validation_rules(df, start_time)
+        return self._build_report(results, len(df), len(df.columns), start_time)
+
+    def validate_chunk(
+        self, df_chunk: pd.DataFrame, state: ChunkValidationState
+    ) -> ChunkValidationState:
+        """
+        Valida un bloque de un archivo y acumula el resultado en el estado
+
+        Las reglas que se pueden combinar entre bloques se evalúan sobre el
+        archivo completo al llamar a finalize(): las de nulos y unicidad a partir
+        de contadores acumulados, y las de rango, patrón y máscaras personalizadas
+        sumando sus filas infractoras. Las de tipo, esquema, estadísticas y
+        validadores personalizados que devuelven un único resultado dependen de
+        cada bloque: se consideran fallidas si fallan en cualquier bloque y el
+        reporte las marca como evaluadas por bloques.
+
+        Las reglas de unicidad guardan todos los valores distintos no nulos de
+        su columna, por lo que su memoria crece con la cardinalidad de la
+        columna y no queda acotada por el tamaño del bloque.
+
+        Args:
+            df_chunk: Bloque del DataFrame a validar
+            state: Estado acumulado de la validación
+
+        Returns:
+            Estado actualizado
+        """
+        for result in self._run_validation_rules(df_chunk, state.start_time):
+            name = result.rule_name
+            previous = state.results.get(name)
+
+            # Nulos: acumular el conteo; el resultado se recalcula en finalize()
+            if (
+                result.validation_type == ValidationType.NULL_CHECK
+                and "null_count" in result.details
+            ):
+                state.null_counts[name] = (
+                    state.null_counts.get(name, 0) + result.details["null_count"]
+                )
+                state.results.setdefault(name, result)
+                continue
+
+            if previous is None or (previous.passed and not result.passed):
+                state.results[name] = result
+            elif (
+                not result.passed
+                and result.validation_type in _COUNT_MESSAGES
+                and "total_violations" in result.details
+                and "total_violations" in previous.details
+            ):
+                # Reglas que cuentan filas: sumar las infracciones de cada bloque.
+                # Las estadísticas no se suman: sus porcentajes y umbrales son
+                # de cada bloque y se conserva el primer bloque que falla
+                room = max(self.max_affected_rows - len(previous.affected_rows), 0)
+                previous.affected_rows.extend(result.affected_rows[:room])
+                for key in ("total_violations", "violations", "failed_count"):
+                    if key in previous.details:
+                        previous.details[key] += result.details.get(key, 0)
+
+        # Registrar valores vistos para verificar unicidad entre bloques
+        for rule in self.validation_rules:
+            if (
+                rule.validation_type == ValidationType.UNIQUE_CHECK
+                and rule.column in df_chunk.columns
+            ):
+                # Los nulos se cuentan aparte: no son un valor único, pero sí
+                # duplicados entre sí (igual que en validate_dataframe)
+                column = df_chunk[rule.column].dropna()
+                state.seen_values.setdefault(rule.column, set()).update(
+                    column.astype(object)
+                )
+                state.non_null_rows[rule.column] = state.non_null_rows.get(
+                    rule.column, 0
+                ) + len(column)
+                state.unique_null_rows[rule.column] = (
+                    state.unique_null_rows.get(rule.column, 0)
+                    + len(df_chunk)
+                    - len(column)
+                )
+
+        state.total_rows += len(df_chunk)
+        state.total_columns = len(df_chunk.columns)
+        return state
+
+    def finalize(self, state: ChunkValidationState) -> ValidationReport:
+        """
+        Genera el reporte de validación a partir del estado acumulado por bloques
+
+        Las reglas que solo se pudieron evaluar bloque a bloque se listan en
+        summary["per_chunk_rules"] y llevan details["per_chunk"] = True.
+
+        Args:
+            state: Estado acumulado de la validación
+
+        Returns:
+            ValidationReport con los resultados de validación
+        """
+        for rule in self.validation_rules:
+            if (
+                rule.validation_type == ValidationType.NULL_CHECK
+                and rule.name in state.null_counts
+            ):
+                result = self._null_result(
+                    rule, state.null_counts[rule.name], state.total_rows
+                )
+                result.timestamp = state.start_time
+                state.results[rule.name] = result
+            elif (
+                rule.validation_type == ValidationType.UNIQUE_CHECK
+                and rule.column in state.seen_values
+            ):
+                unique_count = len(state.seen_values[rule.column])
+                null_rows = state.unique_null_rows[rule.column]
+                duplicate_count = (
+                    state.non_null_rows[rule.column]
+                    - unique_count
+                    + max(null_rows - 1, 0)
+                )
+                state.results[rule.name] = ValidationResult(
+                    rule_name=rule.name,
+                    validation_type=rule.validation_type,
+                    level=rule.level,
+                    column=rule.column,
+                    passed=duplicate_count == 0,
+                    message=f"Validación de unicidad para '{rule.column}': {duplicate_count} duplicados encontrados",
+                    details={
+                        "duplicate_count": duplicate_count,
+                        "unique_count": unique_count,
+                    },
+                    timestamp=state.start_time,
+                )
+
+        per_chunk_rules = []
+        for result in state.results.values():
+            total = result.details.get("total_violations")
+            if result.validation_type in _COUNT_MESSAGES and total is not None:
+                # Mensaje con el total de todos los bloques
+                result.passed = total == 0
+                result.message = _COUNT_MESSAGES[result.validation_type].format(
+                    column=result.column, count=total
+                )
+            elif result.validation_type in _PER_CHUNK_RULE_TYPES and result.details:
+                result.details["per_chunk"] = True
+                per_chunk_rules.append(result.rule_name)
+
+        report = self._build_report(
+            list(state.results.values()),
+            state.total_rows,
+            state.total_columns,
+            state.start_time,
+        )
+        report.summary["per_chunk_rules"] = per_chunk_rules
+        return report
+
+    def _run_validation_rules(
+        self, df: pd.DataFrame, run_timestamp: datetime
+    ) -> List[ValidationResult]:
+        """
+        Ejecuta todas las reglas de validación y el esquema sobre un DataFrame
+
+        Args:
+            df: DataFrame a validar
+            run_timestamp: Marca de tiempo común a todos los resultados de la ejecución
+
+        Returns:
+            Lista de resultados de validación
+        """
+        results: List[ValidationResult] = []
+        columns = frozenset(df.columns)
+        numeric_columns = _numeric_columns(df)
+
         # Ejecutar todas las reglas de validación
         for rule in self.validation_rules:
             try:
-                result = self._execute_validation_rule(df, rule)
+                result = self._execute_validation_rule(
+                    df, rule, numeric_columns, columns
+                )
                 results.append(result)
             except Exception as e:
                 # Crear resultado de error para validación fallida
@@ -288,6 +665,19 @@ class DataValidator:
             schema_results = self._validate_schema(df)
             results.extend(schema_results)
 
+        for result in results:
+            result.timestamp = run_timestamp
+
+        return results
+
+    def _build_report(
+        self,
+        results: List[ValidationResult],
+        total_rows: int,
+        total_columns: int,
+        start_time: datetime,
+    ) -> ValidationReport:
+        """Calcula las estadísticas de resumen y construye el reporte"""
         # Calcular estadísticas de resumen
         total_rules = len(results)
         passed_rules = sum(1 for r in results if r.passed)
@@ -299,12 +689,13 @@ class DataValidator:
             1 for r in results if not r.passed and r.level == ValidationLevel.ERROR
         )
 
-        execution_time = (datetime.now() - start_time).total_seconds()
+        finished_at = datetime.now()
+        execution_time = (finished_at - start_time).total_seconds()
 
         # Crear resumen
         summary = {
-            "total_rows": len(df),
-            "total_columns": len(df.columns),
+            "total_rows": total_rows,
+            "total_columns": total_columns,
             "success_rate": (
                 (passed_rules / total_rules * 100) if total_rules > 0 else 100.0
             ),
@@ -326,6 +717,7 @@ class DataValidator:
             results=results,
             summary=summary,
             execution_time=execution_time,
+            timestamp=finished_at,
         )
 
         self.logger.info(
@@ -334,14 +726,38 @@ class DataValidator:
         return report
 
     def _execute_validation_rule(
-        self, df: pd.DataFrame, rule: ValidationRule
+        self,
+        df: pd.DataFrame,
+        rule: ValidationRule,
+        numeric_columns: Optional[frozenset] = None,
+        columns: Optional[frozenset] = None,
     ) -> ValidationResult:
         """Ejecuta una sola regla de validación"""
+        if numeric_columns is None:
+            numeric_columns = _numeric_columns(df)
+        if columns is None:
+            columns = frozenset(df.columns)
+
+        # Las reglas sobre una columna inexistente fallan sin ejecutarse; las
+        # personalizadas pueden no tener columna y lo verifican ellas mismas
+        if rule.validation_type in _COLUMN_RULE_TYPES and rule.column not in columns:
+            return ValidationResult(
+                rule_name=rule.name,
+                validation_type=rule.validation_type,
+                level=rule.level,
+                column=rule.column,
+                passed=False,
+                message=(
+                    f"Columna '{rule.column}' no encontrada"
+                    if rule.validation_type == ValidationType.TYPE_CHECK
+                    else f"Column '{rule.column}' not found"
+                ),
+            )
 
         if rule.validation_type == ValidationType.TYPE_CHECK:
             return self._validate_type(df, rule)
         elif rule.validation_type == ValidationType.RANGE_CHECK:
-            return self._validate_range(df, rule)
+            return self._validate_range(df, rule, numeric_columns)
         elif rule.validation_type == ValidationType.PATTERN_CHECK:
             return self._validate_pattern(df, rule)
         elif rule.validation_type == ValidationType.NULL_CHECK:
@@ -349,7 +765,7 @@ class DataValidator:
         elif rule.validation_type == ValidationType.UNIQUE_CHECK:
             return self._validate_unique(df, rule)
         elif rule.validation_type == ValidationType.STATISTICAL:
-            return self._validate_statistical(df, rule)
+            return self._validate_statistical(df, rule, numeric_columns)
         elif rule.validation_type == ValidationType.CUSTOM_RULE:
             return self._validate_custom(df, rule)
         else:
@@ -365,9 +781,12 @@ class DataValidator:
     def _validate_schema(self, df: pd.DataFrame) -> List[ValidationResult]:
         """Valida DataFrame contra el esquema definido"""
         results = []
+        # Tipos de todas las columnas obtenidos una sola vez
+        dtypes = df.dtypes.astype(str).to_dict()
 
         for column, expected_type in self.schema.items():
-            if column not in df.columns:
+            actual_type = dtypes.get(column)
+            if actual_type is None:
                 result = ValidationResult(
                     rule_name=f"schema_check_{column}",
                     validation_type=ValidationType.TYPE_CHECK,
@@ -380,7 +799,6 @@ class DataValidator:
                 continue
 
             # Verificar compatibilidad de tipos de datos
-            actual_type = str(df[column].dtype)
             compatible = self._check_type_compatibility(actual_type, expected_type)
 
             result = ValidationResult(
@@ -405,16 +823,6 @@ class DataValidator:
         column = rule.column
         expected_type = rule.parameters.get("type")
 
-        if column not in df.columns:
-            return ValidationResult(
-                rule_name=rule.name,
-                validation_type=rule.validation_type,
-                level=rule.level,
-                column=column,
-                passed=False,
-                message=f"Columna '{column}' no encontrada",
-            )
-
         actual_type = str(df[column].dtype)
         if expected_type is None:
             compatible = False
@@ -432,25 +840,15 @@ class DataValidator:
         )
 
     def _validate_range(
-        self, df: pd.DataFrame, rule: ValidationRule
+        self, df: pd.DataFrame, rule: ValidationRule, numeric_columns: frozenset
     ) -> ValidationResult:
         """Valida rangos de valores"""
         column = rule.column
         min_val = rule.parameters.get("min")
         max_val = rule.parameters.get("max")
 
-        if column not in df.columns:
-            return ValidationResult(
-                rule_name=rule.name,
-                validation_type=rule.validation_type,
-                level=rule.level,
-                column=column,
-                passed=False,
-                message=f"Column '{column}' not found",
-            )
-
         # Verificar datos numéricos
-        if not pd.api.types.is_numeric_dtype(df[column]):
+        if column not in numeric_columns:
             return ValidationResult(
                 rule_name=rule.name,
                 validation_type=rule.validation_type,
@@ -460,14 +858,17 @@ class DataValidator:
                 message=f"La validación de rango requiere datos numéricos, obtenido {df[column].dtype}",
             )
 
-        violations = []
+        # Combinar ambas comparaciones en una sola máscara (los nulos no violan
+        # el rango) y obtener las etiquetas de fila una única vez
+        values = df[column]
+        mask = np.zeros(len(values), dtype=bool)
         if min_val is not None:
-            violations.extend(df[df[column] < min_val].index.tolist())
+            mask |= (values < min_val).to_numpy(dtype=bool, na_value=False)
         if max_val is not None:
-            violations.extend(df[df[column] > max_val].index.tolist())
+            mask |= (values > max_val).to_numpy(dtype=bool, na_value=False)
 
-        violations = list(set(violations))  # Eliminar duplicados
-        passed = len(violations) == 0
+        violations, violation_count = self._collect_affected_rows(df.index, mask)
+        passed = violation_count == 0
 
         return ValidationResult(
             rule_name=rule.name,
@@ -475,8 +876,15 @@ class DataValidator:
             level=rule.level,
             column=column,
             passed=passed,
-            message=f"Validación de rango para '{column}': {len(violations)} violaciones encontradas",
-            details={"min": min_val, "max": max_val, "violations": len(violations)},
+            message=_COUNT_MESSAGES[ValidationType.RANGE_CHECK].format(
+                column=column, count=violation_count
+            ),
+            details={
+                "min": min_val,
+                "max": max_val,
+                "violations": violation_count,
+                "total_violations": violation_count,
+            },
             affected_rows=violations,
         )
 
@@ -487,16 +895,6 @@ class DataValidator:
         column = rule.column
         pattern = rule.parameters.get("pattern")
 
-        if column not in df.columns:
-            return ValidationResult(
-                rule_name=rule.name,
-                validation_type=rule.validation_type,
-                level=rule.level,
-                column=column,
-                passed=False,
-                message=f"Column '{column}' not found",
-            )
-
         if not pattern:
             return ValidationResult(
                 rule_name=rule.name,
@@ -508,11 +906,27 @@ class DataValidator:
             )
 
         try:
-            # Convertir a string y verificar patrón
-            str_series = df[column].astype(str)
-            matches = str_series.str.match(pattern, na=False)
-            violations = df[~matches].index.tolist()
-            passed = len(violations) == 0
+            compiled = self._compile_pattern(pattern)
+            values = df[column]
+            matches = None
+            if pd.api.types.is_string_dtype(values) and not (
+                pd.api.types.is_object_dtype(values)
+            ):
+                # Columnas de texto nativas (string o Arrow): verificar sin copiar
+                # a object; Arrow usa RE2, así que si rechaza el patrón se
+                # recurre a la conversión a string
+                try:
+                    matches = values.str.match(pattern, na=False)
+                except ValueError:
+                    matches = None
+
+            if matches is None:
+                # Convertir a string y verificar patrón
+                matches = values.astype(str).str.match(compiled, na=False)
+            violations, violation_count = self._collect_affected_rows(
+                df.index, ~matches.to_numpy(dtype=bool)
+            )
+            passed = violation_count == 0
 
             return ValidationResult(
                 rule_name=rule.name,
@@ -520,8 +934,14 @@ class DataValidator:
                 level=rule.level,
                 column=column,
                 passed=passed,
-                message=f"Validación de patrón para '{column}': {len(violations)} violaciones encontradas",
-                details={"pattern": pattern, "violations": len(violations)},
+                message=_COUNT_MESSAGES[ValidationType.PATTERN_CHECK].format(
+                    column=column, count=violation_count
+                ),
+                details={
+                    "pattern": pattern,
+                    "violations": violation_count,
+                    "total_violations": violation_count,
+                },
                 affected_rows=violations,
             )
         except Exception as e:
@@ -534,26 +954,70 @@ class DataValidator:
                 message=f"La validación de patrón falló: {e}",
             )
 
+    def _collect_affected_rows(
+        self, index: pd.Index, mask: np.ndarray
+    ) -> Tuple[List[Any], int]:
+        """
+        Obtiene las etiquetas de las filas que fallan, limitadas a max_affected_rows
+
+        Args:
+            index: Índice de las filas evaluadas
+            mask: Máscara booleana con True en las filas que fallan
+
+        Returns:
+            Tupla con las etiquetas conservadas y el total de filas que fallan
+        """
+        positions = np.flatnonzero(mask)
+        affected_rows = index[positions[: self.max_affected_rows]].tolist()
+        return affected_rows, int(positions.size)
+
+    def _compile_pattern(self, pattern: str) -> re.Pattern:
+        """
+        Compila un patrón regex una sola vez por validador
+
+        Args:
+            pattern: Expresión regular de la regla
+
+        Returns:
+            Patrón compilado reutilizable entre llamadas
+        """
+        compiled = self._pattern_cache.get(pattern)
+        if compiled is None:
+            # Varios ".*" sin anclar pueden provocar backtracking catastrófico
+            if pattern.count(".*") > 1 and not (
+                pattern.startswith("^") and pattern.endswith("$")
+            ):
+                self.logger.warning(
+                    f"El patrón '{pattern}' contiene varios '.*' sin anclar y "
+                    "puede ser lento"
+                )
+            compiled = self._pattern_cache.setdefault(pattern, re.compile(pattern))
+        return compiled
+
     def _validate_null(
         self, df: pd.DataFrame, rule: ValidationRule
     ) -> ValidationResult:
         """Valida valores nulos"""
+        return self._null_result(rule, _null_count(df[rule.column]), len(df))
+
+    def _null_result(
+        self, rule: ValidationRule, null_count: int, total_rows: int
+    ) -> ValidationResult:
+        """
+        Construye el resultado de una regla de nulos a partir de sus conteos
+
+        Args:
+            rule: Regla de nulos evaluada
+            null_count: Número de valores nulos en la columna
+            total_rows: Número total de filas evaluadas
+
+        Returns:
+            ValidationResult de la regla
+        """
         column = rule.column
         allow_null = rule.parameters.get("allow_null", True)
         max_null_percentage = rule.parameters.get("max_null_percentage", 100)
-
-        if column not in df.columns:
-            return ValidationResult(
-                rule_name=rule.name,
-                validation_type=rule.validation_type,
-                level=rule.level,
-                column=column,
-                passed=False,
-                message=f"Column '{column}' not found",
-            )
-
-        null_count = df[column].isnull().sum()
-        null_percentage = (null_count / len(df)) * 100
+        null_percentage = (null_count / total_rows) * 100 if total_rows else 0.0
 
         if not allow_null and null_count > 0:
             return ValidationResult(
@@ -593,17 +1057,11 @@ class DataValidator:
         """Valida restricciones de unicidad"""
         column = rule.column
 
-        if column not in df.columns:
-            return ValidationResult(
-                rule_name=rule.name,
-                validation_type=rule.validation_type,
-                level=rule.level,
-                column=column,
-                passed=False,
-                message=f"Column '{column}' not found",
-            )
-
-        duplicate_count = df[column].duplicated().sum()
+        # Una sola tabla hash: los NaN cuentan como duplicados entre sí
+        # (igual que duplicated) pero no como valor único (igual que nunique)
+        value_counts = df[column].value_counts(dropna=False)
+        duplicate_count = len(df) - len(value_counts)
+        unique_count = len(value_counts) - int(value_counts.index.hasnans)
         passed = duplicate_count == 0
 
         return ValidationResult(
@@ -615,28 +1073,18 @@ class DataValidator:
             message=f"Validación de unicidad para '{column}': {duplicate_count} duplicados encontrados",
             details={
                 "duplicate_count": duplicate_count,
-                "unique_count": df[column].nunique(),
+                "unique_count": unique_count,
             },
         )
 
     def _validate_statistical(
-        self, df: pd.DataFrame, rule: ValidationRule
+        self, df: pd.DataFrame, rule: ValidationRule, numeric_columns: frozenset
     ) -> ValidationResult:
         """Valida propiedades estadísticas (outliers, distribución)"""
         column = rule.column
         check_type = rule.parameters.get("check_type", "outliers")
 
-        if column not in df.columns:
-            return ValidationResult(
-                rule_name=rule.name,
-                validation_type=rule.validation_type,
-                level=rule.level,
-                column=column,
-                passed=False,
-                message=f"Column '{column}' not found",
-            )
-
-        if not pd.api.types.is_numeric_dtype(df[column]):
+        if column not in numeric_columns:
             return ValidationResult(
                 rule_name=rule.name,
                 validation_type=rule.validation_type,
@@ -668,22 +1116,35 @@ class DataValidator:
         method = rule.parameters.get("method", "iqr")
         threshold = rule.parameters.get("threshold", 1.5)
 
+        # Trabajar sobre el ndarray: los NaN nunca cumplen las comparaciones
+        values = df[column].to_numpy(dtype="float64", na_value=np.nan)
+        valid = values[~np.isnan(values)]
+
         if method == "iqr":
-            Q1 = df[column].quantile(0.25)
-            Q3 = df[column].quantile(0.75)
-            IQR = Q3 - Q1
-            lower_bound = Q1 - threshold * IQR
-            upper_bound = Q3 + threshold * IQR
-
-            outliers = df[
-                (df[column] < lower_bound) | (df[column] > upper_bound)
-            ].index.tolist()
+            if valid.size:
+                # Ambos cuartiles en una sola llamada
+                Q1, Q3 = np.quantile(valid, [0.25, 0.75])
+                IQR = Q3 - Q1
+                lower_bound = Q1 - threshold * IQR
+                upper_bound = Q3 + threshold * IQR
+                mask = (values < lower_bound) | (values > upper_bound)
+            else:
+                mask = np.zeros(len(values), dtype=bool)
         else:
-            # Método Z-score
-            z_scores = np.abs((df[column] - df[column].mean()) / df[column].std())
-            outliers = df[z_scores > threshold].index.tolist()
+            # Método Z-score (desviación muestral, igual que pandas)
+            if valid.size > 1:
+                mean = valid.mean()
+                std = valid.std(ddof=1)
+                # Reutilizar el arreglo de desviaciones en lugar de crear otro
+                deviations = values - mean
+                np.abs(deviations, out=deviations)
+                mask = deviations > threshold * std
+            else:
+                mask = np.zeros(len(values), dtype=bool)
 
-        outlier_percentage = (len(outliers) / len(df)) * 100
+        outliers, outlier_count = self._collect_affected_rows(df.index, mask)
+
+        outlier_percentage = (outlier_count / len(df)) * 100
         max_outlier_percentage = rule.parameters.get("max_outlier_percentage", 5.0)
 
         passed = outlier_percentage <= max_outlier_percentage
@@ -694,9 +1155,10 @@ class DataValidator:
             level=rule.level,
             column=column,
             passed=passed,
-            message=f"Verificación de valores atípicos para '{column}': {len(outliers)} outliers ({outlier_percentage:.2f}%)",
+            message=f"Verificación de valores atípicos para '{column}': {outlier_count} outliers ({outlier_percentage:.2f}%)",
             details={
-                "outlier_count": len(outliers),
+                "outlier_count": outlier_count,
+                "total_violations": outlier_count,
                 "outlier_percentage": outlier_percentage,
                 "method": method,
                 "threshold": threshold,
@@ -712,10 +1174,10 @@ class DataValidator:
         expected_distribution = rule.parameters.get("expected_distribution", "normal")
 
         # Verificaciones simples de distribución
-        mean_val = _safe_float_conversion(df[column].mean())
-        median_val = _safe_float_conversion(df[column].median())
-        std_val = _safe_float_conversion(df[column].std())
-        skewness = _safe_float_conversion(df[column].skew())
+        values = df[column].to_numpy(dtype="float64", na_value=np.nan)
+        mean_val, median_val, std_val, skewness = map(
+            _safe_float_conversion, _distribution_stats(values)
+        )
 
         details = {
             "mean": mean_val,
@@ -785,14 +1247,34 @@ class DataValidator:
             else:
                 result = validator_func(df, **rule.parameters)
 
-            if isinstance(result, bool):
-                passed = result
-                message = f"Validación personalizada {'pasó' if result else 'falló'}"
+            affected_rows = []
+            if isinstance(result, (bool, np.bool_)):
+                # Incluye np.bool_, que devuelven reducciones como (serie > 0).all()
+                passed = bool(result)
+                message = f"Validación personalizada {'pasó' if passed else 'falló'}"
                 details = {}
             elif isinstance(result, dict):
                 passed = result.get("passed", False)
                 message = result.get("message", "Validación personalizada ejecutada")
                 details = result.get("details", {})
+            elif (
+                isinstance(result, (pd.Series, np.ndarray))
+                and result.dtype == bool
+                and len(result) == len(df)
+            ):
+                # Máscara por fila: True indica que la fila es válida
+                index = result.index if isinstance(result, pd.Series) else df.index
+                affected_rows, failed_count = self._collect_affected_rows(
+                    index, ~np.asarray(result)
+                )
+                passed = failed_count == 0
+                message = _COUNT_MESSAGES[ValidationType.CUSTOM_RULE].format(
+                    column=rule.column, count=failed_count
+                )
+                details = {
+                    "failed_count": failed_count,
+                    "total_violations": failed_count,
+                }
             else:
                 passed = False
                 message = f"Tipo de retorno del validador personalizado inválido: {type(result)}"
@@ -806,6 +1288,7 @@ class DataValidator:
                 passed=passed,
                 message=message,
                 details=details,
+                affected_rows=affected_rows,
             )
 
         except Exception as e:
@@ -821,24 +1304,7 @@ class DataValidator:
 
     def _check_type_compatibility(self, actual_type: str, expected_type: str) -> bool:
         """Verifica si el tipo de dato actual es compatible con el tipo esperado"""
-        type_mapping = {
-            "int": ["int64", "int32", "int16", "int8"],
-            "integer": ["int64", "int32", "int16", "int8"],
-            "float": ["float64", "float32"],
-            "number": ["int64", "int32", "int16", "int8", "float64", "float32"],
-            "string": ["object", "string"],
-            "text": ["object", "string"],
-            "datetime": ["datetime64[ns]", "datetime64"],
-            "bool": ["bool"],
-            "boolean": ["bool"],
-        }
-
-        expected_lower = expected_type.lower()
-        if expected_lower in type_mapping:
-            return actual_type in type_mapping[expected_lower]
-
-        # Coincidencia directa
-        return actual_type.lower() == expected_lower
+        return _types_compatible(actual_type, expected_type)
 
     def export_report(
         self,
@@ -892,7 +1358,9 @@ class DataValidator:
                     "passed": result.passed,
                     "message": result.message,
                     "details": result.details,
-                    "affected_rows_count": len(result.affected_rows),
+                    "affected_rows_count": result.details.get(
+                        "total_violations", len(result.affected_rows)
+                    ),
                     "timestamp": result.timestamp.isoformat(),
                 }
                 for result in report.results
@@ -914,7 +1382,9 @@ class DataValidator:
                     "column": result.column,
                     "passed": result.passed,
                     "message": result.message,
-                    "affected_rows_count": len(result.affected_rows),
+                    "affected_rows_count": result.details.get(
+                        "total_violations", len(result.affected_rows)
+                    ),
                     "timestamp": result.timestamp.isoformat(),
                 }
             )
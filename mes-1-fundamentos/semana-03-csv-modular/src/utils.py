@@ -30,11 +30,11 @@ import logging.config
 import os
 import sys
 from pathlib import Path
-from typing import Any, Dict, Optional, Union, List
+from typing import Any, Dict, Iterator, Optional, Tuple, Union, List
 import json
 import time
 from functools import wraps
-from datetime import datetime
+from datetime import date, datetime
 import pandas as pd
 import numpy as np
 import re
@@ -361,6 +361,278 @@ def detect_encoding(file_path: Union[str, Path], sample_size: int = 10240) -> st
         return "utf-8"
 
 
+def _arrow_csv_options(
+    encoding: str = "utf-8",
+    delimiter: str = ",",
+    has_header: bool = True,
+    na_values: Optional[List[str]] = None,
+    block_size: int = 8 << 20,
+) -> Tuple[Any, Any, Any]:
+    """
+    Construir las opciones de lectura de PyArrow para un CSV
+
+    Args:
+        encoding: Codificación del archivo
+        delimiter: Delimitador de campos
+        has_header: Si la primera fila contiene los nombres de columnas
+        na_values: Valores adicionales a interpretar como nulos
+        block_size: Tamaño en bytes de cada bloque leído
+
+    Returns:
+        Tupla (ReadOptions, ParseOptions, ConvertOptions)
+    """
+    import pyarrow.csv as pacsv
+
+    read_options = pacsv.ReadOptions(
+        use_threads=True,
+        block_size=block_size,
+        encoding=encoding,
+        autogenerate_column_names=not has_header,
+    )
+    parse_options = pacsv.ParseOptions(delimiter=delimiter)
+    convert_options = pacsv.ConvertOptions(
+        null_values=list(pacsv.ConvertOptions().null_values) + list(na_values or []),
+        strings_can_be_null=True,
+    )
+    return read_options, parse_options, convert_options
+
+
+def read_csv_arrow(
+    file_path: Union[str, Path],
+    encoding: str = "utf-8",
+    delimiter: str = ",",
+    has_header: bool = True,
+    na_values: Optional[List[str]] = None,
+    dtype_backend: str = "numpy",
+    streaming: bool = False,
+) -> pd.DataFrame:
+    """
+    Leer un archivo CSV con el lector multihilo de PyArrow
+
+    Con streaming=True se usa el lector por lotes (pyarrow.csv.open_csv), que
+    lee un bloque de 8MB cada vez; los lotes se unen en una tabla sin copiar
+    datos, así que la memoria máxima es del orden del DataFrame final.
+
+    Args:
+        file_path: Ruta al archivo CSV
+        encoding: Codificación del archivo
+        delimiter: Delimitador de campos
+        has_header: Si la primera fila contiene los nombres de columnas
+        na_values: Valores adicionales a interpretar como nulos
+        dtype_backend: "numpy" para tipos numpy o "pyarrow" para conservar las
+            columnas como pd.ArrowDtype
+        streaming: Leer por lotes en lugar de con el lector multihilo
+
+    Returns:
+        DataFrame con los datos del archivo
+
+    Raises:
+        ImportError: Si pyarrow no está instalado
+        ValueError: Si pyarrow no puede parsear el archivo (pyarrow.ArrowInvalid)
+    """
+    import pyarrow.csv as pacsv
+
+    read_options, parse_options, convert_options = _arrow_csv_options(
+        encoding, delimiter, has_header, na_values
+    )
+
+    if streaming:
+        import pyarrow as pa
+
+        reader = pacsv.open_csv(
+            str(file_path),
+            read_options=read_options,
+            parse_options=parse_options,
+            convert_options=convert_options,
+        )
+        table = pa.Table.from_batches(list(reader), schema=reader.schema)
+    else:
+        table = pacsv.read_csv(
+            str(file_path),
+            read_options=read_options,
+            parse_options=parse_options,
+            convert_options=convert_options,
+        )
+    # self_destruct libera cada columna Arrow en cuanto se convierte, de modo
+    # que los datos no quedan duplicados en memoria durante la conversión
+    types_mapper = pd.ArrowDtype if dtype_backend == "pyarrow" else None
+    return table.to_pandas(
+        split_blocks=True, self_destruct=True, types_mapper=types_mapper
+    )
+
+
+def read_csv_polars(
+    file_path: Union[str, Path],
+    encoding: str = "utf-8",
+    delimiter: str = ",",
+    has_header: bool = True,
+    na_values: Optional[List[str]] = None,
+    dtype_backend: str = "numpy",
+) -> pd.DataFrame:
+    """
+    Leer un archivo CSV con el lector multihilo de Polars
+
+    Polars solo lee UTF-8 (y ASCII, que es un subconjunto); para otros encodings
+    se lanza ValueError para que el llamador use pandas.
+
+    Args:
+        file_path: Ruta al archivo CSV
+        encoding: Codificación del archivo
+        delimiter: Delimitador de campos
+        has_header: Si la primera fila contiene los nombres de columnas
+        na_values: Valores adicionales a interpretar como nulos
+        dtype_backend: "numpy" para tipos numpy o "pyarrow" para conservar las
+            columnas como pd.ArrowDtype
+
+    Returns:
+        DataFrame con los datos del archivo
+
+    Raises:
+        ImportError: Si polars no está instalado
+        ValueError: Si el encoding no es UTF-8 o polars no puede parsear el archivo
+    """
+    import polars as pl
+
+    if encoding.lower().replace("-", "_") not in ("utf_8", "utf8", "ascii"):
+        raise ValueError(f"polars no admite el encoding {encoding}")
+
+    try:
+        df = pl.read_csv(
+            file_path,
+            has_header=has_header,
+            separator=delimiter,
+            null_values=list(na_values or []),
+            infer_schema_length=10000,
+        )
+    except pl.exceptions.PolarsError as e:
+        raise ValueError(str(e)) from e
+
+    return df.to_pandas(use_pyarrow_extension_array=dtype_backend == "pyarrow")
+
+
+def iter_csv_chunks(
+    file_path: Union[str, Path],
+    chunksize: int = 100_000,
+    engine: str = "pandas",
+    memory_map: bool = False,
+    encoding: str = "utf-8",
+    delimiter: str = ",",
+    has_header: bool = True,
+    na_values: Optional[List[str]] = None,
+    block_size: int = 8 << 20,
+) -> Iterator[pd.DataFrame]:
+    """
+    Iterar un archivo CSV por bloques sin cargarlo completo en memoria
+
+    Con engine="arrow" se usa el lector en streaming de PyArrow y cada bloque
+    corresponde a un lote del lector (acotado en bytes, no en filas). Si pyarrow
+    no está instalado se usa pandas. El lector de PyArrow infiere los tipos con
+    el primer lote; si un lote posterior no encaja (pyarrow.ArrowInvalid), el
+    resto del archivo se lee con pandas conservando los nombres de columnas.
+    Pandas vuelve a leer el archivo desde el principio y descarta los registros
+    ya entregados, ya que un campo entre comillas puede ocupar varias líneas.
+
+    Con memory_map=True el archivo se mapea en memoria en lugar de leerse a
+    través de buffers de Python; con pyarrow, si el mapeo falla (OSError) el
+    archivo se lee normalmente.
+
+    Args:
+        file_path: Ruta al archivo CSV
+        chunksize: Número de filas por bloque (engine="pandas")
+        engine: Motor de lectura ("pandas" o "arrow")
+        memory_map: Mapear el archivo en memoria para leerlo
+        encoding: Codificación del archivo
+        delimiter: Delimitador de campos
+        has_header: Si la primera fila contiene los nombres de columnas
+        na_values: Valores adicionales a interpretar como nulos
+        block_size: Tamaño en bytes de cada lote (engine="arrow")
+
+    Yields:
+        Bloques del archivo con índice continuo entre bloques
+    """
+    if engine == "arrow":
+        try:
+            import pyarrow as pa
+            import pyarrow.csv as pacsv
+        except ImportError:
+            logger = logging.getLogger(__name__)
+            logger.warning("pyarrow no disponible, usando pandas para leer el CSV")
+        else:
+            source = str(file_path)
+            if memory_map:
+                try:
+                    source = pa.memory_map(source, "r")
+                except OSError:
+                    pass
+
+            read_options, parse_options, convert_options = _arrow_csv_options(
+                encoding, delimiter, has_header, na_values, block_size
+            )
+            offset = 0
+            column_names = None
+            try:
+                reader = pacsv.open_csv(
+                    source,
+                    read_options=read_options,
+                    parse_options=parse_options,
+                    convert_options=convert_options,
+                )
+                column_names = reader.schema.names
+                for batch in reader:
+                    chunk = batch.to_pandas()
+                    chunk.index = pd.RangeIndex(offset, offset + len(chunk))
+                    offset += len(chunk)
+                    yield chunk
+                return
+            except pa.ArrowInvalid as e:
+                logger = logging.getLogger(__name__)
+                logger.warning(
+                    f"PyArrow no pudo leer el CSV por bloques ({e}), "
+                    f"continuando con pandas desde la fila {offset}"
+                )
+            finally:
+                if not isinstance(source, str):
+                    source.close()
+
+            # Continuar con pandas tras el último registro entregado; se cuentan
+            # registros del parser, no líneas físicas
+            chunks = pd.read_csv(
+                file_path,
+                chunksize=chunksize,
+                memory_map=memory_map,
+                encoding=encoding,
+                delimiter=delimiter,
+                header=0 if has_header else None,
+                names=column_names,
+                na_values=na_values,
+                keep_default_na=True,
+                index_col=False,
+            )
+            to_skip = offset
+            for chunk in chunks:
+                if to_skip:
+                    if len(chunk) <= to_skip:
+                        to_skip -= len(chunk)
+                        continue
+                    chunk = chunk.iloc[to_skip:]
+                    to_skip = 0
+                chunk.index = pd.RangeIndex(offset, offset + len(chunk))
+                offset += len(chunk)
+                yield chunk
+            return
+
+    yield from pd.read_csv(
+        file_path,
+        chunksize=chunksize,
+        memory_map=memory_map,
+        encoding=encoding,
+        delimiter=delimiter,
+        header=0 if has_header else None,
+        na_values=na_values,
+        keep_default_na=True,
+    )
+
+
 def validate_file_path(file_path: Union[str, Path], must_exist: bool = True) -> Path:
     """
     Validar y normalizar ruta de archivo
@@ -462,6 +734,35 @@ def safe_convert_to_numeric(value: Any, default: Any = None) -> Union[int, float
         return default
 
 
+def json_default(obj: Any) -> Any:
+    """
+    Hook default para json/orjson: convierte a nativos los valores no JSON
+
+    Cubre escalares y arrays numpy, fechas (incluido pd.Timestamp) y rutas.
+    Cualquier otro tipo lanza TypeError, como espera orjson: si el hook
+    devolviera el mismo objeto, orjson lo volvería a llamar hasta agotar
+    el límite de recursión.
+
+    Args:
+        obj: Valor que el serializador no sabe convertir
+
+    Returns:
+        Representación nativa del valor
+
+    Raises:
+        TypeError: Si el tipo no es soportado
+    """
+    if isinstance(obj, np.generic):
+        return obj.item()
+    if isinstance(obj, np.ndarray):
+        return obj.tolist()
+    if isinstance(obj, (datetime, date)):
+        return obj.isoformat()
+    if isinstance(obj, Path):
+        return str(obj)
+    raise TypeError(f"Tipo no serializable a JSON: {type(obj).__name__}")
+
+
 def clean_text_value(value: Any) -> str:
     """
     Limpiar y normalizar valores de texto
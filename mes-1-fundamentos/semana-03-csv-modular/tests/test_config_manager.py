@@ -14,6 +14,9 @@ Proyecto: Data + Automation Engineer Journey - Semana 3
 import pytest
 import tempfile
 import json
+from unittest.mock import patch
+from collections import OrderedDict
+from dataclasses import FrozenInstanceError
 from pathlib import Path
 import os
 import sys
@@ -26,6 +29,7 @@ from src.config_manager import (
     PathConfig,
     ValidationConfig,
     LoggingConfig,
+    ConfigurationError,
 )
 
 
@@ -63,6 +67,22 @@ class TestConfigManager:
         finally:
             os.unlink(env_file)
 
+    def test_env_file_values_applied(self, monkeypatch):
+        """Prueba que las variables del .env se aplican sin sobrescribir las existentes"""
+        # Registrar las variables para que monkeypatch las restaure al terminar
+        monkeypatch.setenv("BATCH_SIZE", "0")
+        monkeypatch.delenv("BATCH_SIZE")
+        monkeypatch.setenv("CPU_CORES", "3")
+
+        with tempfile.TemporaryDirectory() as temp_dir:
+            env_file = Path(temp_dir) / "test.env"
+            env_file.write_text('BATCH_SIZE="321"\nCPU_CORES=8\n')
+
+            config_manager = ConfigManager(env_file=str(env_file), config_dir=temp_dir)
+
+            assert config_manager.processing.batch_size == 321
+            assert config_manager.processing.cpu_cores == 3
+
     def test_processing_config_attributes(self):
         """Prueba atributos de ProcessingConfig"""
         with tempfile.TemporaryDirectory() as temp_dir:
@@ -83,6 +103,54 @@ class TestConfigManager:
             assert processing_config.default_encoding == "utf-8"
             assert processing_config.default_delimiter == ","
 
+    def test_csv_engine_from_env(self, monkeypatch):
+        """Prueba selección del motor de lectura CSV desde variables de entorno"""
+        with tempfile.TemporaryDirectory() as temp_dir:
+            monkeypatch.delenv("CSV_ENGINE", raising=False)
+            assert ConfigManager(config_dir=temp_dir).processing.csv_engine == "pandas"
+
+            monkeypatch.setenv("CSV_ENGINE", "Arrow")
+            assert ConfigManager(config_dir=temp_dir).processing.csv_engine == "arrow"
+
+            monkeypatch.setenv("CSV_ENGINE", "polars")
+            assert ConfigManager(config_dir=temp_dir).processing.csv_engine == "polars"
+
+            monkeypatch.setenv("CSV_ENGINE", "spark")
+            with pytest.raises(ConfigurationError):
+                ConfigManager(config_dir=temp_dir).validate()
+
+    @pytest.mark.parametrize(
+        "value, expected",
+        [("true", True), ("ON", True), (" Yes ", True), ("0", False), ("no", False)],
+    )
+    def test_boolean_env_values(self, monkeypatch, value, expected):
+        """Prueba la interpretación de variables booleanas"""
+        monkeypatch.setenv("STRICT_VALIDATION", value)
+        with tempfile.TemporaryDirectory() as temp_dir:
+            config_manager = ConfigManager(config_dir=temp_dir)
+            assert config_manager.validation.strict_validation is expected
+
+    def test_email_notifications_require_host(self, monkeypatch):
+        """Prueba que las notificaciones por email exigen EMAIL_HOST"""
+        monkeypatch.setenv("ENABLE_EMAIL_NOTIFICATIONS", "true")
+        monkeypatch.setenv("EMAIL_HOST", "")
+        with tempfile.TemporaryDirectory() as temp_dir:
+            config_manager = ConfigManager(config_dir=temp_dir)
+            with pytest.raises(ConfigurationError, match="EMAIL_HOST"):
+                config_manager.notifications
+
+    def test_encoding_backend_from_env(self, monkeypatch):
+        """Prueba selección del detector de encoding desde variables de entorno"""
+        with tempfile.TemporaryDirectory() as temp_dir:
+            monkeypatch.delenv("ENCODING_BACKEND", raising=False)
+            assert ConfigManager(config_dir=temp_dir).processing.encoding_backend == (
+                "auto"
+            )
+
+            monkeypatch.setenv("ENCODING_BACKEND", "uchardet")
+            with pytest.raises(ConfigurationError):
+                ConfigManager(config_dir=temp_dir).validate()
+
     def test_path_config_attributes(self):
         """Prueba atributos de PathConfig"""
         with tempfile.TemporaryDirectory() as temp_dir:
@@ -131,6 +199,20 @@ class TestConfigManager:
             # Verificar que contiene las secciones principales
             assert "processing" in summary or "paths" in summary
 
+    def test_config_summary_cached_until_update(self):
+        """Prueba que el resumen se reutilice hasta actualizar la configuración"""
+        with tempfile.TemporaryDirectory() as temp_dir:
+            config_manager = ConfigManager(config_dir=temp_dir)
+
+            summary = config_manager.get_config_summary()
+            assert config_manager.get_config_summary() is summary
+
+            config_manager.update_config("processing", "batch_size", 500)
+            updated_summary = config_manager.get_config_summary()
+
+            assert updated_summary is not summary
+            assert updated_summary["processing"]["batch_size"] == 500
+
     def test_update_config(self):
         """Prueba el método update_config"""
         with tempfile.TemporaryDirectory() as temp_dir:
@@ -157,6 +239,83 @@ class TestConfigManager:
             # Verificar que tiene claves esperadas por defecto
             assert len(config_manager.processing_rules) > 0
 
+    def test_processing_rules_cache(self):
+        """Prueba que las reglas se cachean y el caché se invalida al cambiar el JSON"""
+        with tempfile.TemporaryDirectory() as temp_dir:
+            rules_file = Path(temp_dir) / "processing_rules.json"
+            rules_file.write_text(json.dumps({"output_rules": {"version": 1}}))
+
+            first = ConfigManager(config_dir=temp_dir)
+            assert first.processing_rules == {"output_rules": {"version": 1}}
+            # Las reglas solo se leen del JSON: no se escribe caché en disco
+            assert [p.name for p in Path(temp_dir).iterdir()] == [
+                "processing_rules.json"
+            ]
+
+            # Las instancias no comparten el mismo diccionario
+            first.processing_rules["output_rules"]["version"] = 99
+            second = ConfigManager(config_dir=temp_dir)
+            assert second.processing_rules == {"output_rules": {"version": 1}}
+
+            # Con el JSON sin cambios no se vuelve a leer ni a parsear
+            with patch("builtins.open", side_effect=AssertionError("releído")), patch(
+                "src.config_manager.orjson", None
+            ), patch("json.loads", side_effect=AssertionError("reparseado")):
+                cached = ConfigManager(config_dir=temp_dir)
+                assert cached.processing_rules == {"output_rules": {"version": 1}}
+
+            rules_file.write_text(json.dumps({"output_rules": {"version": 22}}))
+            third = ConfigManager(config_dir=temp_dir)
+            assert third.processing_rules == {"output_rules": {"version": 22}}
+
+    def test_get_cached_reuses_instance(self, monkeypatch):
+        """Prueba que get_cached reutiliza la instancia hasta que cambia el entorno"""
+        with tempfile.TemporaryDirectory() as temp_dir:
+            first = ConfigManager.get_cached(config_dir=temp_dir)
+            assert ConfigManager.get_cached(config_dir=temp_dir) is first
+
+            monkeypatch.setenv("BATCH_SIZE", "250")
+            changed = ConfigManager.get_cached(config_dir=temp_dir)
+            assert changed is not first
+            assert changed.processing.batch_size == 250
+
+    def test_get_cached_with_env_file(self, monkeypatch):
+        """Prueba que get_cached reutiliza la instancia aunque exista un .env"""
+        # Registrar BATCH_SIZE para que monkeypatch lo elimine al terminar
+        monkeypatch.setenv("BATCH_SIZE", "1")
+        monkeypatch.delenv("BATCH_SIZE")
+
+        with tempfile.TemporaryDirectory() as temp_dir:
+            env_file = Path(temp_dir) / "test.env"
+            env_file.write_text("BATCH_SIZE=321\n")
+
+            first = ConfigManager.get_cached(str(env_file), temp_dir)
+            assert first.processing.batch_size == 321
+            assert ConfigManager.get_cached(str(env_file), temp_dir) is first
+
+    def test_get_cached_is_bounded(self, monkeypatch):
+        """Prueba que get_cached conserva un número limitado de instancias"""
+        monkeypatch.setattr(ConfigManager, "_INSTANCE_CACHE", OrderedDict())
+        with tempfile.TemporaryDirectory() as temp_dir:
+            for i in range(ConfigManager._INSTANCE_CACHE_SIZE + 3):
+                monkeypatch.setenv("BATCH_SIZE", str(100 + i))
+                ConfigManager.get_cached(config_dir=temp_dir)
+
+            assert (
+                len(ConfigManager._INSTANCE_CACHE) == ConfigManager._INSTANCE_CACHE_SIZE
+            )
+
+    def test_rule_lookup_by_dotted_path(self):
+        """Prueba la consulta de reglas por ruta punteada"""
+        with tempfile.TemporaryDirectory() as temp_dir:
+            config_manager = ConfigManager(config_dir=temp_dir)
+
+            assert (
+                config_manager.rule("processing_rules.cleaning_rules.remove_duplicates")
+                is True
+            )
+            assert config_manager.rule("processing_rules.no_existe", 42) == 42
+
     def test_directories_created(self):
         """Prueba que los directorios se crean correctamente"""
         with tempfile.TemporaryDirectory() as temp_dir:
@@ -198,17 +357,16 @@ class TestPathConfig:
         assert config.temp_directory == Path("data/temp")
         assert config.log_directory == Path("logs")
 
-    def test_path_config_post_init(self):
-        """Prueba el método __post_init__ de PathConfig"""
-        # Crear con Path personalizada
-        config = PathConfig()
-        config.input_directory = Path("test/input")
-        config.__post_init__()
+    def test_path_config_frozen(self):
+        """Prueba que PathConfig es inmutable"""
+        config = PathConfig(input_directory=Path("test/input"))
 
-        # Verificar que sigue siendo Path
         assert isinstance(config.input_directory, Path)
         assert str(config.input_directory) == "test/input"
 
+        with pytest.raises(FrozenInstanceError):
+            config.input_directory = Path("otro/input")
+
 
 class TestValidationConfig:
     """Pruebas específicas para ValidationConfig"""
@@ -13,6 +13,8 @@ Proyecto: Data + Automation Engineer Journey - Semana 3
 
 import pytest
 import tempfile
+import json
+import numpy as np
 import pandas as pd
 from pathlib import Path
 import os
@@ -20,7 +22,8 @@ import sys
 
 sys.path.insert(0, str(Path(__file__).parent.parent))
 
-from src.csv_processor import CSVProcessor, ProcessingStats, CSVMetadata
+import src.csv_processor as csv_processor_module
+from src.csv_processor import CSVProcessor, ProcessingStats, CSVMetadata, ResolvedRules
 from src.config_manager import ConfigManager
 
 
@@ -59,6 +62,163 @@ class TestCSVProcessor:
             assert isinstance(metadata, CSVMetadata)
             assert output_path.exists()
 
+    @pytest.mark.parametrize("suffix", [".parquet", ".feather"])
+    def test_process_file_columnar_output(self, sample_csv_file, suffix):
+        """Prueba guardado en formatos columnares de Arrow"""
+        pytest.importorskip("pyarrow")
+
+        with tempfile.TemporaryDirectory() as temp_dir:
+            config_manager = ConfigManager(config_dir=temp_dir)
+            processor = CSVProcessor(config_manager)
+
+            output_path = Path(temp_dir) / f"output{suffix}"
+            result_df, _, _ = processor.process_file(
+                input_path=sample_csv_file, output_path=output_path, profile="default"
+            )
+
+            reader = pd.read_parquet if suffix == ".parquet" else pd.read_feather
+            saved_df = reader(output_path)
+
+            assert output_path.exists()
+            assert len(saved_df) == len(result_df)
+            assert list(saved_df.columns) == list(result_df.columns)
+
+    def test_save_as_csv_arrow_engine(self, sample_csv_file):
+        """Prueba guardado de CSV con el escritor de PyArrow"""
+        pytest.importorskip("pyarrow")
+
+        with tempfile.TemporaryDirectory() as temp_dir:
+            processor = CSVProcessor(ConfigManager(config_dir=temp_dir))
+            processor.output_rules = {"formats": {"csv": {"engine": "arrow"}}}
+
+            output_path = Path(temp_dir) / "output.csv"
+            result_df, _, _ = processor.process_file(
+                input_path=sample_csv_file, output_path=output_path
+            )
+
+            saved_df = pd.read_csv(output_path)
+            assert list(saved_df.columns) == list(result_df.columns)
+            assert saved_df["nombre"].tolist() == result_df["nombre"].tolist()
+
+    def test_unknown_suffix_defaults_to_parquet(self, sample_csv_file):
+        """Prueba que una extensión no reconocida se guarda como Parquet"""
+        pytest.importorskip("pyarrow")
+
+        with tempfile.TemporaryDirectory() as temp_dir:
+            processor = CSVProcessor(ConfigManager(config_dir=temp_dir))
+            result_df, _, _ = processor.process_file(
+                input_path=sample_csv_file, output_path=Path(temp_dir) / "output.dat"
+            )
+
+            saved_df = pd.read_parquet(Path(temp_dir) / "output.parquet")
+            assert len(saved_df) == len(result_df)
+
+    def test_save_as_json_in_chunks(self, monkeypatch):
+        """Prueba que el JSON por bloques es idéntico al de to_json"""
+        monkeypatch.setenv("BATCH_SIZE", "2")
+        df = pd.DataFrame(
+            {
+                "id": [1, 2, 3, 4, 5],
+                "nombre": ["Ana", "Juan", None, "María", "Luis"],
+                "fecha": pd.date_range("2024-01-01", periods=5),
+            }
+        )
+
+        with tempfile.TemporaryDirectory() as temp_dir:
+            processor = CSVProcessor(ConfigManager(config_dir=temp_dir))
+            output_path = Path(temp_dir) / "output.json"
+            expected_path = Path(temp_dir) / "expected.json"
+
+            processor._save_as_json(df, output_path)
+            df.to_json(expected_path, orient="records", indent=2, date_format="iso")
+
+            assert output_path.read_bytes() == expected_path.read_bytes()
+
+    def test_arrow_engine_falls_back_to_pandas(self, monkeypatch):
+        """Prueba que el motor arrow recurre a pandas con filas irregulares"""
+        pytest.importorskip("pyarrow")
+        monkeypatch.setenv("CSV_ENGINE", "arrow")
+
+        with tempfile.TemporaryDirectory() as temp_dir:
+            input_path = Path(temp_dir) / "irregular.csv"
+            input_path.write_text("id,nombre,edad\n1,Ana,25\n2,Juan\n3,María,35\n")
+
+            config_manager = ConfigManager(config_dir=temp_dir)
+            processor = CSVProcessor(config_manager)
+            result_df, stats, _ = processor.process_file(input_path=input_path)
+
+            assert stats.original_rows == 3
+            assert list(result_df.columns) == ["id", "nombre", "edad"]
+
+    @pytest.mark.parametrize("engine", ["pandas", "arrow"])
+    def test_pyarrow_dtype_backend(self, monkeypatch, engine):
+        """Prueba el pipeline con columnas respaldadas por Arrow"""
+        pytest.importorskip("pyarrow")
+        monkeypatch.setenv("CSV_ENGINE", engine)
+        monkeypatch.setenv("DTYPE_BACKEND", "pyarrow")
+
+        with tempfile.TemporaryDirectory() as temp_dir:
+            input_path = Path(temp_dir) / "arrow.csv"
+            input_path.write_text(
+                "id,nombre,activo,monto\n1, Ana ,yes,10.5\n2,Juan,no,\n3,,1,7\n"
+            )
+
+            config_manager = ConfigManager(config_dir=temp_dir)
+            processor = CSVProcessor(config_manager)
+            result_df, stats, _ = processor.process_file(input_path=input_path)
+
+            assert isinstance(result_df["nombre"].dtype, pd.ArrowDtype)
+            assert result_df["nombre"].tolist() == ["Ana", "Juan", "Ana"]
+            assert result_df["activo"].tolist() == [True, False, True]
+            assert result_df["monto"].tolist() == [10.5, 8.75, 7.0]
+            assert stats.missing_values_filled == 2
+
+    @pytest.mark.parametrize("engine", ["pandas", "arrow"])
+    def test_large_file_load_matches_small(self, monkeypatch, engine):
+        """Prueba que tipos y columnas no dependan del tamaño del archivo"""
+        if engine == "arrow":
+            pytest.importorskip("pyarrow")
+        monkeypatch.setenv("CSV_ENGINE", engine)
+
+        with tempfile.TemporaryDirectory() as temp_dir:
+            input_path = Path(temp_dir) / "sin_encabezado.csv"
+            input_path.write_text("1,Ana,10.5\n2,NULL,\n3,Luis,7\n")
+
+            config_manager = ConfigManager(config_dir=temp_dir)
+            processor = CSVProcessor(config_manager)
+            metadata = processor.analyze_file(input_path)
+            metadata.has_header = False
+
+            small = processor._load_csv(input_path, metadata)
+            monkeypatch.setattr(csv_processor_module, "_LARGE_FILE_MB", -1)
+            large = processor._load_csv(input_path, metadata)
+
+            assert list(large.columns) == list(small.columns)
+            assert large.dtypes.equals(small.dtypes)
+            assert large.isna().sum().sum() == small.isna().sum().sum() == 2
+            if engine == "pandas":
+                assert list(large.columns) == [0, 1, 2]
+                assert large[1].dtype == object
+
+    @pytest.mark.parametrize(
+        "content, expected",
+        [
+            ("\ufeffid,nombre\n1,Ana\n".encode("utf-8"), "utf-8-sig"),
+            ("id,nombre\n1,Ana\n".encode("utf-16"), "utf-16"),
+            # Carácter no ASCII más allá de los primeros 10KB
+            (("id,nombre\n" + "1,Ana\n" * 3000 + "2,Muñoz\n").encode("utf-8"), "utf-8"),
+        ],
+    )
+    def test_detect_encoding(self, content, expected):
+        """Prueba detección de encoding por BOM y por contenido"""
+        with tempfile.TemporaryDirectory() as temp_dir:
+            input_path = Path(temp_dir) / "datos.csv"
+            input_path.write_bytes(content)
+
+            processor = CSVProcessor(ConfigManager(config_dir=temp_dir))
+
+            assert processor._detect_encoding(input_path).lower() == expected
+
     def test_process_file_without_output(self, sample_csv_file):
         """Prueba procesamiento sin archivo de salida"""
         with tempfile.TemporaryDirectory() as temp_dir:
@@ -75,6 +235,43 @@ class TestCSVProcessor:
             assert isinstance(stats, ProcessingStats)
             assert isinstance(metadata, CSVMetadata)
 
+    def test_unknown_suffix_reports_written_path(self, sample_csv_file):
+        """Prueba que se reporte la ruta realmente escrita al cambiar de formato"""
+        pytest.importorskip("pyarrow")
+        with tempfile.TemporaryDirectory() as temp_dir:
+            processor = CSVProcessor(ConfigManager(config_dir=temp_dir))
+            requested = Path(temp_dir) / "salida.dat"
+
+            _, _, metadata = processor.process_file(
+                input_path=sample_csv_file, output_path=requested
+            )
+
+            written = Path(metadata.output_path)
+            assert written == requested.with_suffix(".parquet")
+            assert written.exists()
+            assert not requested.exists()
+
+    def test_unknown_suffix_warns_with_substituted_path(self, sample_csv_file, caplog):
+        """Prueba que se avise de la ruta sustituida para una extensión desconocida"""
+        pytest.importorskip("pyarrow")
+        with tempfile.TemporaryDirectory() as temp_dir:
+            processor = CSVProcessor(ConfigManager(config_dir=temp_dir))
+            requested = Path(temp_dir) / "out.txt"
+
+            with caplog.at_level("WARNING", logger="src.csv_processor"):
+                _, _, metadata = processor.process_file(
+                    input_path=sample_csv_file, output_path=requested
+                )
+
+            written = requested.with_suffix(".parquet")
+            assert metadata.output_path == str(written)
+            assert any(
+                record.levelname == "WARNING"
+                and str(requested) in record.getMessage()
+                and str(written) in record.getMessage()
+                for record in caplog.records
+            )
+
     def test_processing_stats_attributes(self, sample_csv_file):
         """Prueba atributos de ProcessingStats"""
         with tempfile.TemporaryDirectory() as temp_dir:
@@ -231,6 +428,60 @@ class TestCSVMetadata:
         assert "column_names" in metadata_dict
         assert "data_types" in metadata_dict
 
+    @pytest.mark.parametrize("use_orjson", [True, False])
+    def test_save_metadata_with_path_and_timestamp(self, monkeypatch, use_orjson):
+        """Prueba que se guarden metadatos con Path, Timestamp y tipos numpy"""
+        if use_orjson:
+            pytest.importorskip("orjson")
+        else:
+            monkeypatch.setattr(csv_processor_module, "orjson", None)
+
+        with tempfile.TemporaryDirectory() as temp_dir:
+            processor = CSVProcessor(ConfigManager(config_dir=temp_dir))
+            metadata = CSVMetadata(
+                filename=Path(temp_dir) / "datos.csv",
+                file_size_mb=np.float64(1.5),
+                processing_timestamp=pd.Timestamp("2025-10-01 12:30:00"),
+            )
+            stats = ProcessingStats(original_rows=np.int64(10), final_rows=8)
+            output_path = Path(temp_dir) / "salida.csv"
+
+            processor._save_metadata(output_path, metadata, stats)
+
+            saved = json.loads(
+                output_path.with_suffix(".metadata.json").read_text("utf-8")
+            )
+            assert saved["metadata"]["filename"] == str(Path(temp_dir) / "datos.csv")
+            assert saved["metadata"]["processing_timestamp"] == "2025-10-01T12:30:00"
+            assert saved["statistics"]["original_rows"] == 10
+
+
+class TestResolvedRules:
+    """Pruebas específicas para ResolvedRules"""
+
+    def test_resolved_rules_defaults(self):
+        """Prueba valores por defecto con reglas vacías"""
+        assert ResolvedRules.from_processing_rules({}) == ResolvedRules()
+
+    def test_resolved_rules_from_nested_rules(self):
+        """Prueba resolución de reglas anidadas"""
+        rules = ResolvedRules.from_processing_rules(
+            {
+                "cleaning_rules": {
+                    "remove_duplicates": False,
+                    "handle_missing_values": {"strategy": "none"},
+                    "text_cleaning": {"normalize_case": True},
+                },
+                "validation_rules": {"min_rows": 10},
+            }
+        )
+
+        assert rules.remove_duplicates is False
+        assert rules.missing_strategy == "none"
+        assert rules.normalize_case is True
+        assert rules.strip_whitespace is True
+        assert rules.min_rows == 10
+
 
 @pytest.fixture
 def sample_csv_file():
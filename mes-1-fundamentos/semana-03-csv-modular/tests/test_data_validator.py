@@ -20,6 +20,7 @@ import sys
 sys.path.insert(0, str(Path(__file__).parent.parent))
 
 from src.data_validator import (
+    ChunkValidationState,
     DataValidator,
     ValidationRule,
     ValidationResult,
@@ -159,6 +160,28 @@ class TestDataValidator:
         report = validator.validate_dataframe(sample_dataframe)
 
         assert isinstance(report, ValidationReport)
+        assert report.results[0].passed
+
+    def test_custom_validator_row_mask(self, sample_dataframe):
+        """Prueba validador personalizado que devuelve una máscara por fila"""
+        validator = DataValidator()
+        validator.add_custom_validator("adult", lambda value, **kwargs: value >= 30)
+        validator.add_validation_rule(
+            ValidationRule(
+                name="edad_adulta",
+                description="Edad mínima de 30",
+                validation_type=ValidationType.CUSTOM_RULE,
+                level=ValidationLevel.WARNING,
+                column="edad",
+                parameters={"function_name": "adult"},
+            )
+        )
+
+        report = validator.validate_dataframe(sample_dataframe)
+        expected = sample_dataframe.index[sample_dataframe["edad"] < 30].tolist()
+
+        assert report.results[0].affected_rows == expected
+        assert report.results[0].passed == (not expected)
 
 
 class TestValidationRule:
@@ -337,6 +360,47 @@ class TestValidationTypes:
 
         assert len(report.results) == 1
 
+    def test_pattern_validation(self, sample_dataframe_with_issues):
+        """Prueba validación de patrones con regex compilado en caché"""
+        validator = DataValidator()
+
+        pattern_rule = ValidationRule(
+            name="email_format",
+            description="Email debe tener formato válido",
+            validation_type=ValidationType.PATTERN_CHECK,
+            level=ValidationLevel.WARNING,
+            column="email",
+            parameters={"pattern": r"^[^@\s]+@[^@\s]+\.\w+$"},
+        )
+
+        validator.add_validation_rule(pattern_rule)
+        report = validator.validate_dataframe(sample_dataframe_with_issues)
+        validator.validate_dataframe(sample_dataframe_with_issues)
+
+        assert report.results[0].affected_rows == [1, 3, 4]
+        assert list(validator._pattern_cache) == [pattern_rule.parameters["pattern"]]
+
+    @pytest.mark.parametrize("dtype", ["object", "string", "string[pyarrow]"])
+    def test_pattern_validation_by_dtype(self, dtype):
+        """Prueba validación de patrones sobre columnas de texto nativas"""
+        emails = pd.Series(["a@b.com", "invalido", None, "c@d.org"], dtype=dtype)
+        df = pd.DataFrame({"email": emails})
+
+        validator = DataValidator()
+        validator.add_validation_rule(
+            ValidationRule(
+                name="email_format",
+                description="Email debe tener formato válido",
+                validation_type=ValidationType.PATTERN_CHECK,
+                level=ValidationLevel.WARNING,
+                column="email",
+                parameters={"pattern": r"^[^@\s]+@[^@\s]+\.\w+$"},
+            )
+        )
+        report = validator.validate_dataframe(df)
+
+        assert report.results[0].affected_rows == [1, 2]
+
     def test_null_validation(self, sample_dataframe_with_nulls):
         """Prueba validación de valores nulos"""
         validator = DataValidator()
@@ -356,6 +420,56 @@ class TestValidationTypes:
 
         assert len(report.results) == 1
 
+    @pytest.mark.parametrize(
+        "dtype",
+        ["int64", "float64", "Int64", "object", "datetime64[ns]", "string[pyarrow]"],
+    )
+    def test_null_count_by_dtype(self, dtype):
+        """Prueba el conteo de nulos con distintos tipos de columna"""
+        values = [1, 2, 3] if dtype == "int64" else [1, None, 3]
+        df = pd.DataFrame({"valor": pd.Series(values, dtype=dtype)})
+
+        validator = DataValidator()
+        validator.add_validation_rule(
+            ValidationRule(
+                name="valor_nulls",
+                description="Conteo de nulos",
+                validation_type=ValidationType.NULL_CHECK,
+                level=ValidationLevel.WARNING,
+                column="valor",
+            )
+        )
+        report = validator.validate_dataframe(df)
+
+        expected = 0 if dtype == "int64" else 1
+        assert report.results[0].details["null_count"] == expected
+
+    @pytest.mark.parametrize("method,threshold", [("iqr", 1.5), ("zscore", 2.0)])
+    def test_outlier_check(self, method, threshold):
+        """Prueba la detección de outliers con etiquetas del índice original"""
+        values = [10.0, 11.0, 9.0, 10.5, 9.5, 10.0, None, 11.0, 9.0, 100.0]
+        df = pd.DataFrame({"valor": values}, index=range(100, 110))
+
+        validator = DataValidator()
+        validator.add_validation_rule(
+            ValidationRule(
+                name="valor_outliers",
+                description="Outliers en valor",
+                validation_type=ValidationType.STATISTICAL,
+                level=ValidationLevel.WARNING,
+                column="valor",
+                parameters={
+                    "check_type": "outliers",
+                    "method": method,
+                    "threshold": threshold,
+                },
+            )
+        )
+        report = validator.validate_dataframe(df)
+
+        assert report.results[0].affected_rows == [109]
+        assert report.results[0].details["outlier_count"] == 1
+
     def test_unique_validation(self, sample_dataframe_with_duplicates):
         """Prueba validación de unicidad"""
         validator = DataValidator()
@@ -375,6 +489,221 @@ class TestValidationTypes:
 
         assert len(report.results) == 1
 
+    def test_affected_rows_are_capped(self):
+        """Prueba que las filas afectadas se limiten sin perder el total"""
+        df = pd.DataFrame({"valor": range(50)})
+        validator = DataValidator()
+        validator.max_affected_rows = 10
+        validator.add_validation_rule(
+            ValidationRule(
+                name="valor_max",
+                description="Valor máximo de 9",
+                validation_type=ValidationType.RANGE_CHECK,
+                level=ValidationLevel.WARNING,
+                column="valor",
+                parameters={"max": 9},
+            )
+        )
+
+        result = validator.validate_dataframe(df).results[0]
+        state = ChunkValidationState()
+        validator.validate_chunk(df.iloc[:30], state)
+        validator.validate_chunk(df.iloc[30:], state)
+        chunked = validator.finalize(state).results[0]
+
+        assert result.affected_rows == list(range(10, 20))
+        assert result.details["total_violations"] == 40
+        assert chunked.affected_rows == list(range(10, 20))
+        assert chunked.details["total_violations"] == 40
+
+
+class TestChunkValidation:
+    """Pruebas para la validación por bloques"""
+
+    def test_chunked_report_matches_total_rows(self, sample_dataframe):
+        """Prueba que el reporte acumule filas y columnas de todos los bloques"""
+        validator = DataValidator()
+        validator.set_schema({"id": "int", "nombre": "str"})
+
+        state = ChunkValidationState()
+        validator.validate_chunk(sample_dataframe.iloc[:2], state)
+        validator.validate_chunk(sample_dataframe.iloc[2:], state)
+        report = validator.finalize(state)
+
+        assert report.summary["total_rows"] == 5
+        assert report.summary["total_columns"] == 4
+        assert report.total_rules == 2
+
+    def test_rule_failing_in_later_chunk_fails_report(self, sample_dataframe):
+        """Prueba que una regla que falla en cualquier bloque falle en el reporte"""
+        validator = DataValidator()
+        validator.add_validation_rule(
+            ValidationRule(
+                name="age_range",
+                description="Edad debe estar entre 18 y 40",
+                validation_type=ValidationType.RANGE_CHECK,
+                level=ValidationLevel.ERROR,
+                column="edad",
+                parameters={"min": 18, "max": 40},
+            )
+        )
+
+        state = ChunkValidationState()
+        validator.validate_chunk(sample_dataframe.iloc[:3], state)
+        validator.validate_chunk(sample_dataframe.iloc[3:], state)
+        report = validator.finalize(state)
+
+        assert report.errors == 1
+        assert not report.is_valid
+
+    def test_null_percentage_uses_whole_file(self):
+        """Prueba que el porcentaje de nulos no dependa del tamaño de bloque"""
+        df = pd.DataFrame({"valor": [None, None, 1, 2, 3, 4, 5, 6, 7, 8]})
+        validator = DataValidator()
+        validator.add_validation_rule(
+            ValidationRule(
+                name="valor_nulls",
+                description="Máximo 30% de nulos",
+                validation_type=ValidationType.NULL_CHECK,
+                level=ValidationLevel.ERROR,
+                column="valor",
+                parameters={"max_null_percentage": 30},
+            )
+        )
+
+        whole = validator.validate_dataframe(df).results[0]
+        state = ChunkValidationState()
+        for start in range(0, len(df), 4):
+            validator.validate_chunk(df.iloc[start : start + 4], state)
+        chunked = validator.finalize(state).results[0]
+
+        assert whole.passed and chunked.passed
+        assert chunked.details == whole.details
+
+    def test_merged_violations_update_message(self):
+        """Prueba que el mensaje refleje las infracciones de todos los bloques"""
+        df = pd.DataFrame({"valor": [50, 1, 60, 2, 70, 80]})
+        validator = DataValidator()
+        validator.add_validation_rule(
+            ValidationRule(
+                name="valor_max",
+                description="Valor máximo de 10",
+                validation_type=ValidationType.RANGE_CHECK,
+                level=ValidationLevel.WARNING,
+                column="valor",
+                parameters={"max": 10},
+            )
+        )
+
+        whole = validator.validate_dataframe(df).results[0]
+        state = ChunkValidationState()
+        validator.validate_chunk(df.iloc[:3], state)
+        validator.validate_chunk(df.iloc[3:], state)
+        report = validator.finalize(state)
+        chunked = report.results[0]
+
+        assert chunked.message == whole.message
+        assert chunked.details["violations"] == 4
+        assert chunked.affected_rows == [0, 2, 4, 5]
+        assert report.summary["per_chunk_rules"] == []
+
+    def test_per_chunk_rules_are_reported(self, sample_dataframe):
+        """Prueba que las reglas no combinables se marquen como evaluadas por bloques"""
+        validator = DataValidator()
+        validator.add_validation_rule(
+            ValidationRule(
+                name="salario_outliers",
+                description="Outliers en salario",
+                validation_type=ValidationType.STATISTICAL,
+                level=ValidationLevel.WARNING,
+                column="salario",
+                parameters={"check_type": "outliers"},
+            )
+        )
+
+        state = ChunkValidationState()
+        validator.validate_chunk(sample_dataframe.iloc[:3], state)
+        validator.validate_chunk(sample_dataframe.iloc[3:], state)
+        report = validator.finalize(state)
+
+        assert report.summary["per_chunk_rules"] == ["salario_outliers"]
+        assert report.results[0].details["per_chunk"] is True
+
+    def test_outliers_are_not_summed_across_chunks(self):
+        """Prueba que el resultado de outliers por bloques sea coherente"""
+        df = pd.DataFrame({"valor": [10, 11, 12, 13, 100, 10, 11, 12, 13, 200]})
+        validator = DataValidator()
+        validator.add_validation_rule(
+            ValidationRule(
+                name="valor_outliers",
+                description="Outliers en valor",
+                validation_type=ValidationType.STATISTICAL,
+                level=ValidationLevel.WARNING,
+                column="valor",
+                parameters={"check_type": "outliers"},
+            )
+        )
+
+        first = validator.validate_dataframe(df.iloc[:5]).results[0]
+        state = ChunkValidationState()
+        validator.validate_chunk(df.iloc[:5], state)
+        validator.validate_chunk(df.iloc[5:], state)
+        chunked = validator.finalize(state).results[0]
+
+        # Se conserva el primer bloque que falla, sin mezclar conteos
+        assert not chunked.passed
+        assert chunked.details["total_violations"] == 1
+        assert chunked.details["outlier_count"] == 1
+        assert chunked.details["outlier_percentage"] == 20.0
+        assert chunked.message == first.message
+        assert chunked.affected_rows == [4]
+
+    def test_unique_check_across_chunks(self, sample_dataframe):
+        """Prueba que la unicidad se verifique entre bloques distintos"""
+        validator = DataValidator()
+        validator.add_validation_rule(
+            ValidationRule(
+                name="id_unique",
+                description="ID debe ser único",
+                validation_type=ValidationType.UNIQUE_CHECK,
+                level=ValidationLevel.ERROR,
+                column="id",
+            )
+        )
+
+        state = ChunkValidationState()
+        validator.validate_chunk(sample_dataframe.iloc[:3], state)
+        validator.validate_chunk(sample_dataframe.iloc[:2], state)
+        report = validator.finalize(state)
+
+        assert report.results[0].details["duplicate_count"] == 2
+        assert not report.is_valid
+
+    def test_unique_check_counts_repeated_nulls(self):
+        """Prueba que los nulos repetidos cuenten como duplicados en ambos caminos"""
+        df = pd.DataFrame({"id": [1, None, 2, None, 2, None]})
+        validator = DataValidator()
+        validator.add_validation_rule(
+            ValidationRule(
+                name="id_unique",
+                description="ID debe ser único",
+                validation_type=ValidationType.UNIQUE_CHECK,
+                level=ValidationLevel.ERROR,
+                column="id",
+            )
+        )
+
+        whole = validator.validate_dataframe(df).results[0]
+        state = ChunkValidationState()
+        validator.validate_chunk(df.iloc[:3], state)
+        validator.validate_chunk(df.iloc[3:], state)
+        chunked = validator.finalize(state).results[0]
+
+        # Un duplicado del 2 y dos nulos repetidos; los nulos no son valor único
+        expected = {"duplicate_count": 3, "unique_count": 2}
+        assert whole.details == expected
+        assert chunked.details == expected
+
 
 @pytest.fixture
 def sample_dataframe():
@@ -34,6 +34,9 @@ from src.utils import (
     clean_column_name,
     detect_delimiter,
     detect_encoding,
+    read_csv_arrow,
+    read_csv_polars,
+    iter_csv_chunks,
     validate_file_path,
     format_bytes,
     format_duration,
@@ -125,6 +128,96 @@ class TestDataUtilities:
         assert isinstance(encoding, str)
         assert encoding in ["utf-8", "latin-1", "ascii", "cp1252"]
 
+    @pytest.mark.parametrize("streaming", [False, True])
+    def test_read_csv_arrow(self, sample_csv_file, streaming):
+        """Prueba lectura de CSV con PyArrow"""
+        pytest.importorskip("pyarrow")
+
+        df = read_csv_arrow(sample_csv_file, streaming=streaming)
+
+        assert len(df) == 5
+        assert list(df.columns) == ["id", "nombre", "edad", "salario"]
+        assert df["nombre"].tolist()[1] == "Juan"
+
+    def test_read_csv_polars(self, sample_csv_file):
+        """Prueba lectura de CSV con Polars"""
+        pytest.importorskip("polars")
+        pytest.importorskip("pyarrow")
+
+        df = read_csv_polars(sample_csv_file)
+
+        assert len(df) == 5
+        assert list(df.columns) == ["id", "nombre", "edad", "salario"]
+
+        with pytest.raises(ValueError):
+            read_csv_polars(sample_csv_file, encoding="latin-1")
+
+    @pytest.mark.parametrize("engine", ["pandas", "arrow"])
+    @pytest.mark.parametrize("memory_map", [False, True])
+    def test_iter_csv_chunks(self, sample_csv_file, engine, memory_map):
+        """Prueba lectura por bloques con índice continuo"""
+        if engine == "arrow":
+            pytest.importorskip("pyarrow")
+
+        chunks = list(
+            iter_csv_chunks(
+                sample_csv_file, chunksize=2, engine=engine, memory_map=memory_map
+            )
+        )
+        df = pd.concat(chunks)
+
+        assert len(df) == 5
+        assert df.index.tolist() == [0, 1, 2, 3, 4]
+
+    def test_iter_csv_chunks_arrow_type_change(self, tmp_path):
+        """Prueba que un cambio de tipo tras el primer lote continúe con pandas"""
+        pytest.importorskip("pyarrow")
+        csv_file = tmp_path / "cambio_tipo.csv"
+        rows = [f"{i};José;{i if i < 150 else 'texto'}" for i in range(200)]
+        csv_file.write_text("id;nombre;valor\n" + "\n".join(rows), encoding="latin-1")
+
+        chunks = list(
+            iter_csv_chunks(
+                csv_file,
+                chunksize=40,
+                engine="arrow",
+                encoding="latin-1",
+                delimiter=";",
+                block_size=1024,
+            )
+        )
+        df = pd.concat(chunks)
+
+        assert len(chunks) > 1
+        assert list(df.columns) == ["id", "nombre", "valor"]
+        assert df.index.tolist() == list(range(200))
+        assert df["id"].tolist() == list(range(200))
+        assert (df["nombre"] == "José").all()
+        assert df["valor"].iloc[-1] == "texto"
+
+    def test_iter_csv_chunks_arrow_multiline_before_type_change(self, tmp_path):
+        """Prueba que campos multilínea y líneas vacías no desplacen la reanudación"""
+        pytest.importorskip("pyarrow")
+        csv_file = tmp_path / "multilinea.csv"
+        rows = [
+            f'{i},"nota {i}\ncon salto",{valor}'
+            for i, valor in enumerate([*range(150), *["texto"] * 50])
+        ]
+        # Una línea física que no es un registro antes del cambio de tipo
+        rows.insert(3, "")
+        csv_file.write_text("id,nota,valor\n" + "\n".join(rows), encoding="utf-8")
+
+        chunks = list(
+            iter_csv_chunks(csv_file, chunksize=40, engine="arrow", block_size=1024)
+        )
+        df = pd.concat(chunks)
+
+        assert len(chunks) > 1
+        assert df.index.tolist() == list(range(200))
+        assert df["id"].tolist() == list(range(200))
+        assert df["nota"].iloc[-1] == "nota 199\ncon salto"
+        assert df["valor"].iloc[-1] == "texto"
+
     def test_safe_convert_to_numeric_valid(self):
         """Prueba conversión segura a numérico con valores válidos"""
         assert safe_convert_to_numeric("123") == 123